@@ -5,8 +5,19 @@ set -o errexit
 # Modify this line as needed for your package manager (pip, poetry, etc.)
 pip install -r requirements.txt
 
-# Convert static asset files
+# Bundle, hash and compress static asset files
+python manage.py build_assets
 python manage.py collectstatic --no-input
 
 # Apply any outstanding database migrations
-python manage.py migrate
\ No newline at end of file
+python manage.py migrate
+
+# Create the task partitions of the coming months, if partitioned by deadline.
+# Also run this from a monthly cron job.
+python manage.py partition_tasks extend
+
+# Resume batch deletions interrupted by restarted web workers
+python manage.py batch_delete
+
+# Repair denormalized workload counters
+python manage.py reconcile_counters
\ No newline at end of file
@@ -0,0 +1,27 @@
+import os
+
+# Live task updates (task_manager.events) are only streamed through
+# it_company_task_manager.asgi, so the application is served by uvicorn
+# workers; sync views run in their thread pool. GUNICORN_ASGI=0 falls back
+# to sync WSGI workers, whose pages do not subscribe to live updates.
+if os.environ.get("GUNICORN_ASGI", "1") == "1":
+    wsgi_app = "it_company_task_manager.asgi:application"
+    worker_class = "uvicorn_worker.UvicornWorker"
+else:
+    wsgi_app = "it_company_task_manager.wsgi:application"
+
+workers = int(os.environ.get("WEB_CONCURRENCY", 2))
+
+# Load and warm the application once in the master process; the forked
+# workers share its memory copy-on-write instead of importing it again.
+preload_app = os.environ.get("GUNICORN_PRELOAD", "1") == "1"
+
+
+def when_ready(server):
+    if not server.cfg.preload_app:
+        return
+    from task_manager import warmup
+
+    templates = warmup.warm_up()
+    warmup.freeze()
+    server.log.info("Warmed up %s templates before forking workers", templates)
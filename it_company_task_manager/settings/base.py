@@ -10,18 +10,14 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/6.0/ref/settings/
 """
 
+from importlib.util import find_spec
 from pathlib import Path
 import os
-from dotenv import load_dotenv
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
 SECRET_KEY = os.getenv('SECRET_KEY')
 
-INTERNAL_IPS = [
-    "127.0.0.1",
-]
-
 # Application definition
 
 INSTALLED_APPS = [
@@ -31,7 +27,6 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
-    "debug_toolbar",
     "crispy_forms",
     "crispy_bootstrap5",
     #user apps
@@ -41,11 +36,13 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
-    "debug_toolbar.middleware.DebugToolbarMiddleware",
+    "task_manager.compression.CompressionMiddleware",
+    "task_manager.db_router.ReplicaRoutingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "task_manager.audit.AuditMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -67,10 +64,44 @@ TEMPLATES = [
     },
 ]
 
+# Jinja2 is optional. Its templates in jinja2/ mirror the task and worker
+# list and detail pages (see task_manager.jinja2).
+if find_spec("jinja2"):
+    TEMPLATES.append(
+        {
+            "BACKEND": "django.template.backends.jinja2.Jinja2",
+            "DIRS": [BASE_DIR / "jinja2"],
+            "OPTIONS": {
+                "environment": "task_manager.jinja2.environment",
+            },
+        }
+    )
+
+# Engine rendering the task and worker list and detail pages, "django" or
+# "jinja2"
+PAGE_TEMPLATE_ENGINE = "django"
+
+# Directory sharing Jinja2's compiled templates between processes, None
+# keeps them in each process's memory only
+JINJA2_BYTECODE_CACHE_DIR = None
+
 CRISPY_TEMPLATE_PACK = "bootstrap5"
 
 WSGI_APPLICATION = "it_company_task_manager.wsgi.application"
 
+# Read replicas (see task_manager.db_router)
+DATABASE_ROUTERS = ["task_manager.db_router.ReplicaRouter"]
+
+DATABASE_REPLICAS = []
+
+REPLICA_MAX_LAG = 2.0
+
+REPLICA_LAG_CHECK_INTERVAL = 5
+
+REPLICA_STICKY_SECONDS = 5
+
+REPLICA_PIN_COOKIE = "db_pin"
+
 
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
@@ -98,6 +129,8 @@ LANGUAGE_CODE = "en-us"
 
 AUTH_USER_MODEL = "task_manager.Worker"
 
+AUTHENTICATION_BACKENDS = ["task_manager.auth.CachedModelBackend"]
+
 LOGIN_REDIRECT_URL = "/"
 
 TIME_ZONE = "UTC"
@@ -116,3 +149,119 @@ STATIC_ROOT = "staticfiles"
 
 STATICFILES_DIRS = (BASE_DIR / "static",)
 
+# Built into static/dist by ``manage.py build_assets``
+ASSET_BUNDLES = {
+    "dist/app.min.css": [
+        "assets/css/material-kit.min.css",
+        "vendor/fontawesome/css/fontawesome.min.css",
+        "vendor/fontawesome/css/solid.min.css",
+        "vendor/fontawesome/css/brands.min.css",
+    ],
+    "dist/app.min.js": [
+        "assets/js/core/popper.min.js",
+        "assets/js/core/bootstrap.min.js",
+        "assets/js/material-kit.min.js",
+    ],
+}
+
+
+# Cascading deletes of task types, positions and workers
+BATCH_DELETE_SIZE = 500
+
+BATCH_DELETE_IN_BACKGROUND = False
+
+# Completed tasks older than this are moved to the archive tables
+TASK_ARCHIVE_AFTER_DAYS = 90
+
+TASK_ARCHIVE_BATCH_SIZE = 500
+
+# Native Postgres partitioning of the task table: None, "state"
+# or "deadline_month" (see task_manager.partitioning)
+TASK_PARTITIONING = None
+
+TASK_PARTITION_MONTHS_AHEAD = 3
+
+TASK_PARTITION_MONTHS_BACK = 12
+
+# Task change history entries written per bulk insert (see task_manager.audit)
+AUDIT_BUFFER_SIZE = 100
+
+# Live task updates over Server-Sent Events (see task_manager.events)
+TASK_EVENTS_CHANNEL = "task_events"
+
+TASK_EVENTS_HEARTBEAT = 15
+
+TASK_EVENTS_QUEUE_SIZE = 100
+
+# Default and maximum length of a worker's "next tasks" queue, and the most
+# workers whose queues one API request returns
+NEXT_TASKS_LIMIT = 5
+
+NEXT_TASKS_MAX_LIMIT = 50
+
+NEXT_TASKS_MAX_WORKERS = 50
+
+# Recurring task occurrences are created this many days ahead, templates
+# are processed in batches (see task_manager.recurrence)
+RECURRING_TASK_HORIZON_DAYS = 14
+
+RECURRING_TASK_BATCH_SIZE = 500
+
+# Cards rendered per kanban column and per "load more" (see task_manager.board)
+BOARD_COLUMN_LIMIT = 20
+
+# Compression of dynamic responses (see task_manager.compression). Smaller
+# responses and types that are already compressed or latency-sensitive are
+# sent as they are. Compressed responses are padded with up to
+# COMPRESSION_MAX_RANDOM_BYTES random bytes against BREACH.
+COMPRESSION_MIN_SIZE = 500
+
+COMPRESSION_MAX_RANDOM_BYTES = 100
+
+COMPRESSION_BROTLI_QUALITY = 4
+
+COMPRESSION_SKIP_TYPES = (
+    "image/",
+    "video/",
+    "audio/",
+    "font/woff",
+    "application/zip",
+    "application/gzip",
+    "application/pdf",
+    "application/octet-stream",
+    "text/event-stream",
+)
+
+# Search-as-you-type results per kind, and the per-process LRU of hot
+# prefixes (see task_manager.typeahead)
+TYPEAHEAD_LIMIT = 10
+
+TYPEAHEAD_CACHE_SIZE = 1000
+
+TYPEAHEAD_CACHE_TTL = 30
+
+# Admin changelists count rows exactly up to this many, larger results use
+# the planner's estimate (see task_manager.pagination)
+COUNT_ESTIMATE_THRESHOLD = 10000
+
+# Seconds calendar apps may reuse a worker's deadline feed before
+# revalidating it (see task_manager.ical)
+CALENDAR_FEED_MAX_AGE = 300
+
+# Sessions and the request's worker are loaded from the cache. Production
+# only enables this with a cache shared by all processes (see prod.py).
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
+
+# Seconds a loaded worker stays cached, 0 disables the cache
+WORKER_CACHE_TIMEOUT = 300
+
+# Bump to drop every cached worker, e.g. after changing its fields
+WORKER_CACHE_VERSION = 3
+
+SESSION_CLEANUP_BATCH_SIZE = 1000
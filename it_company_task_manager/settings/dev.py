@@ -1,9 +1,24 @@
+import os
+
 from .base import *
 
 DEBUG = True
 
 ALLOWED_HOSTS = []
 
+# Development tooling stays out of the production profile.
+INSTALLED_APPS = [*INSTALLED_APPS, "debug_toolbar"]
+
+MIDDLEWARE = [*MIDDLEWARE]
+MIDDLEWARE.insert(
+    MIDDLEWARE.index("task_manager.db_router.ReplicaRoutingMiddleware") + 1,
+    "debug_toolbar.middleware.DebugToolbarMiddleware",
+)
+
+INTERNAL_IPS = [
+    "127.0.0.1",
+]
+
 # Database
 # https://docs.djangoproject.com/en/6.0/ref/settings/#databases
 
@@ -13,3 +28,12 @@ DATABASES = {
         "NAME": BASE_DIR / "db.sqlite3",
     }
 }
+
+# Route replica reads to a second alias of the same SQLite file to try out
+# the read replica router with runserver.
+if os.environ.get("SQLITE_REPLICA"):
+    DATABASES["replica"] = {
+        **DATABASES["default"],
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS = ["replica"]
@@ -23,3 +23,48 @@ DATABASES = {
         "PORT": int(os.environ["POSTGRES_DB_PORT"]),
     }
 }
+
+for number, host in enumerate(
+    filter(None, os.environ.get("POSTGRES_REPLICA_HOSTS", "").split(",")),
+    start=1,
+):
+    DATABASES[f"replica{number}"] = {
+        **DATABASES["default"],
+        "HOST": host.strip(),
+        "TEST": {"MIRROR": "default"},
+    }
+
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias != "default"]
+
+# Hashed file names let WhiteNoise serve static files with immutable cache
+# headers, next to pre-built gzip and brotli variants.
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
+    },
+}
+
+# Per-process caches would serve stale sessions and workers after a logout
+# or password change handled by another worker, so without a shared cache
+# sessions live in signed cookies and workers are loaded from the database.
+if os.environ.get("REDIS_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.environ["REDIS_URL"],
+        }
+    }
+else:
+    SESSION_ENGINE = "django.contrib.sessions.backends.signed_cookies"
+    WORKER_CACHE_TIMEOUT = 0
+
+BATCH_DELETE_IN_BACKGROUND = True
+
+TASK_PARTITIONING = os.environ.get("TASK_PARTITIONING") or None
+
+PAGE_TEMPLATE_ENGINE = os.environ.get("PAGE_TEMPLATE_ENGINE", "django")
+
+JINJA2_BYTECODE_CACHE_DIR = os.environ.get("JINJA2_BYTECODE_CACHE_DIR") or None
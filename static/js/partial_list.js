@@ -0,0 +1,59 @@
+// Swaps in the table and pagination of a list for searches, sorting and
+// page clicks instead of reloading the whole page.
+(function () {
+  var list = document.querySelector("[data-partial-list]");
+  if (!list || !window.fetch || !window.history.pushState) {
+    return;
+  }
+
+  function load(url, push) {
+    list.classList.add("opacity-5");
+    return fetch(url, {credentials: "same-origin", headers: {"X-Partial": "list"}})
+      .then(function (response) {
+        // A redirect, e.g. to the login page once the session expired, is a
+        // whole page rather than the partial: follow it instead of swapping.
+        if (response.redirected) {
+          window.location.href = response.url;
+          return null;
+        }
+        if (!response.ok) {
+          throw new Error(response.statusText);
+        }
+        return response.text();
+      })
+      .then(function (html) {
+        if (html === null) {
+          return;
+        }
+        list.innerHTML = html;
+        list.classList.remove("opacity-5");
+        if (push) {
+          window.history.pushState({partial: true}, "", url);
+        }
+      })
+      .catch(function () {
+        window.location.href = url;
+      });
+  }
+
+  document.querySelectorAll("form[data-partial-form]").forEach(function (form) {
+    form.addEventListener("submit", function (event) {
+      event.preventDefault();
+      var query = new URLSearchParams(new FormData(form)).toString();
+      load(window.location.pathname + (query ? "?" + query : ""), true);
+    });
+  });
+
+  list.addEventListener("click", function (event) {
+    var link = event.target.closest("a[href^='?']");
+    if (!link || event.ctrlKey || event.metaKey || event.shiftKey) {
+      return;
+    }
+    event.preventDefault();
+    load(link.href, true);
+  });
+
+  window.addEventListener("popstate", function () {
+    load(window.location.href, false);
+  });
+})();
@@ -0,0 +1,70 @@
+// Adds tasks to a multiple select from the typeahead endpoint; the select
+// itself only holds the tasks that are already chosen.
+(function () {
+  document.querySelectorAll("select[data-autocomplete]").forEach(function (select) {
+    if (!window.fetch) {
+      return;
+    }
+
+    var input = document.createElement("input");
+    input.type = "text";
+    input.className = "form-control mb-2";
+    input.placeholder = "Type to find a task...";
+    input.setAttribute("autocomplete", "off");
+    var results = document.createElement("div");
+    results.className = "list-group mb-2";
+    select.parentNode.insertBefore(input, select);
+    select.parentNode.insertBefore(results, select);
+
+    var timer = null;
+    var latest = 0;
+
+    function choose(task) {
+      var option = select.querySelector('option[value="' + task.id + '"]');
+      if (!option) {
+        option = new Option(task.name, task.id);
+        select.appendChild(option);
+      }
+      option.selected = true;
+      input.value = "";
+      results.innerHTML = "";
+    }
+
+    function suggest() {
+      var query = input.value.trim();
+      var request = ++latest;
+      if (!query) {
+        results.innerHTML = "";
+        return;
+      }
+      var url = select.dataset.autocomplete + "?kind=tasks&q=" + encodeURIComponent(query);
+      fetch(url, {credentials: "same-origin"})
+        .then(function (response) {
+          return response.json();
+        })
+        .then(function (found) {
+          // Drop answers to keystrokes that were already superseded.
+          if (request !== latest) {
+            return;
+          }
+          results.innerHTML = "";
+          found.tasks.forEach(function (task) {
+            var button = document.createElement("button");
+            button.type = "button";
+            button.className = "list-group-item list-group-item-action text-sm";
+            button.textContent = task.name;
+            button.addEventListener("click", function () {
+              choose(task);
+            });
+            results.appendChild(button);
+          });
+        })
+        .catch(function () {});
+    }
+
+    input.addEventListener("input", function () {
+      clearTimeout(timer);
+      timer = setTimeout(suggest, 100);
+    });
+  });
+})();
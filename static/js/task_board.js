@@ -0,0 +1,28 @@
+// Appends the next cards of a board column when "Load more" is clicked.
+(function () {
+  document.querySelectorAll("[data-board-more]").forEach(function (button) {
+    button.addEventListener("click", function () {
+      var offset = Number(button.dataset.offset);
+      var cards = button.closest("[data-board-column]").querySelector("[data-board-cards]");
+
+      button.disabled = true;
+      fetch(button.dataset.boardMore + "&offset=" + offset, {credentials: "same-origin"})
+        .then(function (response) {
+          return response.text().then(function (html) {
+            return {html: html, count: Number(response.headers.get("X-Board-Count"))};
+          });
+        })
+        .then(function (page) {
+          cards.insertAdjacentHTML("beforeend", page.html);
+          button.dataset.offset = offset + page.count;
+          button.disabled = false;
+          if (!page.count || offset + page.count >= Number(button.dataset.total)) {
+            button.remove();
+          }
+        })
+        .catch(function () {
+          button.disabled = false;
+        });
+    });
+  });
+})();
@@ -0,0 +1,81 @@
+// Patches task rows in place from the live task event stream.
+(function () {
+  var board = document.querySelector("[data-task-events]");
+  if (!board || !window.EventSource) {
+    return;
+  }
+
+  var urgent = ["UR", "HG"];
+  var notice = document.querySelector("[data-task-events-notice]");
+
+  function formatDate(value) {
+    if (!value) {
+      return "";
+    }
+    var date = new Date(value);
+    var pad = function (number) {
+      return String(number).padStart(2, "0");
+    };
+    return pad(date.getDate()) + "." + pad(date.getMonth() + 1) + "." + date.getFullYear();
+  }
+
+  var renderers = {
+    name: function (cell, event) {
+      cell.textContent = event.name;
+    },
+    deadline: function (cell, event) {
+      cell.textContent = formatDate(event.deadline);
+    },
+    is_completed: function (cell, event) {
+      cell.innerHTML = event.is_completed
+        ? '<span class="badge badge-sm bg-gradient-success">Done</span>'
+        : '<span class="badge badge-sm bg-gradient-secondary">In Work</span>';
+    },
+    priority: function (cell, event) {
+      cell.textContent = event.priority_display;
+      cell.className = "text-xs font-weight-bold " +
+        (urgent.indexOf(event.priority) >= 0 ? "text-danger" : "text-info");
+    }
+  };
+
+  function showNotice() {
+    if (notice) {
+      notice.classList.remove("d-none");
+    }
+  }
+
+  new EventSource(board.dataset.taskEvents).addEventListener("task", function (message) {
+    var event = JSON.parse(message.data);
+    var rows = board.querySelectorAll('[data-task-id="' + event.id + '"]');
+
+    if (event.action === "created") {
+      if (!board.querySelector("[data-task-reload]")) {
+        showNotice();
+      }
+      return;
+    }
+    rows.forEach(function (row) {
+      if (row.hasAttribute("data-task-reload")) {
+        showNotice();
+      }
+      if (event.action === "deleted" || event.action === "archived") {
+        row.classList.add("opacity-5");
+        row.querySelectorAll("a").forEach(function (link) {
+          link.removeAttribute("href");
+        });
+        return;
+      }
+      if (event.action !== "updated") {
+        return;
+      }
+      Object.keys(renderers).forEach(function (field) {
+        if (!(field in event)) {
+          return;
+        }
+        row.querySelectorAll('[data-field="' + field + '"]').forEach(function (cell) {
+          renderers[field](cell, event);
+        });
+      });
+    });
+  });
+})();
@@ -0,0 +1,55 @@
+// Suggests task names or usernames below a search input while typing.
+(function () {
+  document.querySelectorAll("[data-typeahead]").forEach(function (group, index) {
+    var input = group.querySelector("input[type=text]");
+    if (!input || !window.fetch) {
+      return;
+    }
+
+    var list = document.createElement("datalist");
+    list.id = "typeahead-" + index;
+    group.appendChild(list);
+    input.setAttribute("list", list.id);
+    input.setAttribute("autocomplete", "off");
+
+    var field = group.dataset.typeaheadField;
+    var kind = group.dataset.typeaheadKind;
+    var timer = null;
+    var latest = 0;
+
+    function suggest() {
+      var query = input.value.trim();
+      var request = ++latest;
+      if (!query) {
+        list.innerHTML = "";
+        return;
+      }
+      var url = group.dataset.typeahead + "?kind=" + kind + "&q=" + encodeURIComponent(query);
+      fetch(url, {credentials: "same-origin"})
+        .then(function (response) {
+          return response.json();
+        })
+        .then(function (results) {
+          // Drop answers to keystrokes that were already superseded.
+          if (request !== latest) {
+            return;
+          }
+          list.innerHTML = "";
+          results[kind].forEach(function (result) {
+            var option = document.createElement("option");
+            option.value = result[field];
+            if (result.full_name) {
+              option.label = result.full_name;
+            }
+            list.appendChild(option);
+          });
+        })
+        .catch(function () {});
+    }
+
+    input.addEventListener("input", function () {
+      clearTimeout(timer);
+      timer = setTimeout(suggest, 100);
+    });
+  });
+})();
@@ -1,12 +1,27 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
 
-from task_manager.models import Worker, TaskType, Position, Task
+from task_manager import completion, typeahead
+from task_manager.models import (
+    Position,
+    RecurringTask,
+    Task,
+    TaskType,
+    Worker,
+)
+from task_manager.pagination import EstimatedCountPaginator
 
 
 @admin.register(Worker)
 class WorkerAdmin(UserAdmin):
-    list_display = UserAdmin.list_display + ("position",)
+    list_display = UserAdmin.list_display + ("position", "open_task_count")
+    list_select_related = ("position",)
+    list_filter = ("position", "is_staff", "is_active")
+    # UPPER(username) LIKE, see models.upper_prefix_index.
+    search_fields = ("^username",)
+    autocomplete_fields = ("position",)
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
     fieldsets = UserAdmin.fieldsets + (
         (("Additional info", {"fields": ("position",)}),)
     )
@@ -26,6 +41,77 @@ class WorkerAdmin(UserAdmin):
     )
 
 
-admin.site.register(TaskType)
-admin.site.register(Position)
-admin.site.register(Task)
+@admin.register(TaskType)
+class CountedNameAdmin(admin.ModelAdmin):
+    list_display = ("name", "task_count", "open_task_count")
+    # UPPER(name) LIKE, see models.upper_prefix_index.
+    search_fields = ("^name",)
+    ordering = ("name",)
+
+
+@admin.register(Position)
+class PositionAdmin(CountedNameAdmin):
+    list_display = ("name", "assignment_count", "open_assignment_count")
+
+
+@admin.register(Task)
+class TaskAdmin(admin.ModelAdmin):
+    # Task.__str__ is not used: every column is a plain field.
+    list_display = (
+        "name",
+        "task_type",
+        "priority",
+        "deadline",
+        "is_completed",
+        "is_blocked",
+        "assignee_count",
+    )
+    list_select_related = ("task_type",)
+    # Indexed columns, see Task.Meta.indexes.
+    list_filter = (
+        "is_completed",
+        "is_blocked",
+        "priority",
+        "task_type",
+        "deadline",
+    )
+    # Enables the search box; get_search_results does the filtering.
+    search_fields = ("^name",)
+    autocomplete_fields = ("task_type", "assignees")
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
+    actions = ("mark_completed", "mark_not_completed")
+
+    def get_search_results(self, request, queryset, search_term):
+        # Prefix match on the lowercased column, served by
+        # task_search_name_idx, instead of UPPER(name) LIKE.
+        prefix = typeahead.normalize(search_term)
+        if not prefix:
+            return queryset, False
+        return queryset.filter(search_name__startswith=prefix), False
+
+    @admin.action(description="Mark selected tasks as completed")
+    def mark_completed(self, request, queryset):
+        count = completion.set_completed(queryset)
+        self.message_user(request, f"{count} task(s) marked as completed.")
+
+    @admin.action(description="Mark selected tasks as not completed")
+    def mark_not_completed(self, request, queryset):
+        count = completion.set_completed(queryset, completed=False)
+        self.message_user(request, f"{count} task(s) reopened.")
+
+
+@admin.register(RecurringTask)
+class RecurringTaskAdmin(admin.ModelAdmin):
+    list_display = (
+        "name",
+        "frequency",
+        "interval",
+        "starts_at",
+        "generated_until",
+        "is_active",
+    )
+    list_filter = ("frequency", "is_active", "task_type")
+    # UPPER(name) LIKE, see models.upper_prefix_index.
+    search_fields = ("^name",)
+    autocomplete_fields = ("task_type", "assignees")
@@ -0,0 +1,279 @@
+import datetime
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Q, Subquery
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from task_manager.models import Task, TaskDailyStat, WorkloadRollup
+
+TaskAssignee = Task.assignees.through
+
+Dimension = WorkloadRollup.Dimension
+
+
+def _counts(prefix, now):
+    return {
+        "open_count": Count(
+            "pk", filter=Q(**{f"{prefix}is_completed": False})
+        ),
+        "overdue_count": Count(
+            "pk",
+            filter=Q(
+                **{
+                    f"{prefix}is_completed": False,
+                    f"{prefix}deadline__lt": now,
+                }
+            ),
+        ),
+        "completed_count": Count(
+            "pk", filter=Q(**{f"{prefix}is_completed": True})
+        ),
+    }
+
+
+def rollup_rows(now=None):
+    now = now or timezone.now()
+    priorities = dict(Task.LevelPriority.choices)
+
+    groups = (
+        (
+            Dimension.TASK_TYPE,
+            Task.objects.values_list("task_type_id", "task_type__name"),
+            "",
+        ),
+        (
+            Dimension.PRIORITY,
+            Task.objects.values_list("priority", "priority"),
+            "",
+        ),
+        (
+            Dimension.WORKER,
+            TaskAssignee.objects.values_list("worker_id", "worker__username"),
+            "task__",
+        ),
+        (
+            Dimension.POSITION,
+            TaskAssignee.objects.filter(
+                worker__position__isnull=False
+            ).values_list("worker__position_id", "worker__position__name"),
+            "task__",
+        ),
+    )
+
+    for dimension, queryset, prefix in groups:
+        for key, label, *counts in queryset.order_by().annotate(
+            **_counts(prefix, now)
+        ):
+            if dimension == Dimension.PRIORITY:
+                label = priorities.get(key, key)
+            yield WorkloadRollup(
+                dimension=dimension,
+                key=str(key),
+                label=label,
+                open_count=counts[0],
+                overdue_count=counts[1],
+                completed_count=counts[2],
+                refreshed_at=now,
+            )
+
+
+def refresh_rollups(now=None):
+    rows = list(rollup_rows(now))
+    with transaction.atomic():
+        WorkloadRollup.objects.all().delete()
+        WorkloadRollup.objects.bulk_create(rows)
+    return len(rows)
+
+
+def workload_report():
+    report = {dimension: [] for dimension in Dimension}
+    for rollup in WorkloadRollup.objects.order_by("-open_count", "label"):
+        report[rollup.dimension].append(rollup)
+    return [
+        (dimension.label, rollups) for dimension, rollups in report.items()
+    ]
+
+
+def _bump(day, task_type_id, priority, deltas):
+    deltas = {field: delta for field, delta in deltas.items() if delta}
+    if task_type_id is None or not deltas:
+        return
+
+    stats = TaskDailyStat.objects.filter(
+        task_type_id=task_type_id, priority=priority
+    )
+    if not stats.filter(day=day).exists():
+        # A new day starts with the open count the previous row ended with.
+        previous = stats.filter(day__lt=day).order_by("-day").values_list(
+            "open_count", flat=True
+        ).first()
+        TaskDailyStat.objects.get_or_create(
+            day=day,
+            task_type_id=task_type_id,
+            priority=priority,
+            defaults={"open_count": previous or 0},
+        )
+    stats.filter(day=day).update(
+        **{field: F(field) + delta for field, delta in deltas.items()}
+    )
+
+
+def _record(events):
+    for (day, task_type_id, priority), deltas in events.items():
+        _bump(day, task_type_id, priority, deltas)
+
+
+def _add(events, key, field, delta):
+    events[key][field] = events[key].get(field, 0) + delta
+
+
+def task_created(task):
+    tasks_created([task])
+
+
+def tasks_created(tasks):
+    events = defaultdict(dict)
+    for task in tasks:
+        day = timezone.localdate(task.created_at)
+        key = (day, task.task_type_id, task.priority)
+        _add(events, key, "created_count", 1)
+        if task.is_completed:
+            _add(events, key, "completed_count", 1)
+        else:
+            _add(events, key, "open_count", 1)
+    _record(events)
+
+
+def task_changed(
+    task, was_completed, old_task_type_id, old_priority, old_completed_at=None
+):
+    today = timezone.localdate()
+    events = defaultdict(dict)
+    old_key = (today, old_task_type_id, old_priority)
+    new_key = (today, task.task_type_id, task.priority)
+
+    _add(events, old_key, "open_count", 0 if was_completed else -1)
+    _add(events, new_key, "open_count", 0 if task.is_completed else 1)
+    if task.is_completed and not was_completed:
+        _add(events, new_key, "completed_count", 1)
+    elif was_completed and not task.is_completed and old_completed_at:
+        # Reopening takes the completion back from the day it was counted.
+        day = timezone.localdate(old_completed_at)
+        old_day_key = (day, old_task_type_id, old_priority)
+        _add(events, old_day_key, "completed_count", -1)
+    _record(events)
+
+
+def task_deleted(task):
+    if not task.is_completed:
+        _bump(
+            timezone.localdate(),
+            task.task_type_id,
+            task.priority,
+            {"open_count": -1},
+        )
+
+
+def completion_changed(rows, completed, now=None):
+    """Record ``(task_id, task_type_id, priority)`` rows that flipped."""
+    day = timezone.localdate(now)
+    sign = 1 if completed else -1
+    events = defaultdict(dict)
+    for _, task_type_id, priority in rows:
+        key = (day, task_type_id, priority)
+        _add(events, key, "completed_count", sign)
+        _add(events, key, "open_count", -sign)
+    _record(events)
+
+
+def daily_stat_rows():
+    events = defaultdict(lambda: {"created_count": 0, "completed_count": 0})
+    grouped = (
+        ("created_count", Task.objects.all(), "created_at"),
+        (
+            "completed_count",
+            Task.objects.filter(is_completed=True, completed_at__isnull=False),
+            "completed_at",
+        ),
+    )
+    for field, queryset, timestamp in grouped:
+        for day, task_type_id, priority, count in (
+            queryset.order_by()
+            .annotate(day=TruncDate(timestamp))
+            .values_list("day", "task_type_id", "priority")
+            .annotate(count=Count("pk"))
+        ):
+            events[(task_type_id, priority, day)][field] += count
+
+    open_counts = defaultdict(int)
+    for (task_type_id, priority, day), counts in sorted(events.items()):
+        open_counts[task_type_id, priority] += (
+            counts["created_count"] - counts["completed_count"]
+        )
+        yield TaskDailyStat(
+            day=day,
+            task_type_id=task_type_id,
+            priority=priority,
+            open_count=open_counts[task_type_id, priority],
+            **counts,
+        )
+
+
+def rebuild_daily_stats():
+    """
+    Recompute the daily stats from the task table.
+
+    Archived tasks no longer contribute to the created and completed counts.
+    """
+    rows = list(daily_stat_rows())
+    with transaction.atomic():
+        TaskDailyStat.objects.all().delete()
+        TaskDailyStat.objects.bulk_create(rows)
+    return len(rows)
+
+
+def burndown_series(days=30, task_type=None, priority=None, today=None):
+    today = today or timezone.localdate()
+    start = today - datetime.timedelta(days=days - 1)
+
+    stats = TaskDailyStat.objects.all()
+    if task_type is not None:
+        stats = stats.filter(task_type_id=task_type)
+    if priority:
+        stats = stats.filter(priority=priority)
+
+    previous_day = TaskDailyStat.objects.filter(
+        task_type_id=OuterRef("task_type_id"),
+        priority=OuterRef("priority"),
+        day__lt=start,
+    ).order_by("-day").values("day")[:1]
+    open_counts = {
+        (task_type_id, row_priority): open_count
+        for task_type_id, row_priority, open_count in stats.filter(
+            day=Subquery(previous_day)
+        ).values_list("task_type_id", "priority", "open_count")
+    }
+
+    by_day = defaultdict(list)
+    for row in stats.filter(day__range=(start, today)):
+        by_day[row.day].append(row)
+
+    series = []
+    for offset in range(days):
+        day = start + datetime.timedelta(days=offset)
+        created = completed = 0
+        for row in by_day[day]:
+            created += row.created_count
+            completed += row.completed_count
+            open_counts[row.task_type_id, row.priority] = row.open_count
+        series.append(
+            {
+                "date": day.isoformat(),
+                "created": created,
+                "completed": completed,
+                "open": sum(open_counts.values()),
+            }
+        )
+    return series
@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class TaskManagerConfig(AppConfig):
     name = 'task_manager'
+
+    def ready(self):
+        from task_manager import signals  # noqa: F401
@@ -0,0 +1,98 @@
+import contextvars
+import datetime
+import logging
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from task_manager import audit, counters, events
+from task_manager.models import ArchivedTask, Task
+
+logger = logging.getLogger(__name__)
+
+TaskAssignee = Task.assignees.through
+ArchivedTaskAssignee = ArchivedTask.assignees.through
+
+ARCHIVED_FIELDS = (
+    "name",
+    "description",
+    "deadline",
+    "priority",
+    "completed_at",
+    "task_type_id",
+)
+
+_archiving = contextvars.ContextVar("archiving", default=False)
+
+
+def is_archiving():
+    """
+    Whether tasks are being deleted by ``archive_batch``, which records them
+    as archived in bulk; the task delete handlers leave them alone.
+    """
+    return _archiving.get()
+
+
+def archivable_tasks(days=None, now=None):
+    if days is None:
+        days = settings.TASK_ARCHIVE_AFTER_DAYS
+    cutoff = (now or timezone.now()) - datetime.timedelta(days=days)
+    return Task.objects.filter(is_completed=True, completed_at__lt=cutoff)
+
+
+def archive_batch(pks):
+    """Move the given tasks and their assignee rows to the archive tables."""
+    with audit.buffered(), transaction.atomic():
+        rows = list(
+            Task.objects.filter(pk__in=pks, is_completed=True).values(
+                "pk", *ARCHIVED_FIELDS
+            )
+        )
+        archived = ArchivedTask.objects.bulk_create(
+            [ArchivedTask(task_id=row.pop("pk"), **row) for row in rows]
+        )
+        archived_ids = {task.task_id: task.pk for task in archived}
+        pks = list(archived_ids)
+
+        assignments = list(
+            TaskAssignee.objects.filter(task_id__in=pks).values_list(
+                "task_id", "worker_id"
+            )
+        )
+        ArchivedTaskAssignee.objects.bulk_create(
+            [
+                ArchivedTaskAssignee(
+                    archivedtask_id=archived_ids[task_id], worker_id=worker_id
+                )
+                for task_id, worker_id in assignments
+            ]
+        )
+        counters.assignments_changed(assignments, -1)
+        counters.completed_tasks_removed(row["task_type_id"] for row in rows)
+        audit.record_many(((pk, None) for pk in pks), audit.Action.ARCHIVED)
+        events.publish_many({"id": pk, "action": "archived"} for pk in pks)
+        TaskAssignee.objects.filter(task_id__in=pks).delete()
+        token = _archiving.set(True)
+        try:
+            Task.objects.filter(pk__in=pks).delete()
+        finally:
+            _archiving.reset(token)
+    return len(pks)
+
+
+def archive_completed_tasks(days=None, batch_size=None, progress=None):
+    batch_size = batch_size or settings.TASK_ARCHIVE_BATCH_SIZE
+    queryset = archivable_tasks(days).order_by("pk")
+    total = 0
+
+    while True:
+        pks = list(queryset.values_list("pk", flat=True)[:batch_size])
+        if not pks:
+            break
+        count = archive_batch(pks)
+        total += count
+        logger.info("Archived %s tasks (%s so far)", count, total)
+        if progress is not None:
+            progress(count, total)
+    return total
@@ -0,0 +1,75 @@
+"""
+Static asset bundles.
+
+``settings.ASSET_BUNDLES`` maps a bundle path to the static files it is
+concatenated from. Bundles are written to the first ``STATICFILES_DIRS``
+entry by ``manage.py build_assets`` and then hashed and compressed by
+``collectstatic`` like any other file. Relative ``url()`` references in
+stylesheets are rewritten for the bundle's location and source map comments
+are dropped, since the maps do not describe the bundle.
+"""
+import posixpath
+import re
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+
+CSS_URL_RE = re.compile(r"url\(\s*([\"']?)([^\"')]+)\1\s*\)")
+SOURCE_MAP_RE = re.compile(
+    r"^\s*(/\*# sourceMappingURL=.*?\*/|//# sourceMappingURL=.*)$",
+    re.MULTILINE,
+)
+
+
+class AssetNotFound(Exception):
+    pass
+
+
+def read_source(path):
+    found = finders.find(path)
+    if found is None:
+        raise AssetNotFound(f"Static file {path!r} not found")
+    return Path(found).read_text(encoding="utf-8")
+
+
+def rebase_css_urls(css, source, target):
+    source_dir = posixpath.dirname(source)
+    target_dir = posixpath.dirname(target)
+
+    def rebase(match):
+        quote, url = match.groups()
+        if url.startswith(("data:", "http:", "https:", "/", "#")):
+            return match.group(0)
+        path = posixpath.normpath(posixpath.join(source_dir, url))
+        return f"url({quote}{posixpath.relpath(path, target_dir)}{quote})"
+
+    return CSS_URL_RE.sub(rebase, css)
+
+
+def build_bundle(target, sources):
+    parts = []
+    for source in sources:
+        content = SOURCE_MAP_RE.sub("", read_source(source)).strip()
+        if target.endswith(".css"):
+            content = rebase_css_urls(content, source, target)
+        else:
+            # Guard against sources that omit their trailing semicolon.
+            content += ";"
+        parts.append(content)
+    return "\n".join(parts) + "\n"
+
+
+def output_dir():
+    return Path(settings.STATICFILES_DIRS[0])
+
+
+def build_bundles():
+    """Return ``{path: (content, changed)}`` for every configured bundle."""
+    bundles = {}
+    for target, sources in settings.ASSET_BUNDLES.items():
+        content = build_bundle(target, sources)
+        path = output_dir() / target
+        current = path.read_text(encoding="utf-8") if path.exists() else None
+        bundles[path] = (content, content != current)
+    return bundles
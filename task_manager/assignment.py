@@ -0,0 +1,85 @@
+"""
+Load-aware assignment of tasks.
+
+Candidates are read with one query, using the maintained
+``Worker.open_task_count`` as their load, into a min-heap. Every task pops
+the least-loaded workers and pushes them back with their new load, so a run
+costs O(tasks * log(workers)) in memory and a single bulk insert.
+"""
+import heapq
+
+from django.db import transaction
+
+from task_manager import audit, counters, events
+from task_manager.models import Task, Worker
+
+TaskAssignee = Task.assignees.through
+
+
+class NoEligibleWorkers(Exception):
+    pass
+
+
+def eligible_workers(position=None):
+    workers = Worker.objects.filter(is_active=True)
+    if position is not None:
+        workers = workers.filter(position=position)
+    return workers
+
+
+def load_heap(position=None):
+    """``(open tasks, worker id)`` of the eligible workers as a min-heap."""
+    heap = list(
+        eligible_workers(position).values_list("open_task_count", "pk")
+    )
+    heapq.heapify(heap)
+    return heap
+
+
+def plan(task_ids, heap, per_task=1, assigned=None):
+    """
+    Pick ``per_task`` distinct workers for every task, least loaded first,
+    skipping ``(task_id, worker_id)`` pairs in ``assigned``.
+    """
+    assigned = assigned or set()
+    pairs = []
+    for task_id in task_ids:
+        picked = []
+        skipped = []
+        while heap and len(picked) < per_task:
+            load, worker_id = heapq.heappop(heap)
+            if (task_id, worker_id) in assigned:
+                skipped.append((load, worker_id))
+                continue
+            picked.append((load + 1, worker_id))
+            pairs.append((task_id, worker_id))
+        for entry in picked + skipped:
+            heapq.heappush(heap, entry)
+    return pairs
+
+
+def auto_assign(tasks, position=None, per_task=1):
+    """Assign ``tasks`` (tasks or ids) to the least-loaded workers."""
+    task_ids = [getattr(task, "pk", task) for task in tasks]
+    heap = load_heap(position)
+    if not heap:
+        raise NoEligibleWorkers("No active workers to assign tasks to.")
+
+    with audit.buffered(), transaction.atomic():
+        assigned = set(
+            TaskAssignee.objects.filter(task_id__in=task_ids).values_list(
+                "task_id", "worker_id"
+            )
+        )
+        pairs = plan(task_ids, heap, per_task, assigned)
+        TaskAssignee.objects.bulk_create(
+            [
+                TaskAssignee(task_id=task_id, worker_id=worker_id)
+                for task_id, worker_id in pairs
+            ]
+        )
+        # bulk_create sends no m2m_changed.
+        counters.assignments_changed(pairs, 1)
+        audit.assignees_changed(pairs, assigned=True)
+        events.assignees_changed(pairs, assigned=True)
+    return pairs
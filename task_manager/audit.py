@@ -0,0 +1,138 @@
+"""
+Task change history.
+
+Entries are queued once their transaction commits and written with a single
+``bulk_create`` when the surrounding ``buffered()`` block (one per request,
+see ``AuditMiddleware``) ends, or as soon as ``AUDIT_BUFFER_SIZE`` entries
+are waiting. Code that records entries outside of requests opens its own
+block: archiving, batch deletion, recurrence and auto-assignment. A nested
+block shares the outer one. Outside of any block every entry is written on
+commit, on its own.
+
+The block keeps the request rather than its user, which is only loaded when
+entries are written. Evaluating the lazy ``request.user`` earlier would run
+a query wherever the context is copied, e.g. inside async views.
+"""
+import contextlib
+import contextvars
+import functools
+
+from django.conf import settings
+from django.db import transaction
+
+from task_manager.models import TaskChange
+
+Action = TaskChange.Action
+
+TRACKED_FIELDS = (
+    "name",
+    "description",
+    "deadline",
+    "is_completed",
+    "priority",
+    "task_type_id",
+)
+
+_buffer = contextvars.ContextVar("audit_buffer", default=None)
+_request = contextvars.ContextVar("audit_request", default=None)
+
+
+def _actor_id():
+    user = getattr(_request.get(), "user", None)
+    if user is not None and user.is_authenticated:
+        return user.pk
+    return None
+
+
+def record(task_id, action, changes=None):
+    record_many([(task_id, changes)], action)
+
+
+def record_many(changes, action):
+    """Record ``action`` for ``(task_id, changes)`` pairs in one go."""
+    entries = [
+        TaskChange(task_id=task_id, action=action, changes=task_changes or {})
+        for task_id, task_changes in changes
+    ]
+    if entries:
+        transaction.on_commit(functools.partial(_enqueue, entries))
+
+
+def _enqueue(entries):
+    buffer = _buffer.get()
+    if buffer is None:
+        TaskChange.objects.bulk_create(entries)
+        return
+    buffer.extend(entries)
+    if len(buffer) >= settings.AUDIT_BUFFER_SIZE:
+        flush()
+
+
+def flush():
+    buffer = _buffer.get()
+    if not buffer:
+        return 0
+    entries = buffer[:]
+    buffer.clear()
+    actor_id = _actor_id()
+    for entry in entries:
+        entry.actor_id = actor_id
+    TaskChange.objects.bulk_create(entries)
+    return len(entries)
+
+
+@contextlib.contextmanager
+def buffered(request=None):
+    if _buffer.get() is not None:
+        # Entries of a nested block keep the outer block's request.
+        yield
+        return
+    buffer_token = _buffer.set([])
+    request_token = _request.set(request)
+    try:
+        yield
+    finally:
+        try:
+            flush()
+        finally:
+            _request.reset(request_token)
+            _buffer.reset(buffer_token)
+
+
+def task_saved(task, created, loaded):
+    if created:
+        changes = {
+            field: [None, getattr(task, field)] for field in TRACKED_FIELDS
+        }
+        record(task.pk, Action.CREATED, changes)
+        return
+
+    changes = {
+        field: [loaded[field], getattr(task, field)]
+        for field in TRACKED_FIELDS
+        if field in loaded and loaded[field] != getattr(task, field)
+    }
+    if changes:
+        record(task.pk, Action.UPDATED, changes)
+
+
+def assignees_changed(pairs, assigned):
+    workers = {}
+    for task_id, worker_id in pairs:
+        workers.setdefault(task_id, []).append(worker_id)
+    record_many(
+        (
+            (task_id, {"workers": sorted(worker_ids)})
+            for task_id, worker_ids in workers.items()
+        ),
+        Action.ASSIGNED if assigned else Action.UNASSIGNED,
+    )
+
+
+class AuditMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with buffered(request):
+            return self.get_response(request)
@@ -0,0 +1,52 @@
+from django.conf import settings
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+
+from task_manager.models import Worker
+
+
+def cache_key(user_id):
+    return f"task_manager:worker:{user_id}"
+
+
+def invalidate(*user_ids):
+    cache.delete_many(
+        [cache_key(user_id) for user_id in user_ids],
+        version=settings.WORKER_CACHE_VERSION,
+    )
+
+
+def invalidate_position(position_id):
+    invalidate(
+        *Worker.objects.filter(position_id=position_id).values_list(
+            "pk", flat=True
+        )
+    )
+
+
+class CachedModelBackend(ModelBackend):
+    """
+    Load the session's worker together with its position from the cache.
+
+    Entries are dropped whenever a worker or its position is saved or
+    deleted, which includes password changes and ``last_login`` updates.
+    ``WORKER_CACHE_VERSION`` invalidates every entry at once, e.g. when the
+    worker's fields change.
+    """
+
+    def get_user(self, user_id):
+        timeout = settings.WORKER_CACHE_TIMEOUT
+        if not timeout:
+            return super().get_user(user_id)
+
+        key = cache_key(user_id)
+        version = settings.WORKER_CACHE_VERSION
+        user = cache.get(key, version=version)
+        if user is None:
+            user = Worker._default_manager.select_related(
+                "position"
+            ).filter(pk=user_id).first()
+            if user is None:
+                return None
+            cache.set(key, user, timeout, version=version)
+        return user if self.user_can_authenticate(user) else None
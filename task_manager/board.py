@@ -0,0 +1,104 @@
+"""
+Kanban board of the tasks.
+
+All columns are read with a single query: ``ROW_NUMBER()`` over a partition
+per column caps the rows each column renders and ``COUNT(*)`` over the same
+partition gives the column totals. Further rows of one column are loaded on
+demand with ``column_tasks``.
+"""
+from django.conf import settings
+from django.db.models import (
+    Case,
+    CharField,
+    Count,
+    F,
+    Value,
+    When,
+    Window,
+)
+from django.db.models.functions import Cast, RowNumber
+
+from task_manager.models import Task, TaskType
+
+GROUPINGS = ("status", "type")
+
+SCOPES = ("team", "mine")
+
+ORDERING = ("deadline", "pk")
+
+DONE = "done"
+
+
+def column_key(group_by):
+    if group_by == "status":
+        return Case(
+            When(is_completed=True, then=Value(DONE)),
+            default=F("priority"),
+            output_field=CharField(),
+        )
+    return Cast("task_type_id", CharField())
+
+
+def board_tasks(worker=None):
+    queryset = Task.objects.all()
+    if worker is not None:
+        queryset = queryset.filter(assignees=worker)
+    return queryset
+
+
+def empty_columns(group_by):
+    """``{key: column}`` for every column, in board order."""
+    if group_by == "status":
+        labels = [*Task.LevelPriority.choices, (DONE, "Done")]
+    else:
+        labels = [
+            (str(pk), name)
+            for pk, name in TaskType.objects.order_by("name").values_list(
+                "pk", "name"
+            )
+        ]
+    return {
+        key: {"key": key, "label": label, "tasks": [], "total": 0}
+        for key, label in labels
+    }
+
+
+def board_columns(group_by="status", worker=None, limit=None):
+    limit = limit or settings.BOARD_COLUMN_LIMIT
+    key = column_key(group_by)
+    tasks = (
+        board_tasks(worker)
+        .annotate(
+            column=key,
+            position=Window(
+                RowNumber(),
+                partition_by=key,
+                order_by=[F(field).asc() for field in ORDERING],
+            ),
+            column_total=Window(Count("*"), partition_by=key),
+        )
+        .filter(position__lte=limit)
+        .order_by("column", "position")
+    )
+
+    columns = empty_columns(group_by)
+    for task in tasks:
+        column = columns.get(task.column)
+        if column is None:
+            continue
+        column["tasks"].append(task)
+        column["total"] = task.column_total
+    return list(columns.values())
+
+
+def column_tasks(group_by, key, worker=None, offset=0, limit=None):
+    """The next ``limit`` tasks of one column after the first ``offset``."""
+    limit = limit or settings.BOARD_COLUMN_LIMIT
+    tasks = board_tasks(worker)
+    if group_by == "status" and key == DONE:
+        tasks = tasks.filter(is_completed=True)
+    elif group_by == "status":
+        tasks = tasks.filter(is_completed=False, priority=key)
+    else:
+        tasks = tasks.filter(task_type_id=key)
+    return list(tasks.order_by(*ORDERING)[offset:offset + limit])
@@ -0,0 +1,41 @@
+"""
+Bulk completion of tasks, the counterpart of toggling ``is_completed`` and
+saving every task. One UPDATE flips the tasks; counters, daily stats, blocked
+flags, history and live events are then updated per batch rather than per
+task, as the save signal handlers would.
+"""
+from django.db import transaction
+from django.utils import timezone
+
+from task_manager import analytics, audit, counters, dependencies, events
+from task_manager.models import Task
+
+
+def set_completed(tasks, completed=True):
+    """Complete (or reopen) the ``tasks`` queryset; returns how many."""
+    now = timezone.now()
+    with transaction.atomic():
+        changed = list(
+            tasks.filter(is_completed=not completed).values_list(
+                "pk", "task_type_id", "priority"
+            )
+        )
+        if not changed:
+            return 0
+        pks = [pk for pk, _, _ in changed]
+        Task.objects.filter(pk__in=pks).update(
+            is_completed=completed,
+            completed_at=now if completed else None,
+        )
+        counters.completion_changed(changed, completed)
+        analytics.completion_changed(changed, completed, now)
+        dependencies.completion_changed(pks)
+        audit.record_many(
+            ((pk, {"is_completed": [not completed, completed]}) for pk in pks),
+            audit.Action.UPDATED,
+        )
+        events.publish_many(
+            {"id": pk, "action": "updated", "is_completed": completed}
+            for pk in pks
+        )
+    return len(pks)
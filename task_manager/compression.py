@@ -0,0 +1,208 @@
+"""
+Compression of dynamic responses.
+
+WhiteNoise only serves pre-compressed static files, so pages, feeds and
+exports are compressed here: with brotli when the client accepts it and the
+``brotli`` package is installed, otherwise with gzip. Streaming responses are
+compressed as the view produces them.
+
+Like Django's GZipMiddleware, every compressed response is padded with up to
+``COMPRESSION_MAX_RANDOM_BYTES`` random bytes to mitigate BREACH attacks on
+the CSRF token and other secrets in the page. Gzip uses Django's own helpers,
+which pad the header with a random file name; brotli gets a metadata block of
+random length, which decoders skip.
+"""
+import re
+import secrets
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.text import (
+    acompress_sequence,
+    compress_sequence,
+    compress_string,
+)
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+_accept_re = re.compile(r"\s*([^\s;,]+)\s*(?:;\s*q=([0-9.]+))?")
+
+
+class GzipEncoder:
+    name = "gzip"
+
+    @staticmethod
+    def compress(data):
+        return compress_string(
+            data, max_random_bytes=settings.COMPRESSION_MAX_RANDOM_BYTES
+        )
+
+    @staticmethod
+    def compress_sequence(chunks):
+        return compress_sequence(
+            chunks, max_random_bytes=settings.COMPRESSION_MAX_RANDOM_BYTES
+        )
+
+    @staticmethod
+    def acompress_sequence(chunks):
+        return acompress_sequence(
+            chunks, max_random_bytes=settings.COMPRESSION_MAX_RANDOM_BYTES
+        )
+
+
+def brotli_padding(max_random_bytes):
+    """
+    Return a metadata meta-block of random length, or b"" for no padding.
+
+    The block header is ISLAST=0, MNIBBLES=0, a reserved zero bit, the number
+    of bytes of MSKIPLEN and MSKIPLEN - 1, and is followed by MSKIPLEN bytes
+    that the decoder skips. It has to start on a byte boundary, i.e. right
+    after a flush.
+    """
+    length = secrets.randbelow(max_random_bytes) if max_random_bytes else 0
+    if not length:
+        return b""
+    size = max(1, ((length - 1).bit_length() + 7) // 8)
+    header = 0b0110 | size << 4 | (length - 1) << 6
+    return header.to_bytes((6 + 8 * size + 7) // 8, "little") + bytes(length)
+
+
+class BrotliEncoder:
+    name = "br"
+
+    @staticmethod
+    def compress(data):
+        return b"".join(BrotliEncoder.compress_sequence([data]))
+
+    @staticmethod
+    def start(compressor):
+        # Flushing the empty stream writes the window size and byte-aligns
+        # the output for the padding.
+        return (
+            compressor.process(b"")
+            + compressor.flush()
+            + brotli_padding(settings.COMPRESSION_MAX_RANDOM_BYTES)
+        )
+
+    @staticmethod
+    def compress_chunk(compressor, chunk):
+        return compressor.process(chunk) + compressor.flush()
+
+    @staticmethod
+    def compress_sequence(chunks):
+        compressor = brotli.Compressor(
+            quality=settings.COMPRESSION_BROTLI_QUALITY
+        )
+        yield BrotliEncoder.start(compressor)
+        for chunk in chunks:
+            if chunk:
+                yield BrotliEncoder.compress_chunk(compressor, chunk)
+        yield compressor.finish()
+
+    @staticmethod
+    async def acompress_sequence(chunks):
+        compressor = brotli.Compressor(
+            quality=settings.COMPRESSION_BROTLI_QUALITY
+        )
+        yield BrotliEncoder.start(compressor)
+        async for chunk in chunks:
+            if chunk:
+                yield BrotliEncoder.compress_chunk(compressor, chunk)
+        yield compressor.finish()
+
+
+ENCODERS = {"gzip": GzipEncoder}
+if brotli is not None:
+    ENCODERS["br"] = BrotliEncoder
+
+
+def accepted_encodings(header):
+    accepted = set()
+    for match in _accept_re.finditer(header):
+        coding, quality = match.groups()
+        try:
+            if quality is not None and float(quality) == 0:
+                continue
+        except ValueError:
+            continue
+        accepted.add(coding.lower())
+    return accepted
+
+
+def choose_encoder(request):
+    accepted = accepted_encodings(request.headers.get("Accept-Encoding", ""))
+    for name in ("br", "gzip"):
+        if name in ENCODERS and (name in accepted or "*" in accepted):
+            return ENCODERS[name]
+    return None
+
+
+def is_compressible(response):
+    if response.has_header("Content-Encoding"):
+        return False
+    if response.status_code in (204, 304):
+        return False
+    content_type = response.get("Content-Type", "").lower()
+    return not content_type.startswith(settings.COMPRESSION_SKIP_TYPES)
+
+
+def compress(data, encoder_class):
+    return encoder_class.compress(data)
+
+
+def compress_stream(chunks, encoder_class):
+    return encoder_class.compress_sequence(chunks)
+
+
+def acompress_stream(chunks, encoder_class):
+    return encoder_class.acompress_sequence(chunks)
+
+
+def weaken_etag(response):
+    """The compressed body is a different representation of the same one."""
+    etag = response.get("ETag")
+    if etag and not etag.startswith("W/"):
+        response.headers["ETag"] = "W/" + etag
+
+
+def compress_response(request, response):
+    if not is_compressible(response):
+        return response
+    patch_vary_headers(response, ("Accept-Encoding",))
+    encoder_class = choose_encoder(request)
+    if encoder_class is None:
+        return response
+
+    if response.streaming:
+        if response.is_async:
+            response.streaming_content = acompress_stream(
+                response.streaming_content, encoder_class
+            )
+        else:
+            response.streaming_content = compress_stream(
+                response.streaming_content, encoder_class
+            )
+        del response.headers["Content-Length"]
+    else:
+        if len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+        compressed = compress(response.content, encoder_class)
+        if len(compressed) >= len(response.content):
+            return response
+        response.content = compressed
+        response.headers["Content-Length"] = str(len(compressed))
+
+    weaken_etag(response)
+    response.headers["Content-Encoding"] = encoder_class.name
+    return response
+
+
+class CompressionMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        return compress_response(request, self.get_response(request))
@@ -0,0 +1,237 @@
+from collections import defaultdict
+
+from django.db.models import Count, F, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from task_manager.models import Position, Task, TaskType, Worker
+
+TaskAssignee = Task.assignees.through
+
+
+def apply_deltas(model, deltas):
+    """
+    Apply ``{pk: {field: delta}}`` with one UPDATE per distinct delta set.
+    """
+    groups = defaultdict(list)
+    for pk, fields in deltas.items():
+        changes = tuple(
+            sorted((field, delta) for field, delta in fields.items() if delta)
+        )
+        if pk is not None and changes:
+            groups[changes].append(pk)
+
+    for changes, pks in groups.items():
+        model.objects.filter(pk__in=pks).update(
+            **{field: F(field) + delta for field, delta in changes}
+        )
+
+
+def _add(deltas, pk, field, delta):
+    deltas[pk][field] = deltas[pk].get(field, 0) + delta
+
+
+def assignments_changed(pairs, sign):
+    """
+    Update counters for ``(task_id, worker_id)`` assignee rows that were
+    added (``sign=1``) or are about to be removed (``sign=-1``).
+    """
+    pairs = list(pairs)
+    if not pairs:
+        return
+
+    open_tasks = set(
+        Task.objects.filter(
+            pk__in={task_id for task_id, _ in pairs}, is_completed=False
+        ).values_list("pk", flat=True)
+    )
+    positions = dict(
+        Worker.objects.filter(
+            pk__in={worker_id for _, worker_id in pairs}
+        ).values_list("pk", "position_id")
+    )
+
+    task_deltas = defaultdict(dict)
+    worker_deltas = defaultdict(dict)
+    position_deltas = defaultdict(dict)
+    for task_id, worker_id in pairs:
+        position_id = positions.get(worker_id)
+        is_open = sign if task_id in open_tasks else 0
+
+        _add(task_deltas, task_id, "assignee_count", sign)
+        _add(worker_deltas, worker_id, "assigned_task_count", sign)
+        _add(worker_deltas, worker_id, "open_task_count", is_open)
+        _add(position_deltas, position_id, "assignment_count", sign)
+        _add(position_deltas, position_id, "open_assignment_count", is_open)
+
+    apply_deltas(Task, task_deltas)
+    apply_deltas(Worker, worker_deltas)
+    apply_deltas(Position, position_deltas)
+    workers_touched(list(worker_deltas))
+
+
+def workers_touched(worker_ids):
+    """Bump the assignment version of workers whose open tasks changed."""
+    return Worker.objects.filter(pk__in=worker_ids).update(
+        assignment_version=F("assignment_version") + 1,
+        assignments_changed_at=timezone.now(),
+    )
+
+
+def tasks_touched(task_ids):
+    return workers_touched(
+        TaskAssignee.objects.filter(task_id__in=task_ids).values("worker_id")
+    )
+
+
+def task_created(task):
+    tasks_created([task])
+
+
+def tasks_created(tasks):
+    type_deltas = defaultdict(dict)
+    for task in tasks:
+        _add(type_deltas, task.task_type_id, "task_count", 1)
+        _add(
+            type_deltas,
+            task.task_type_id,
+            "open_task_count",
+            0 if task.is_completed else 1,
+        )
+    apply_deltas(TaskType, type_deltas)
+
+
+def task_deleted(task):
+    apply_deltas(
+        TaskType,
+        {
+            task.task_type_id: {
+                "task_count": -1,
+                "open_task_count": 0 if task.is_completed else -1,
+            }
+        },
+    )
+    assignments_changed(
+        TaskAssignee.objects.filter(task_id=task.pk).values_list(
+            "task_id", "worker_id"
+        ),
+        -1,
+    )
+
+
+def completed_tasks_removed(task_type_ids):
+    """Counters of completed tasks deleted without their signal handlers."""
+    type_deltas = defaultdict(dict)
+    for task_type_id in task_type_ids:
+        _add(type_deltas, task_type_id, "task_count", -1)
+    apply_deltas(TaskType, type_deltas)
+
+
+def task_changed(task, was_completed, old_task_type_id):
+    was_open = 0 if was_completed else 1
+    is_open = 0 if task.is_completed else 1
+
+    type_deltas = defaultdict(dict)
+    _add(type_deltas, old_task_type_id, "task_count", -1)
+    _add(type_deltas, old_task_type_id, "open_task_count", -was_open)
+    _add(type_deltas, task.task_type_id, "task_count", 1)
+    _add(type_deltas, task.task_type_id, "open_task_count", is_open)
+    apply_deltas(TaskType, type_deltas)
+
+    if was_open != is_open:
+        _assignees_open_changed([task.pk], is_open - was_open)
+
+
+def completion_changed(rows, completed):
+    """Bulk update for ``(task_id, task_type_id, ...)`` rows that flipped."""
+    delta = -1 if completed else 1
+
+    type_deltas = defaultdict(dict)
+    for _, task_type_id, *_ in rows:
+        _add(type_deltas, task_type_id, "open_task_count", delta)
+    apply_deltas(TaskType, type_deltas)
+
+    _assignees_open_changed([row[0] for row in rows], delta)
+
+
+def _assignees_open_changed(task_ids, delta):
+    worker_deltas = defaultdict(dict)
+    position_deltas = defaultdict(dict)
+    for worker_id, position_id in TaskAssignee.objects.filter(
+        task_id__in=task_ids
+    ).values_list("worker_id", "worker__position_id"):
+        _add(worker_deltas, worker_id, "open_task_count", delta)
+        _add(position_deltas, position_id, "open_assignment_count", delta)
+    apply_deltas(Worker, worker_deltas)
+    apply_deltas(Position, position_deltas)
+    workers_touched(list(worker_deltas))
+
+
+def worker_moved(worker, old_position_id):
+    assigned, open_tasks = Worker.objects.filter(pk=worker.pk).values_list(
+        "assigned_task_count", "open_task_count"
+    ).get()
+
+    position_deltas = defaultdict(dict)
+    _add(position_deltas, old_position_id, "assignment_count", -assigned)
+    _add(
+        position_deltas, old_position_id, "open_assignment_count", -open_tasks
+    )
+    _add(position_deltas, worker.position_id, "assignment_count", assigned)
+    _add(
+        position_deltas,
+        worker.position_id,
+        "open_assignment_count",
+        open_tasks,
+    )
+    apply_deltas(Position, position_deltas)
+
+
+def _count(queryset, field):
+    return Coalesce(
+        Subquery(
+            queryset.filter(**{field: OuterRef("pk")})
+            .order_by()
+            .values(field)
+            .annotate(total=Count("*"))
+            .values("total")
+        ),
+        Value(0),
+    )
+
+
+def expected_counters():
+    assignments = TaskAssignee.objects.all()
+    open_assignments = assignments.filter(task__is_completed=False)
+    open_tasks = Task.objects.filter(is_completed=False)
+
+    return {
+        Task: {"assignee_count": _count(assignments, "task")},
+        Worker: {
+            "assigned_task_count": _count(assignments, "worker"),
+            "open_task_count": _count(open_assignments, "worker"),
+        },
+        Position: {
+            "assignment_count": _count(assignments, "worker__position"),
+            "open_assignment_count": _count(
+                open_assignments, "worker__position"
+            ),
+        },
+        TaskType: {
+            "task_count": _count(Task.objects.all(), "task_type"),
+            "open_task_count": _count(open_tasks, "task_type"),
+        },
+    }
+
+
+def reconcile():
+    """Recompute drifted counters in bulk; returns repaired rows per model."""
+    repaired = {}
+    for model, fields in expected_counters().items():
+        drifted = Q()
+        for field, expression in fields.items():
+            drifted |= ~Q(**{field: expression})
+        repaired[model._meta.model_name] = model.objects.filter(
+            drifted
+        ).update(**fields)
+    return repaired
@@ -0,0 +1,172 @@
+import contextlib
+import contextvars
+import logging
+import random
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+from django.utils.connection import ConnectionDoesNotExist
+
+logger = logging.getLogger(__name__)
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+WRITE_STATEMENTS = ("INSERT", "UPDATE", "DELETE")
+
+_use_replica = contextvars.ContextVar("use_replica", default=False)
+
+_lag_cache = {}
+_metrics = defaultdict(lambda: {"queries": 0, "duration": 0.0})
+_metrics_lock = threading.Lock()
+
+
+def read_replica(view_func):
+    view_func.use_read_replica = True
+    return view_func
+
+
+def measure_lag(alias):
+    connection = connections[alias]
+    if connection.vendor != "postgresql":
+        return 0.0
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT CASE WHEN pg_is_in_recovery() THEN COALESCE("
+            "EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0"
+            ") ELSE 0 END"
+        )
+        return float(cursor.fetchone()[0])
+
+
+def replica_lag(alias):
+    now = time.monotonic()
+    checked_at, lag = _lag_cache.get(alias, (None, None))
+    if checked_at is not None and (
+        now - checked_at < settings.REPLICA_LAG_CHECK_INTERVAL
+    ):
+        return lag
+
+    try:
+        lag = measure_lag(alias)
+    except (DatabaseError, ConnectionDoesNotExist) as error:
+        logger.warning("Replica %s is unavailable: %s", alias, error)
+        lag = float("inf")
+    _lag_cache[alias] = (now, lag)
+    return lag
+
+
+def healthy_replicas():
+    return [
+        alias
+        for alias in settings.DATABASE_REPLICAS
+        if replica_lag(alias) <= settings.REPLICA_MAX_LAG
+    ]
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if not _use_replica.get():
+            return DEFAULT_DB_ALIAS
+        replicas = healthy_replicas()
+        if not replicas:
+            return DEFAULT_DB_ALIAS
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db not in settings.DATABASE_REPLICAS
+
+
+def query_metrics():
+    with _metrics_lock:
+        return {alias: dict(values) for alias, values in _metrics.items()}
+
+
+class QueryTimer:
+    def __init__(self, alias):
+        self.alias = alias
+        self.queries = 0
+        self.writes = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        if sql.lstrip()[:6].upper().startswith(WRITE_STATEMENTS):
+            self.writes += 1
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.duration += time.perf_counter() - start
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Send reads of views marked with ``use_read_replica`` to a replica.
+
+    Unsafe requests and requests that wrote to the database pin the client
+    to the primary for ``REPLICA_STICKY_SECONDS`` so that users always read
+    their own writes.
+    Per-alias query counts and time are added as a ``Server-Timing`` header.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = _use_replica.set(False)
+        timers = [QueryTimer(alias) for alias in connections]
+        try:
+            with contextlib.ExitStack() as stack:
+                for timer in timers:
+                    stack.enter_context(
+                        connections[timer.alias].execute_wrapper(timer)
+                    )
+                response = self.get_response(request)
+        finally:
+            _use_replica.reset(token)
+
+        self.record(response, timers)
+        if request.method not in SAFE_METHODS or any(
+            timer.writes for timer in timers
+        ):
+            response.set_cookie(
+                settings.REPLICA_PIN_COOKIE,
+                "1",
+                max_age=settings.REPLICA_STICKY_SECONDS,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view = getattr(view_func, "view_class", view_func)
+        if (
+            request.method in SAFE_METHODS
+            and getattr(view, "use_read_replica", False)
+            and settings.REPLICA_PIN_COOKIE not in request.COOKIES
+        ):
+            _use_replica.set(True)
+
+    def record(self, response, timers):
+        timings = []
+        with _metrics_lock:
+            for timer in timers:
+                if not timer.queries:
+                    continue
+                _metrics[timer.alias]["queries"] += timer.queries
+                _metrics[timer.alias]["duration"] += timer.duration
+                timings.append(
+                    f'db-{timer.alias};desc="{timer.queries} queries";'
+                    f"dur={timer.duration * 1000:.1f}"
+                )
+        if timings:
+            response.headers["Server-Timing"] = ", ".join(timings)
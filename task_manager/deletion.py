@@ -0,0 +1,178 @@
+import logging
+import threading
+
+from django.conf import settings
+from django.db import connection, transaction
+
+from task_manager import audit, counters, events
+from task_manager.models import (
+    ArchivedTask,
+    PendingDeletion,
+    Position,
+    Task,
+    TaskDailyStat,
+    TaskType,
+    Worker,
+)
+
+logger = logging.getLogger(__name__)
+
+TaskAssignee = Task.assignees.through
+ArchivedTaskAssignee = ArchivedTask.assignees.through
+
+# Dependents of each model, deleted in this order before the object itself.
+# Assignee rows go first so that the per-chunk collector never has to walk
+# the whole M2M table of a large task type or position.
+DEPENDENTS = {
+    TaskType: (
+        (
+            "task assignees",
+            lambda obj: TaskAssignee.objects.filter(task__task_type=obj),
+        ),
+        ("tasks", lambda obj: Task.objects.filter(task_type=obj)),
+        (
+            "daily stats",
+            lambda obj: TaskDailyStat.objects.filter(task_type=obj),
+        ),
+    ),
+    Position: (
+        (
+            "worker assignments",
+            lambda obj: TaskAssignee.objects.filter(worker__position=obj),
+        ),
+        (
+            "archived worker assignments",
+            lambda obj: ArchivedTaskAssignee.objects.filter(
+                worker__position=obj
+            ),
+        ),
+        ("workers", lambda obj: Worker.objects.filter(position=obj)),
+    ),
+    Worker: (
+        (
+            "worker assignments",
+            lambda obj: TaskAssignee.objects.filter(worker=obj),
+        ),
+        (
+            "archived worker assignments",
+            lambda obj: ArchivedTaskAssignee.objects.filter(worker=obj),
+        ),
+    ),
+}
+
+
+MODELS = {model._meta.model_name: model for model in DEPENDENTS}
+
+
+def mark(obj):
+    PendingDeletion.objects.get_or_create(
+        model_name=obj._meta.model_name, object_id=obj.pk
+    )
+
+
+def exclude_pending(queryset):
+    """Hide objects whose deletion has been scheduled."""
+    return queryset.exclude(
+        pk__in=PendingDeletion.objects.filter(
+            model_name=queryset.model._meta.model_name
+        ).values("object_id")
+    )
+
+
+def pending_deleters(batch_size=None, progress=None):
+    """Deleters resuming every unfinished deletion, oldest first."""
+    for job in PendingDeletion.objects.order_by("requested_at", "pk"):
+        model = MODELS.get(job.model_name)
+        obj = None
+        if model is not None:
+            obj = model.objects.filter(pk=job.object_id).first()
+        if obj is None:
+            job.delete()
+            continue
+        yield BatchDeleter(obj, batch_size=batch_size, progress=progress)
+
+
+class BatchDeleter:
+    """
+    Delete an object and its cascade in short, bounded transactions. The
+    object's ``PendingDeletion`` row is removed with it, so an interrupted
+    run can be resumed, see ``pending_deleters()``.
+    """
+
+    def __init__(self, obj, batch_size=None, progress=None):
+        self.obj = obj
+        self.batch_size = batch_size or settings.BATCH_DELETE_SIZE
+        self.progress = progress
+        self.deleted = 0
+
+    def run(self):
+        with audit.buffered():
+            for label, get_queryset in DEPENDENTS.get(type(self.obj), ()):
+                self.delete_chunked(label, get_queryset(self.obj))
+
+            job = PendingDeletion.objects.filter(
+                model_name=self.obj._meta.model_name, object_id=self.obj.pk
+            )
+            with transaction.atomic():
+                job.delete()
+                count, _ = self.obj.delete()
+        self.report(str(self.obj._meta.verbose_name), count)
+        return self.deleted
+
+    def delete_chunked(self, label, queryset):
+        model = queryset.model
+        while True:
+            with transaction.atomic():
+                # Locked, so that a resumed run racing a still running one
+                # does not count the same rows twice.
+                pks = list(
+                    queryset.select_for_update(of=("self",))
+                    .order_by("pk")
+                    .values_list("pk", flat=True)[: self.batch_size]
+                )
+                if not pks:
+                    return
+                chunk = model.objects.filter(pk__in=pks)
+                if model is TaskAssignee:
+                    # A queryset delete sends no m2m_changed signal.
+                    pairs = list(chunk.values_list("task_id", "worker_id"))
+                    counters.assignments_changed(pairs, -1)
+                    audit.assignees_changed(pairs, assigned=False)
+                    events.assignees_changed(pairs, assigned=False)
+                count, _ = chunk.delete()
+            self.report(label, count)
+
+    def report(self, label, count):
+        self.deleted += count
+        logger.info(
+            "Deleted %s %s of %s (%s rows so far)",
+            count, label, self.obj, self.deleted
+        )
+        if self.progress is not None:
+            self.progress(label, count, self.deleted)
+
+
+def _run_in_thread(deleter):
+    try:
+        deleter.run()
+    except Exception:
+        logger.exception("Batch deletion of %s failed", deleter.obj)
+    finally:
+        connection.close()
+
+
+def schedule_deletion(obj, batch_size=None):
+    mark(obj)
+    deleter = BatchDeleter(obj, batch_size=batch_size)
+
+    if not settings.BATCH_DELETE_IN_BACKGROUND:
+        return deleter.run()
+
+    thread = threading.Thread(
+        target=_run_in_thread,
+        args=(deleter,),
+        name=f"batch-delete-{obj._meta.model_name}-{obj.pk}",
+        daemon=True,
+    )
+    transaction.on_commit(thread.start)
+    return None
@@ -0,0 +1,168 @@
+"""
+Blocked-by relationships between tasks.
+
+The graph is walked in the database with recursive CTEs, so a traversal is
+a single query however deep the chain is. ``Task.is_blocked`` caches whether
+a task has an open blocker and is refreshed whenever a dependency is added
+or removed and whenever a blocker is completed, reopened or deleted.
+
+New dependencies are checked for cycles under ``lock_graph()``, in the
+transaction that inserts them, so two concurrent requests cannot each add
+one half of a cycle.
+"""
+from collections import defaultdict
+
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.db.models import Exists, OuterRef
+
+from task_manager.models import Task, TaskDependency
+
+
+class DependencyCycle(ValidationError):
+    pass
+
+
+def _chain_sql(open_only):
+    dependency = TaskDependency._meta.db_table
+    task = Task._meta.db_table
+    join = (
+        f"JOIN {task} t ON t.id = d.blocker_id AND NOT t.is_completed"
+        if open_only
+        else ""
+    )
+    return (
+        f"WITH RECURSIVE chain(task_id, blocker_id) AS ("
+        f"SELECT d.task_id, d.blocker_id FROM {dependency} d {join} "
+        f"WHERE d.task_id = %s "
+        f"UNION "
+        f"SELECT d.task_id, d.blocker_id FROM {dependency} d {join} "
+        f"JOIN chain c ON d.task_id = c.blocker_id"
+        f") SELECT task_id, blocker_id FROM chain"
+    )
+
+
+def blocker_edges(task_id, open_only=True):
+    """``(task_id, blocker_id)`` edges reachable from ``task_id``."""
+    with connection.cursor() as cursor:
+        cursor.execute(_chain_sql(open_only), [task_id])
+        return cursor.fetchall()
+
+
+def transitive_blocker_ids(task_id, open_only=True):
+    return {blocker_id for _, blocker_id in blocker_edges(task_id, open_only)}
+
+
+def transitive_blockers(task, open_only=True):
+    return Task.objects.filter(
+        pk__in=transitive_blocker_ids(task.pk, open_only)
+    )
+
+
+def would_cycle(task_id, blocker_id):
+    return task_id == blocker_id or task_id in transitive_blocker_ids(
+        blocker_id, open_only=False
+    )
+
+
+def lock_graph(pairs):
+    """
+    Serialize writers of the dependency graph until the end of the current
+    transaction. Postgres locks the dependency table against other writers,
+    readers are not blocked; elsewhere the tasks of ``pairs`` are locked.
+    """
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"LOCK TABLE {TaskDependency._meta.db_table} "
+                f"IN SHARE ROW EXCLUSIVE MODE"
+            )
+        return
+    task_ids = {pk for pair in pairs for pk in pair}
+    list(
+        Task.objects.select_for_update()
+        .filter(pk__in=task_ids)
+        .order_by("pk")
+        .values_list("pk", flat=True)
+    )
+
+
+def check_cycles(pairs):
+    """Raise ``DependencyCycle`` if adding ``(task_id, blocker_id)`` loops."""
+    for task_id, blocker_id in pairs:
+        if would_cycle(task_id, blocker_id):
+            raise DependencyCycle(
+                "Task %(task)s already blocks task %(blocker)s.",
+                code="cycle",
+                params={"task": task_id, "blocker": blocker_id},
+            )
+
+
+def critical_path(task):
+    """
+    The longest chain of open blockers in front of ``task``, starting with
+    the task to work on first.
+    """
+    blockers = defaultdict(list)
+    for task_id, blocker_id in blocker_edges(task.pk):
+        blockers[task_id].append(blocker_id)
+
+    # The stack is the current path. A blocker already on it closes a cycle,
+    # which dependencies added behind check_cycles' back could form, and is
+    # not followed.
+    depth, via = {}, {}
+    stack, on_stack = [task.pk], {task.pk}
+    while stack:
+        node = stack[-1]
+        pending = next(
+            (
+                pk
+                for pk in blockers[node]
+                if pk not in depth and pk not in on_stack
+            ),
+            None,
+        )
+        if pending is not None:
+            stack.append(pending)
+            on_stack.add(pending)
+            continue
+        stack.pop()
+        on_stack.discard(node)
+        done = [pk for pk in blockers[node] if pk in depth]
+        best = max(done, key=depth.__getitem__, default=None)
+        depth[node] = 0 if best is None else depth[best] + 1
+        via[node] = best
+
+    path = []
+    node = via[task.pk]
+    while node is not None:
+        path.append(node)
+        node = via[node]
+    path.reverse()
+    tasks = Task.objects.in_bulk(path)
+    return [tasks[pk] for pk in path]
+
+
+def dependent_ids(task_ids):
+    return list(
+        TaskDependency.objects.filter(blocker_id__in=task_ids)
+        .values_list("task_id", flat=True)
+        .distinct()
+    )
+
+
+def refresh_blocked(task_ids):
+    task_ids = list(task_ids)
+    if not task_ids:
+        return 0
+    return Task.objects.filter(pk__in=task_ids).update(
+        is_blocked=Exists(
+            TaskDependency.objects.filter(
+                task=OuterRef("pk"), blocker__is_completed=False
+            )
+        )
+    )
+
+
+def completion_changed(task_ids):
+    refresh_blocked(dependent_ids(task_ids))
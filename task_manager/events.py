@@ -0,0 +1,200 @@
+"""
+Live task change events for the Server-Sent Events stream.
+
+Events are published once their transaction commits. Each process keeps an
+in-process broker that feeds its open streams; on Postgres events are sent
+with ``NOTIFY`` instead and every process relays its ``LISTEN`` channel to
+the local broker, so streams served by any worker see every change.
+
+The stream is an async view served through ``asgi.py``, which
+``gunicorn.conf.py`` runs with uvicorn workers. Under WSGI every
+open stream would hold a whole worker, so pages only subscribe to it when
+they are served through ASGI themselves, and the view answers 204, which
+stops ``EventSource`` from reconnecting, to anything else.
+"""
+import asyncio
+import functools
+import json
+import logging
+import select
+import threading
+import time
+
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, connections, transaction
+from django.urls import reverse
+
+logger = logging.getLogger(__name__)
+
+
+def _put(queue, payload):
+    try:
+        queue.put_nowait(payload)
+    except asyncio.QueueFull:
+        # Slow clients miss events rather than holding up everyone else.
+        pass
+
+
+class Broker:
+    def __init__(self):
+        self._subscribers = set()
+        self._lock = threading.Lock()
+
+    def subscribe(self):
+        queue = asyncio.Queue(maxsize=settings.TASK_EVENTS_QUEUE_SIZE)
+        subscriber = (asyncio.get_running_loop(), queue)
+        with self._lock:
+            self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def publish(self, payload):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(_put, queue, payload)
+            except RuntimeError:
+                self.unsubscribe((loop, queue))
+
+
+broker = Broker()
+
+
+class PostgresListener(threading.Thread):
+    def __init__(self):
+        super().__init__(name="task-events-listener", daemon=True)
+
+    def run(self):
+        while True:
+            try:
+                self.listen()
+            except Exception:
+                logger.exception("Task event listener failed, reconnecting")
+                time.sleep(5)
+
+    def listen(self):
+        db = connections.create_connection("default")
+        try:
+            db.ensure_connection()
+            db.set_autocommit(True)
+            raw = db.connection
+            with db.cursor() as cursor:
+                cursor.execute(f"LISTEN {settings.TASK_EVENTS_CHANNEL}")
+            while True:
+                if select.select([raw], [], [], 60) == ([], [], []):
+                    continue
+                raw.poll()
+                while raw.notifies:
+                    broker.publish(raw.notifies.pop(0).payload)
+        finally:
+            db.close()
+
+
+_listener = None
+_listener_lock = threading.Lock()
+
+
+def _uses_notify():
+    return connection.vendor == "postgresql"
+
+
+def ensure_listener():
+    global _listener
+    if not _uses_notify():
+        return
+    with _listener_lock:
+        if _listener is None:
+            _listener = PostgresListener()
+            _listener.start()
+
+
+def send(events):
+    payloads = [json.dumps(event, cls=DjangoJSONEncoder) for event in events]
+    if _uses_notify():
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_notify(%s, payload) "
+                "FROM unnest(%s::text[]) WITH ORDINALITY AS p(payload, n) "
+                "ORDER BY n",
+                [settings.TASK_EVENTS_CHANNEL, payloads],
+            )
+    else:
+        for payload in payloads:
+            broker.publish(payload)
+
+
+def publish(event):
+    publish_many([event])
+
+
+def publish_many(events):
+    """Send ``events`` once the transaction commits, in one query."""
+    events = list(events)
+    if events:
+        transaction.on_commit(functools.partial(send, events))
+
+
+def task_saved(task, created):
+    publish(
+        {
+            "id": task.pk,
+            "action": "created" if created else "updated",
+            "name": task.name,
+            "deadline": task.deadline,
+            "is_completed": task.is_completed,
+            "priority": task.priority,
+            "priority_display": task.get_priority_display(),
+        }
+    )
+
+
+def task_deleted(task):
+    publish({"id": task.pk, "action": "deleted"})
+
+
+def assignees_changed(pairs, assigned):
+    workers = {}
+    for task_id, worker_id in pairs:
+        workers.setdefault(task_id, []).append(worker_id)
+    publish_many(
+        {
+            "id": task_id,
+            "action": "assigned" if assigned else "unassigned",
+            "workers": sorted(worker_ids),
+        }
+        for task_id, worker_ids in workers.items()
+    )
+
+
+def is_streamable(request):
+    return isinstance(request, ASGIRequest)
+
+
+def stream_url(request):
+    if is_streamable(request):
+        return reverse("task-manager:task-events")
+    return None
+
+
+async def stream(heartbeat=None):
+    if heartbeat is None:
+        heartbeat = settings.TASK_EVENTS_HEARTBEAT
+    subscriber = broker.subscribe()
+    _, queue = subscriber
+    try:
+        yield "retry: 5000\n\n"
+        while True:
+            try:
+                payload = await asyncio.wait_for(queue.get(), heartbeat)
+            except TimeoutError:
+                yield ": ping\n\n"
+                continue
+            yield f"event: task\ndata: {payload}\n\n"
+    finally:
+        broker.unsubscribe(subscriber)
@@ -1,8 +1,10 @@
 from django import forms
 from django.contrib.auth import get_user_model
 from django.contrib.auth.forms import UserCreationForm
+from django.urls import reverse_lazy
 
-from task_manager.models import Worker, Task
+from task_manager import dependencies
+from task_manager.models import Position, Task, TaskType, Worker
 
 
 class WorkerCreationForm(UserCreationForm):
@@ -21,10 +23,52 @@ class WorkerPositionUpdateForm(forms.ModelForm):
         fields = ["position"]
 
 
+class TaskAutocomplete(forms.SelectMultiple):
+    """
+    Render only the selected tasks as options. static/js/task_autocomplete.js
+    adds others from the typeahead endpoint while the user types, so the
+    form never loads the whole task table.
+    """
+
+    def __init__(self, attrs=None):
+        url = reverse_lazy("task-manager:typeahead-api")
+        super().__init__({"data-autocomplete": url, **(attrs or {})})
+
+    def optgroups(self, name, value, attrs=None):
+        # An empty pk__in list returns no rows without a query.
+        tasks = self.choices.queryset.filter(
+            pk__in=[pk for pk in value if str(pk).isdigit()]
+        )
+        options = [
+            self.create_option(
+                name,
+                task.pk,
+                self.choices.field.label_from_instance(task),
+                True,
+                index,
+                attrs=attrs,
+            )
+            for index, task in enumerate(tasks)
+        ]
+        return [(None, options, 0)]
+
+
 class TaskForm(forms.ModelForm):
     assignees = forms.ModelMultipleChoiceField(
         queryset=get_user_model().objects.all(),
         widget=forms.CheckboxSelectMultiple,
+        required=False,
+    )
+    blocked_by = forms.ModelMultipleChoiceField(
+        queryset=Task.objects.order_by("name"),
+        widget=TaskAutocomplete,
+        required=False,
+    )
+    auto_assign = forms.ModelChoiceField(
+        queryset=Position.objects.order_by("name"),
+        required=False,
+        empty_label="Don't auto-assign",
+        label="Auto-assign to the least busy worker of",
     )
     deadline = forms.DateTimeField(
         input_formats=["%Y-%m-%dT%H:%M"],
@@ -43,9 +87,40 @@ class TaskForm(forms.ModelForm):
 
         if not (self.instance and self.instance.pk):
             del self.fields["is_completed"]
+        else:
+            del self.fields["auto_assign"]
+            self.fields["blocked_by"].queryset = Task.objects.exclude(
+                pk=self.instance.pk
+            ).order_by("name")
+        self.fields["blocked_by"].label_from_instance = lambda task: task.name
+
+    def clean(self):
+        cleaned_data = super().clean()
+        if not cleaned_data.get("assignees") and not cleaned_data.get(
+            "auto_assign"
+        ):
+            self.add_error(
+                "assignees",
+                "Choose assignees or a position to auto-assign from.",
+            )
+        return cleaned_data
+
+    def clean_blocked_by(self):
+        blockers = self.cleaned_data["blocked_by"]
+        if self.instance.pk:
+            dependencies.check_cycles(
+                (self.instance.pk, blocker.pk) for blocker in blockers
+            )
+        return blockers
 
 
 class WorkerSearchUsernameForm(forms.Form):
+    SORT_CHOICES = (
+        ("username", "Username"),
+        ("workload", "Most open tasks"),
+        ("idle", "Fewest open tasks"),
+    )
+
     username = forms.CharField(
         max_length=255,
         required=False,
@@ -56,6 +131,16 @@ class WorkerSearchUsernameForm(forms.Form):
             }
         )
     )
+    sort = forms.ChoiceField(
+        choices=SORT_CHOICES,
+        required=False,
+        widget=forms.HiddenInput,
+    )
+    max_open_tasks = forms.IntegerField(
+        min_value=0,
+        required=False,
+        widget=forms.HiddenInput,
+    )
 
 
 class TaskSearchNameForm(forms.Form):
@@ -69,3 +154,52 @@ class TaskSearchNameForm(forms.Form):
             }
         )
     )
+
+
+class TaskFilterForm(TaskSearchNameForm):
+    STATUS_CHOICES = (
+        ("", "Any status"),
+        ("open", "In work"),
+        ("actionable", "Actionable"),
+        ("done", "Done"),
+    )
+    SORT_CHOICES = (
+        ("deadline", "Deadline (soonest)"),
+        ("-deadline", "Deadline (latest)"),
+        ("priority", "Most urgent"),
+        ("name", "Name (A-Z)"),
+        ("-name", "Name (Z-A)"),
+    )
+
+    status = forms.ChoiceField(choices=STATUS_CHOICES, required=False)
+    priority = forms.ChoiceField(
+        choices=(("", "Any priority"),) + tuple(Task.LevelPriority.choices),
+        required=False,
+    )
+    task_type = forms.ModelChoiceField(
+        queryset=TaskType.objects.order_by("name"),
+        required=False,
+        empty_label="Any type",
+    )
+    assignee = forms.ModelChoiceField(
+        queryset=get_user_model()
+        .objects.only("username", "first_name", "last_name")
+        .order_by("username"),
+        required=False,
+        empty_label="Anyone",
+    )
+    deadline_after = forms.DateField(
+        required=False,
+        widget=forms.DateInput(attrs={"type": "date"}),
+    )
+    deadline_before = forms.DateField(
+        required=False,
+        widget=forms.DateInput(attrs={"type": "date"}),
+    )
+    sort = forms.ChoiceField(choices=SORT_CHOICES, required=False)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        for name, field in self.fields.items():
+            if name != "name":
+                field.widget.attrs["class"] = "form-control"
@@ -0,0 +1,135 @@
+"""
+Per-worker iCalendar feeds of open task deadlines.
+
+Calendar apps poll feeds every few minutes, so a feed is validated with a
+single query for the worker's ``assignment_version``, which every change to
+their open tasks bumps (see ``counters.workers_touched``). Unchanged feeds are
+answered with 304 and changed ones are streamed from one projected query.
+"""
+import datetime
+
+from django.core import signing
+from django.urls import reverse
+
+from task_manager.models import Task, Worker
+
+SALT = "task_manager.ical"
+
+# Changes to these fields of an assigned task change the feed; completion is
+# covered by the open task counters.
+FEED_FIELDS = ("name", "description", "deadline", "priority")
+
+# iCalendar priorities run from 1 (highest) to 9 (lowest).
+PRIORITIES = {1: 1, 2: 3, 3: 5, 4: 9}
+
+PRODID = "-//IT Company Task Manager//Deadlines//EN"
+
+CHUNK_SIZE = 500
+
+
+def feed_token(worker):
+    return signing.Signer(salt=SALT).sign(str(worker.pk))
+
+
+def feed_url(worker):
+    return reverse(
+        "task-manager:task-calendar", kwargs={"token": feed_token(worker)}
+    )
+
+
+def worker_id(token):
+    try:
+        return int(signing.Signer(salt=SALT).unsign(token))
+    except (signing.BadSignature, ValueError):
+        return None
+
+
+def feed_state(pk):
+    """``(version, last modified)`` of an active worker's feed, or None."""
+    state = (
+        Worker.objects.filter(pk=pk, is_active=True)
+        .values_list(
+            "assignment_version", "assignments_changed_at", "date_joined"
+        )
+        .first()
+    )
+    if state is None:
+        return None
+    version, changed_at, date_joined = state
+    return version, changed_at or date_joined
+
+
+def etag(pk, version):
+    return f'"{pk}-{version}"'
+
+
+def feed_tasks(pk):
+    return (
+        Task.objects.filter(
+            assignees=pk, is_completed=False, deadline__isnull=False
+        )
+        .order_by("deadline", "pk")
+        .values_list("pk", "name", "description", "deadline", "priority_rank")
+    )
+
+
+def format_datetime(value):
+    return value.astimezone(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def escape(text):
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def fold(line):
+    """Split ``line`` into CRLF-terminated lines of at most 75 octets."""
+    encoded = line.encode()
+    if len(encoded) <= 75:
+        return line + "\r\n"
+    parts = []
+    limit = 75
+    while encoded:
+        cut = min(limit, len(encoded))
+        # Never split a multi-byte character.
+        while cut < len(encoded) and encoded[cut] & 0xC0 == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode())
+        encoded = encoded[cut:]
+        limit = 74
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def event(row, stamp, url_prefix=""):
+    pk, name, description, deadline, priority_rank = row
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:task-{pk}@task-manager",
+        f"DTSTAMP:{stamp}",
+        f"DTSTART:{format_datetime(deadline)}",
+        f"SUMMARY:{escape(name)}",
+        f"PRIORITY:{PRIORITIES.get(priority_rank, 0)}",
+        f"URL:{url_prefix}"
+        + reverse("task-manager:task-detail", kwargs={"pk": pk}),
+    ]
+    if description:
+        lines.append(f"DESCRIPTION:{escape(description)}")
+    lines.append("END:VEVENT")
+    return "".join(fold(line) for line in lines)
+
+
+def stream(pk, last_modified, url_prefix=""):
+    stamp = format_datetime(last_modified)
+    yield fold("BEGIN:VCALENDAR")
+    yield fold("VERSION:2.0")
+    yield fold(f"PRODID:{PRODID}")
+    yield fold("CALSCALE:GREGORIAN")
+    yield fold("X-WR-CALNAME:Task deadlines")
+    for row in feed_tasks(pk).iterator(chunk_size=CHUNK_SIZE):
+        yield event(row, stamp, url_prefix)
+    yield fold("END:VCALENDAR")
@@ -0,0 +1,44 @@
+"""
+Jinja2 environment of the templates in jinja2/, used when
+``PAGE_TEMPLATE_ENGINE`` is "jinja2".
+
+Compiled templates stay in the environment's cache and, as Django sets
+``auto_reload`` from ``DEBUG``, are not checked for changes in production.
+``JINJA2_BYTECODE_CACHE_DIR`` additionally shares them between processes.
+Rows link to detail pages through ``detail_url_prefix`` reversed once per
+page instead of a reversal per row.
+"""
+from django.conf import settings
+from django.template import defaultfilters
+from django.templatetags.static import static
+from django.urls import reverse
+from django.utils.timezone import template_localtime
+from jinja2 import Environment, FileSystemBytecodeCache
+
+from task_manager.templatetags.query_transform import query_transform
+from task_manager.typeahead import detail_url_prefix
+
+
+def date(value, arg=None):
+    return defaultfilters.date(template_localtime(value), arg)
+
+
+def url(name, *args, **kwargs):
+    return reverse(name, args=args or None, kwargs=kwargs or None)
+
+
+def environment(**options):
+    if settings.JINJA2_BYTECODE_CACHE_DIR:
+        options.setdefault(
+            "bytecode_cache",
+            FileSystemBytecodeCache(str(settings.JINJA2_BYTECODE_CACHE_DIR)),
+        )
+    env = Environment(**options)
+    env.globals.update(
+        detail_url_prefix=detail_url_prefix,
+        query_transform=query_transform,
+        static=static,
+        url=url,
+    )
+    env.filters["date"] = date
+    return env
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from task_manager.archive import archive_completed_tasks
+
+
+class Command(BaseCommand):
+    help = "Move tasks completed more than N days ago to the archive."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=None)
+        parser.add_argument("--batch-size", type=int, default=None)
+
+    def handle(self, *args, **options):
+        def progress(count, total):
+            self.stdout.write(f"Archived {count} tasks ({total} so far)")
+
+        total = archive_completed_tasks(
+            days=options["days"],
+            batch_size=options["batch_size"],
+            progress=progress,
+        )
+        self.stdout.write(self.style.SUCCESS(f"Archived {total} tasks"))
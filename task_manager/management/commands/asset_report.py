@@ -0,0 +1,90 @@
+import gzip
+import posixpath
+import re
+from html.parser import HTMLParser
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.staticfiles import finders
+from django.core.management.base import BaseCommand
+from django.template.loader import render_to_string
+from django.test import RequestFactory
+
+PAGES = {
+    "index": "task_manager/index.html",
+    "tasks": "task_manager/task_list.html",
+    "login": "registration/login.html",
+}
+
+FONT_URL_RE = re.compile(r"url\(\s*[\"']?([^\"')]+\.woff2)")
+
+
+class AssetParser(HTMLParser):
+    def __init__(self):
+        super().__init__()
+        self.assets = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "script" and attrs.get("src"):
+            self.assets.append(attrs["src"])
+        elif tag == "link" and attrs.get("rel") == "stylesheet":
+            self.assets.append(attrs["href"])
+
+
+def static_path(url):
+    prefix = "/" + settings.STATIC_URL.lstrip("/")
+    url = url.split("?")[0].split("#")[0]
+    if url.startswith(prefix):
+        return url[len(prefix):]
+    return None
+
+
+def read_static(path):
+    found = finders.find(path)
+    if found is None:
+        return None
+    with open(found, "rb") as file:
+        return file.read()
+
+
+def page_assets(html):
+    parser = AssetParser()
+    parser.feed(html)
+    for url in parser.assets:
+        path = static_path(url)
+        content = read_static(path) if path else None
+        yield url, content
+        if path and path.endswith(".css") and content is not None:
+            # Count the web fonts the stylesheet declares.
+            for font in FONT_URL_RE.findall(content.decode()):
+                if font.startswith("data:"):
+                    continue
+                font_path = posixpath.normpath(
+                    posixpath.join(posixpath.dirname(path), font)
+                )
+                yield font_path, read_static(font_path)
+
+
+class Command(BaseCommand):
+    help = "Report static asset requests and bytes of the main pages."
+
+    def handle(self, *args, **options):
+        request = RequestFactory().get("/")
+        request.user = AnonymousUser()
+
+        for page, template in PAGES.items():
+            html = render_to_string(template, request=request)
+            local = external = raw = compressed = 0
+            for url, content in page_assets(html):
+                if content is None:
+                    external += 1
+                    continue
+                local += 1
+                raw += len(content)
+                compressed += len(gzip.compress(content))
+            self.stdout.write(
+                f"{page}: {local + external} requests "
+                f"({external} third-party), {raw / 1024:.0f} KiB local, "
+                f"{compressed / 1024:.0f} KiB gzipped"
+            )
@@ -0,0 +1,58 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from task_manager.assignment import auto_assign
+from task_manager.models import Position, Task, TaskType, Worker
+
+
+class Command(BaseCommand):
+    help = (
+        "Time auto-assigning N new tasks across M workers. The data is "
+        "created in a transaction that is rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tasks", type=int, default=10000)
+        parser.add_argument("--workers", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            position = Position.objects.create(name="Auto-assign benchmark")
+            task_type = TaskType.objects.create(name="Auto-assign benchmark")
+            Worker.objects.bulk_create(
+                Worker(
+                    username=f"auto-assign-benchmark-{i}",
+                    position=position,
+                    open_task_count=i % 7,
+                )
+                for i in range(options["workers"])
+            )
+            task_ids = [
+                task.pk
+                for task in Task.objects.bulk_create(
+                    Task(
+                        name=f"Auto-assign benchmark {i}",
+                        task_type=task_type,
+                    )
+                    for i in range(options["tasks"])
+                )
+            ]
+
+            start = time.perf_counter()
+            pairs = auto_assign(task_ids, position)
+            elapsed = time.perf_counter() - start
+
+            loads = list(
+                Worker.objects.filter(position=position).values_list(
+                    "open_task_count", flat=True
+                )
+            )
+            transaction.set_rollback(True)
+
+        self.stdout.write(
+            f"Assigned {len(pairs)} tasks across {len(loads)} workers in "
+            f"{elapsed:.2f}s; open tasks per worker now "
+            f"{min(loads)}-{max(loads)}"
+        )
@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from task_manager.assignment import NoEligibleWorkers, auto_assign
+from task_manager.models import Position, Task
+
+
+class Command(BaseCommand):
+    help = "Assign open tasks without assignees to the least-loaded workers."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--position",
+            type=int,
+            default=None,
+            help="Only assign workers holding this position id.",
+        )
+        parser.add_argument("--per-task", type=int, default=1)
+        parser.add_argument(
+            "--task-type",
+            type=int,
+            default=None,
+            help="Only assign tasks of this task type id.",
+        )
+
+    def handle(self, *args, **options):
+        position = None
+        if options["position"] is not None:
+            try:
+                position = Position.objects.get(pk=options["position"])
+            except Position.DoesNotExist:
+                raise CommandError(f"Unknown position {options['position']}")
+
+        tasks = Task.objects.filter(is_completed=False, assignee_count=0)
+        if options["task_type"] is not None:
+            tasks = tasks.filter(task_type_id=options["task_type"])
+
+        try:
+            pairs = auto_assign(
+                tasks.order_by("priority_rank", "deadline", "pk").values_list(
+                    "pk", flat=True
+                ),
+                position,
+                options["per_task"],
+            )
+        except NoEligibleWorkers as error:
+            raise CommandError(str(error))
+        self.stdout.write(
+            self.style.SUCCESS(f"Created {len(pairs)} assignments")
+        )
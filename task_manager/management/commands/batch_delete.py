@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from task_manager.deletion import (
+    MODELS,
+    BatchDeleter,
+    mark,
+    pending_deleters,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete a task type, position or worker in small batches. Without "
+        "arguments, resume every deletion that was interrupted, e.g. by a "
+        "restarted web worker."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("model", nargs="?", choices=sorted(MODELS))
+        parser.add_argument("pk", nargs="?", type=int)
+        parser.add_argument("--batch-size", type=int, default=None)
+
+    def handle(self, *args, **options):
+        def progress(label, count, total):
+            self.stdout.write(f"{label}: -{count} ({total} rows deleted)")
+
+        if options["model"] is None:
+            deleters = pending_deleters(options["batch_size"], progress)
+        elif options["pk"] is None:
+            raise CommandError(f"Pass the pk of the {options['model']}.")
+        else:
+            model = MODELS[options["model"]]
+            try:
+                obj = model.objects.get(pk=options["pk"])
+            except model.DoesNotExist:
+                raise CommandError(
+                    f"{model._meta.verbose_name} {options['pk']} "
+                    f"does not exist"
+                )
+            mark(obj)
+            deleters = [
+                BatchDeleter(
+                    obj, batch_size=options["batch_size"], progress=progress
+                )
+            ]
+
+        for deleter in deleters:
+            total = deleter.run()
+            self.stdout.write(
+                self.style.SUCCESS(f"Deleted {deleter.obj} ({total} rows)")
+            )
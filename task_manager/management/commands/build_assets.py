@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from task_manager.assets import AssetNotFound, build_bundles
+
+
+class Command(BaseCommand):
+    help = "Concatenate the static asset bundles listed in ASSET_BUNDLES."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Fail instead of writing when a bundle is out of date.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            bundles = build_bundles()
+        except AssetNotFound as error:
+            raise CommandError(error)
+
+        stale = [path for path, (_, changed) in bundles.items() if changed]
+        if options["check"]:
+            if stale:
+                raise CommandError(
+                    "Out of date: " + ", ".join(str(path) for path in stale)
+                )
+            return
+
+        for path in stale:
+            content, _ = bundles[path]
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content, encoding="utf-8")
+            self.stdout.write(f"Wrote {path} ({len(content) // 1024} KiB)")
+        self.stdout.write(
+            self.style.SUCCESS(f"{len(bundles)} bundles up to date")
+        )
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from task_manager.task_filters import (
+    ORDERINGS,
+    sample_filters,
+    unindexed_combinations,
+)
+
+
+class Command(BaseCommand):
+    help = "Check that every task board filter and sort uses an index."
+
+    def handle(self, *args, **options):
+        missing = unindexed_combinations()
+        checked = (len(sample_filters()) + 1) * len(ORDERINGS)
+        for name, sort in missing:
+            self.stderr.write(f"Full table scan: filter={name} sort={sort}")
+        if missing:
+            raise CommandError(
+                f"{len(missing)} of {checked} combinations are not indexed"
+            )
+        self.stdout.write(f"All {checked} combinations use an index")
@@ -0,0 +1,34 @@
+from django.conf import settings
+from django.contrib.sessions.models import Session
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete expired database sessions in small batches, e.g. hourly "
+        "from cron, so the session table stays bounded without long locks."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=None)
+
+    def handle(self, *args, **options):
+        batch_size = (
+            options["batch_size"] or settings.SESSION_CLEANUP_BATCH_SIZE
+        )
+        expired = Session.objects.filter(expire_date__lt=timezone.now())
+        total = 0
+
+        while True:
+            keys = list(
+                expired.values_list("session_key", flat=True)[:batch_size]
+            )
+            if not keys:
+                break
+            count, _ = Session.objects.filter(session_key__in=keys).delete()
+            total += count
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Deleted {total} expired sessions")
+        )
@@ -0,0 +1,106 @@
+import datetime
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+from task_manager import compression, ical
+from task_manager.models import Position, Task, TaskType, Worker
+
+
+class Command(BaseCommand):
+    help = (
+        "Report the bytes saved and the CPU time spent per response for "
+        "every available encoding on a sample of pages. The data is created "
+        "in a transaction that is rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tasks", type=int, default=200)
+        parser.add_argument("--repeat", type=int, default=50)
+
+    def pages(self, worker):
+        return {
+            "task list": (reverse("task-manager:task-list"), {}),
+            "task list (partial)": (
+                reverse("task-manager:task-list"),
+                {"X-Partial": "list"},
+            ),
+            "worker list": (reverse("task-manager:worker-list"), {}),
+            "task board": (reverse("task-manager:task-board"), {}),
+            "next tasks API": (reverse("task-manager:next-tasks-api"), {}),
+            "calendar feed": (ical.feed_url(worker), {}),
+        }
+
+    def host(self):
+        # With DEBUG and no ALLOWED_HOSTS, Django accepts localhost.
+        for host in settings.ALLOWED_HOSTS:
+            if host != "*" and not host.startswith("."):
+                return host
+        return "localhost"
+
+    def fetch(self, client, url, headers):
+        # Without Accept-Encoding the middleware leaves the body as it is.
+        response = client.get(url, headers=headers)
+        if response.status_code != 200:
+            raise CommandError(f"{url} returned {response.status_code}")
+        if response.streaming:
+            return list(response.streaming_content)
+        return [response.content]
+
+    def measure(self, chunks, encoder_class, repeat):
+        start = time.process_time()
+        for _ in range(repeat):
+            size = sum(
+                len(data)
+                for data in compression.compress_stream(chunks, encoder_class)
+            )
+        return size, (time.process_time() - start) / repeat
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            position = Position.objects.create(name="Compression benchmark")
+            task_type = TaskType.objects.create(name="Compression benchmark")
+            worker = Worker.objects.create_user(
+                username="compression-benchmark", position=position
+            )
+            tasks = Task.objects.bulk_create(
+                Task(
+                    name=f"Compression benchmark {i}",
+                    description=f"Sample description of task {i}.",
+                    task_type=task_type,
+                    deadline=timezone.now()
+                    + datetime.timedelta(days=i % 30),
+                )
+                for i in range(options["tasks"])
+            )
+            worker.assigned_tasks.add(*tasks)
+
+            client = Client(HTTP_HOST=self.host())
+            client.force_login(worker)
+            bodies = {
+                name: self.fetch(client, url, headers)
+                for name, (url, headers) in self.pages(worker).items()
+            }
+            transaction.set_rollback(True)
+
+        for name, chunks in bodies.items():
+            raw = sum(len(chunk) for chunk in chunks)
+            results = []
+            for encoding, encoder_class in compression.ENCODERS.items():
+                size, cpu = self.measure(
+                    chunks, encoder_class, options["repeat"]
+                )
+                saved = 100 * (raw - size) / raw if raw else 0
+                results.append(
+                    f"{encoding} {size} bytes ({saved:.0f}% saved, "
+                    f"{cpu * 1000:.2f}ms CPU)"
+                )
+            self.stdout.write(
+                f"{name}: {raw} bytes in {len(chunks)} chunk(s); "
+                + "; ".join(results)
+            )
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from task_manager.recurrence import materialize
+
+
+class Command(BaseCommand):
+    help = "Create the upcoming tasks of the recurring task templates."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=None)
+        parser.add_argument("--batch-size", type=int, default=None)
+
+    def handle(self, *args, **options):
+        def progress(count, total):
+            self.stdout.write(f"Created {count} tasks ({total} so far)")
+
+        total = materialize(
+            days=options["days"],
+            batch_size=options["batch_size"],
+            progress=progress,
+        )
+        self.stdout.write(self.style.SUCCESS(f"Created {total} tasks"))
@@ -0,0 +1,116 @@
+import datetime
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from task_manager.models import Position, Task, TaskType, Worker
+from task_manager.read_models import TaskRow, WorkerRow, as_rows, format_date
+
+
+def task_models(limit):
+    tasks = list(Task.objects.order_by("deadline", "pk")[:limit])
+    for task in tasks:
+        # What the list template used to compute for every row.
+        task.get_priority_display()
+        format_date(task.deadline)
+    return tasks
+
+
+def task_rows(limit):
+    return list(
+        as_rows(Task.objects.order_by("deadline", "pk"), TaskRow)[:limit]
+    )
+
+
+def worker_models(limit):
+    workers = list(
+        Worker.objects.select_related("position").order_by("username")[
+            :limit
+        ]
+    )
+    for worker in workers:
+        str(worker.position)
+    return workers
+
+
+def worker_rows(limit):
+    return list(
+        as_rows(Worker.objects.order_by("username"), WorkerRow)[:limit]
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare time and memory per 1,000 list rows of model instances "
+        "and of the read model rows. The data is created in a transaction "
+        "that is rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1000)
+        parser.add_argument("--repeat", type=int, default=20)
+        parser.add_argument(
+            "--description-size",
+            type=int,
+            default=2000,
+            help="Characters of every task description.",
+        )
+
+    def measure(self, load, limit, repeat):
+        load(limit)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            load(limit)
+        elapsed = (time.perf_counter() - start) / repeat
+
+        tracemalloc.start()
+        rows = load(limit)
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        scale = 1000 / max(len(rows), 1)
+        return elapsed * 1000 * scale, size / 1024 * scale
+
+    def handle(self, *args, **options):
+        limit = options["rows"]
+        with transaction.atomic():
+            position = Position.objects.create(name="List rows benchmark")
+            task_type = TaskType.objects.create(name="List rows benchmark")
+            Worker.objects.bulk_create(
+                Worker(
+                    username=f"list-rows-benchmark-{i}",
+                    first_name="List",
+                    last_name=f"Benchmark {i}",
+                    password="pbkdf2_sha256$1000000$" + "x" * 66,
+                    position=position,
+                )
+                for i in range(limit)
+            )
+            now = timezone.now()
+            Task.objects.bulk_create(
+                Task(
+                    name=f"List rows benchmark {i}",
+                    description="x" * options["description_size"],
+                    task_type=task_type,
+                    deadline=now + datetime.timedelta(hours=i),
+                )
+                for i in range(limit)
+            )
+
+            results = {
+                name: self.measure(load, limit, options["repeat"])
+                for name, load in (
+                    ("tasks, model instances", task_models),
+                    ("tasks, read model rows", task_rows),
+                    ("workers, model instances", worker_models),
+                    ("workers, read model rows", worker_rows),
+                )
+            }
+            transaction.set_rollback(True)
+
+        for name, (elapsed, memory) in results.items():
+            self.stdout.write(
+                f"{name}: {elapsed:.2f}ms and {memory:.0f} KiB per 1,000 rows"
+            )
@@ -0,0 +1,92 @@
+import datetime
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from task_manager import partitioning
+from task_manager.models import Task
+
+
+class Command(BaseCommand):
+    help = (
+        "Manage native Postgres partitions of the task table. Run "
+        "\"extend\" on every deploy and from a monthly cron job, so the "
+        "partitions of the coming months exist before tasks are due in them."
+    )
+
+    def add_arguments(self, parser):
+        subparsers = parser.add_subparsers(dest="action", required=True)
+
+        convert = subparsers.add_parser("convert")
+        convert.add_argument(
+            "--scheme",
+            choices=partitioning.SCHEMES,
+            default=settings.TASK_PARTITIONING,
+        )
+        convert.add_argument("--dry-run", action="store_true")
+
+        extend = subparsers.add_parser("extend")
+        extend.add_argument("--months", type=int, default=None)
+
+        subparsers.add_parser("check")
+        subparsers.add_parser("explain")
+
+    def handle(self, *args, **options):
+        action = options["action"]
+
+        if action == "convert" and options["dry_run"]:
+            schema = None
+            if partitioning.is_supported():
+                schema = partitioning.table_schema()
+            for statement in partitioning.conversion_sql(
+                options["scheme"], schema=schema
+            ):
+                self.stdout.write(f"{statement};")
+            return
+
+        if action == "extend":
+            # A no-op unless the table is partitioned by deadline, so it can
+            # run on every deploy.
+            for statement in partitioning.create_future_partitions(
+                options["months"]
+            ):
+                self.stdout.write(statement)
+            return
+
+        if not partitioning.is_supported():
+            raise CommandError("Task partitioning requires PostgreSQL.")
+
+        if action == "convert":
+            if partitioning.is_partitioned():
+                raise CommandError("The task table is already partitioned.")
+            if not options["scheme"]:
+                raise CommandError("Pass --scheme or set TASK_PARTITIONING.")
+            partitioning.convert(options["scheme"])
+            self.stdout.write(self.style.SUCCESS("Task table partitioned"))
+        elif action == "check":
+            if not partitioning.is_partitioned():
+                raise CommandError("The task table is not partitioned.")
+            problems = partitioning.integrity_problems()
+            if problems:
+                raise CommandError("; ".join(problems))
+            self.stdout.write(self.style.SUCCESS("No integrity problems"))
+        else:
+            self.explain()
+
+    def explain(self):
+        now = timezone.now()
+        querysets = {
+            "index: completed": Task.objects.filter(is_completed=True),
+            "index: overdue": Task.objects.filter(
+                is_completed=False, deadline__lt=now
+            ),
+            "task list: open": Task.objects.filter(is_completed=False),
+            "task list: due this week": Task.objects.filter(
+                deadline__gte=now,
+                deadline__lt=now + datetime.timedelta(days=7),
+            ),
+        }
+        for label, queryset in querysets.items():
+            partitions = partitioning.scanned_partitions(queryset)
+            self.stdout.write(f"{label}: {', '.join(partitions) or '-'}")
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from task_manager.analytics import rebuild_daily_stats
+
+
+class Command(BaseCommand):
+    help = "Recompute the daily task statistics used by the burndown chart."
+
+    def handle(self, *args, **options):
+        rows = rebuild_daily_stats()
+        self.stdout.write(self.style.SUCCESS(f"Stored {rows} daily stat rows"))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from task_manager.counters import reconcile
+
+
+class Command(BaseCommand):
+    help = "Recompute denormalized workload counters that drifted."
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            repaired = reconcile()
+        for model_name, count in repaired.items():
+            self.stdout.write(f"{model_name}: {count} rows repaired")
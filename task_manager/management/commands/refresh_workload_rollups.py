@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from task_manager.analytics import refresh_rollups
+
+
+class Command(BaseCommand):
+    help = "Recompute the workload analytics rollup table."
+
+    def handle(self, *args, **options):
+        rows = refresh_rollups()
+        self.stdout.write(self.style.SUCCESS(f"Stored {rows} rollup rows"))
@@ -0,0 +1,139 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+PROFILES = {
+    "dev": "it_company_task_manager.settings.dev",
+    "prod": "it_company_task_manager.settings.prod",
+}
+
+# Runs in a fresh interpreter so every sample pays the full cold start.
+PROBE = """
+import io, json, os, sys, time
+
+start = time.perf_counter()
+from django.core.wsgi import get_wsgi_application
+application = get_wsgi_application()
+loaded = time.perf_counter()
+
+if os.environ["STARTUP_WARM_UP"] == "1":
+    from task_manager.warmup import warm_up
+    warm_up()
+warmed = time.perf_counter()
+
+def request():
+    environ = {
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": os.environ["STARTUP_PATH"],
+        "SERVER_NAME": "localhost",
+        "SERVER_PORT": "80",
+        "HTTP_HOST": "localhost",
+        "wsgi.url_scheme": "http",
+        "wsgi.input": io.BytesIO(),
+        "wsgi.errors": sys.stderr,
+    }
+    statuses = []
+    start_response = lambda status, headers: statuses.append(status)
+    body = application(environ, start_response)
+    b"".join(body)
+    body.close()
+    return statuses[0]
+
+status = request()
+first = time.perf_counter()
+request()
+second = time.perf_counter()
+
+print(json.dumps({
+    "status": status,
+    "modules": len(sys.modules),
+    "import": loaded - start,
+    "warm_up": warmed - loaded,
+    "first_request": first - warmed,
+    "second_request": second - first,
+}))
+"""
+
+TIMINGS = ("import", "warm_up", "first_request", "second_request")
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure import time and time to first request of each settings "
+        "profile in fresh interpreters."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--profile",
+            action="append",
+            choices=sorted(PROFILES),
+            dest="profiles",
+        )
+        parser.add_argument("--runs", type=int, default=5)
+        parser.add_argument("--path", default="/accounts/login/")
+        parser.add_argument(
+            "--warm-up",
+            action="store_true",
+            help="Run task_manager.warmup before the first request.",
+        )
+
+    def probe(self, profile, options):
+        env = {
+            **os.environ,
+            "DJANGO_SETTINGS_MODULE": PROFILES[profile],
+            "STARTUP_PATH": options["path"],
+            "STARTUP_WARM_UP": "1" if options["warm_up"] else "0",
+        }
+        env.setdefault("SECRET_KEY", settings.SECRET_KEY)
+        env.setdefault("RENDER_EXTERNAL_HOSTNAME", "localhost")
+        # The probe never connects, the production profile only needs
+        # its database settings to be present.
+        for name in ("POSTGRES_DB", "POSTGRES_USER", "POSTGRES_PASSWORD"):
+            env.setdefault(name, "benchmark")
+        env.setdefault("POSTGRES_HOST", "localhost")
+        env.setdefault("POSTGRES_DB_PORT", "5432")
+
+        result = subprocess.run(
+            [sys.executable, "-c", PROBE],
+            cwd=settings.BASE_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode:
+            raise CommandError(
+                f"The {profile} profile failed to start:\n{result.stderr}"
+            )
+        return json.loads(result.stdout.splitlines()[-1])
+
+    def handle(self, *args, **options):
+        for profile in options["profiles"] or sorted(PROFILES):
+            samples = [
+                self.probe(profile, options) for _ in range(options["runs"])
+            ]
+            medians = {
+                timing: statistics.median(
+                    sample[timing] for sample in samples
+                )
+                for timing in TIMINGS
+            }
+            timings = ", ".join(
+                f"{timing.replace('_', ' ')} {medians[timing] * 1000:.1f} ms"
+                for timing in TIMINGS
+            )
+            if not samples[0]["status"].startswith("200"):
+                # The production profile needs collectstatic's manifest.
+                self.stderr.write(
+                    f"{profile}: {options['path']} returned "
+                    f"{samples[0]['status']}, timings are not representative"
+                )
+            self.stdout.write(
+                f"{profile}: {samples[0]['modules']} modules, "
+                f"status {samples[0]['status']}, {timings}"
+            )
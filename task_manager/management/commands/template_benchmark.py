@@ -0,0 +1,136 @@
+import datetime
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.template import engines
+from django.template.loader import select_template
+from django.test import RequestFactory
+from django.urls import reverse
+from django.utils import timezone
+
+from task_manager.models import Position, Task, TaskType, Worker
+from task_manager.views import (
+    TaskDetailView,
+    TaskListView,
+    WorkerDetailView,
+    WorkerListView,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the render time per page of the Django and the Jinja2 "
+        "templates of the task and worker list and detail pages. The data "
+        "is created in a transaction that is rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows",
+            type=int,
+            default=50,
+            help="Rows per list page and assignments per detail page.",
+        )
+        parser.add_argument("--repeat", type=int, default=200)
+
+    def host(self):
+        # With DEBUG and no ALLOWED_HOSTS, Django accepts localhost.
+        for host in settings.ALLOWED_HOSTS:
+            if host != "*" and not host.startswith("."):
+                return host
+        return "localhost"
+
+    def pages(self, worker, task, rows):
+        return {
+            "task list": (
+                TaskListView.as_view(paginate_by=rows),
+                reverse("task-manager:task-list"),
+                {},
+            ),
+            "worker list": (
+                WorkerListView.as_view(paginate_by=rows),
+                reverse("task-manager:worker-list"),
+                {},
+            ),
+            "task detail": (
+                TaskDetailView.as_view(),
+                reverse("task-manager:task-detail", args=[task.pk]),
+                {"pk": task.pk},
+            ),
+            "worker detail": (
+                WorkerDetailView.as_view(),
+                reverse("task-manager:worker-detail", args=[worker.pk]),
+                {"pk": worker.pk},
+            ),
+        }
+
+    def measure(self, template, context, request, repeat):
+        # The first render loads the rows and compiles the template.
+        template.render(context, request)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            template.render(context, request)
+        return (time.perf_counter() - start) / repeat
+
+    def handle(self, *args, **options):
+        if "jinja2" not in engines:
+            raise CommandError("Jinja2 is not installed.")
+
+        rows = options["rows"]
+        factory = RequestFactory(HTTP_HOST=self.host())
+        results = {}
+        with transaction.atomic():
+            position = Position.objects.create(name="Template benchmark")
+            task_type = TaskType.objects.create(name="Template benchmark")
+            workers = Worker.objects.bulk_create(
+                Worker(
+                    username=f"template-benchmark-{i}",
+                    first_name="Template",
+                    last_name=f"Benchmark {i}",
+                    position=position,
+                )
+                for i in range(rows)
+            )
+            now = timezone.now()
+            tasks = Task.objects.bulk_create(
+                Task(
+                    name=f"Template benchmark {i}",
+                    description=f"Sample description of task {i}.",
+                    task_type=task_type,
+                    deadline=now + datetime.timedelta(days=i % 30),
+                )
+                for i in range(rows)
+            )
+            worker, task = workers[0], tasks[0]
+            worker.assigned_tasks.add(*tasks)
+            task.assignees.add(*workers)
+
+            for name, (view, url, kwargs) in self.pages(
+                worker, task, rows
+            ).items():
+                request = factory.get(url)
+                request.user = worker
+                response = view(request, **kwargs)
+                if response.status_code != 200:
+                    raise CommandError(
+                        f"{url} returned {response.status_code}"
+                    )
+                results[name] = [
+                    self.measure(
+                        select_template(response.template_name, using=alias),
+                        response.context_data,
+                        request,
+                        options["repeat"],
+                    )
+                    for alias in ("django", "jinja2")
+                ]
+            transaction.set_rollback(True)
+
+        for name, (django, jinja2) in results.items():
+            self.stdout.write(
+                f"{name}: Django {django * 1000:.2f}ms, Jinja2 "
+                f"{jinja2 * 1000:.2f}ms per render "
+                f"({django / jinja2:.1f}x)"
+            )
@@ -0,0 +1,76 @@
+# Generated by Django 6.0.1 on 2026-10-19 12:18
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def backfill_completed_at(apps, schema_editor):
+    Task = apps.get_model("task_manager", "Task")
+    Task.objects.filter(is_completed=True, completed_at__isnull=True).update(
+        completed_at=timezone.now()
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0004_alter_task_assignees"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="task",
+            name="completed_at",
+            field=models.DateTimeField(
+                blank=True, db_index=True, editable=False, null=True
+            ),
+        ),
+        migrations.CreateModel(
+            name="ArchivedTask",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("name", models.CharField(db_index=True, max_length=255)),
+                ("description", models.TextField(blank=True, null=True)),
+                ("deadline", models.DateTimeField(blank=True, null=True)),
+                (
+                    "priority",
+                    models.CharField(
+                        choices=[
+                            ("UR", "Urgent"),
+                            ("HG", "High"),
+                            ("MD", "Medium"),
+                            ("LW", "Low"),
+                        ],
+                        default="LW",
+                        max_length=2,
+                    ),
+                ),
+                (
+                    "completed_at",
+                    models.DateTimeField(blank=True, db_index=True, null=True),
+                ),
+                ("archived_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "assignees",
+                    models.ManyToManyField(
+                        blank=True,
+                        related_name="archived_tasks",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "task_type",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="archived_tasks",
+                        to="task_manager.tasktype",
+                    ),
+                ),
+            ],
+        ),
+        migrations.RunPython(backfill_completed_at, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+from django.conf import settings
+from django.db import migrations
+
+from task_manager import partitioning
+
+
+def partition_task_table(apps, schema_editor):
+    connection = schema_editor.connection
+    if (
+        settings.TASK_PARTITIONING
+        and partitioning.is_supported(connection)
+        and not partitioning.is_partitioned(connection)
+    ):
+        partitioning.convert(settings.TASK_PARTITIONING, connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0005_archivedtask"),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_task_table, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,90 @@
+# Generated by Django 6.0.1 on 2026-10-19 12:29
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def _count(queryset, field):
+    return Coalesce(
+        Subquery(
+            queryset.filter(**{field: OuterRef("pk")})
+            .order_by()
+            .values(field)
+            .annotate(total=Count("*"))
+            .values("total")
+        ),
+        Value(0),
+    )
+
+
+def backfill_counters(apps, schema_editor):
+    # A copy of task_manager.counters.reconcile() at this migration.
+    Task = apps.get_model("task_manager", "Task")
+    TaskType = apps.get_model("task_manager", "TaskType")
+    Position = apps.get_model("task_manager", "Position")
+    Worker = apps.get_model("task_manager", "Worker")
+    assignments = Task.assignees.through.objects.all()
+    open_assignments = assignments.filter(task__is_completed=False)
+
+    Task.objects.update(assignee_count=_count(assignments, "task"))
+    Worker.objects.update(
+        assigned_task_count=_count(assignments, "worker"),
+        open_task_count=_count(open_assignments, "worker"),
+    )
+    Position.objects.update(
+        task_count=_count(assignments, "worker__position"),
+        open_task_count=_count(open_assignments, "worker__position"),
+    )
+    TaskType.objects.update(
+        task_count=_count(Task.objects.all(), "task_type"),
+        open_task_count=_count(
+            Task.objects.filter(is_completed=False), "task_type"
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0006_partition_task"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="position",
+            name="open_task_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="position",
+            name="task_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="task",
+            name="assignee_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="tasktype",
+            name="open_task_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="tasktype",
+            name="task_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="worker",
+            name="assigned_task_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="worker",
+            name="open_task_count",
+            field=models.IntegerField(db_index=True, default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
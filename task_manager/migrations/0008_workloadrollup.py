@@ -0,0 +1,58 @@
+# Generated by Django 6.0.1 on 2026-10-19 12:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0007_workload_counters"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WorkloadRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "dimension",
+                    models.CharField(
+                        choices=[
+                            ("position", "Position"),
+                            ("task_type", "Task type"),
+                            ("priority", "Priority"),
+                            ("worker", "Worker"),
+                        ],
+                        max_length=16,
+                    ),
+                ),
+                ("key", models.CharField(max_length=32)),
+                ("label", models.CharField(max_length=255)),
+                ("open_count", models.PositiveIntegerField(default=0)),
+                ("overdue_count", models.PositiveIntegerField(default=0)),
+                ("completed_count", models.PositiveIntegerField(default=0)),
+                ("refreshed_at", models.DateTimeField()),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["dimension", "-open_count"],
+                        name="workload_rollup_open_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("dimension", "key"), name="unique_workload_rollup"
+                    )
+                ],
+            },
+        ),
+    ]
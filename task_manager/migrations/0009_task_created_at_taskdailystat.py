@@ -0,0 +1,88 @@
+# Generated by Django 6.0.1 on 2026-10-19 12:36
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import Count, Q
+from django.utils import timezone
+
+
+def seed_open_counts(apps, schema_editor):
+    Task = apps.get_model("task_manager", "Task")
+    TaskDailyStat = apps.get_model("task_manager", "TaskDailyStat")
+    today = timezone.localdate()
+    TaskDailyStat.objects.bulk_create(
+        TaskDailyStat(
+            day=today,
+            task_type_id=task_type_id,
+            priority=priority,
+            open_count=open_count,
+        )
+        for task_type_id, priority, open_count in Task.objects.order_by()
+        .values_list("task_type_id", "priority")
+        .annotate(open_count=Count("pk", filter=Q(is_completed=False)))
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0008_workloadrollup"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="task",
+            name="created_at",
+            field=models.DateTimeField(
+                db_index=True, default=django.utils.timezone.now, editable=False
+            ),
+        ),
+        migrations.CreateModel(
+            name="TaskDailyStat",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField()),
+                (
+                    "priority",
+                    models.CharField(
+                        choices=[
+                            ("UR", "Urgent"),
+                            ("HG", "High"),
+                            ("MD", "Medium"),
+                            ("LW", "Low"),
+                        ],
+                        max_length=2,
+                    ),
+                ),
+                ("created_count", models.IntegerField(default=0)),
+                ("completed_count", models.IntegerField(default=0)),
+                ("open_count", models.IntegerField(default=0)),
+                (
+                    "task_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_stats",
+                        to="task_manager.tasktype",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("day", "task_type", "priority"),
+                        name="unique_task_daily_stat",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(seed_open_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 6.0.1 on 2026-10-19 13:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0010_taskchange"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(fields=["deadline"], name="task_deadline_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["is_completed", "deadline"], name="task_status_deadline_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["priority", "deadline"], name="task_priority_deadline_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["task_type", "deadline"], name="task_type_deadline_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 6.0.1 on 2026-10-19 13:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0011_task_board_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="task",
+            name="priority_rank",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=models.Case(
+                    models.When(priority="UR", then=models.Value(1)),
+                    models.When(priority="HG", then=models.Value(2)),
+                    models.When(priority="MD", then=models.Value(3)),
+                    models.When(priority="LW", then=models.Value(4)),
+                    default=models.Value(4),
+                ),
+                output_field=models.PositiveSmallIntegerField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["priority_rank", "deadline"], name="task_rank_deadline_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,82 @@
+# Generated by Django 6.0.1 on 2026-10-19 13:18
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0012_task_priority_rank"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="task",
+            name="is_blocked",
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.CreateModel(
+            name="TaskDependency",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "blocker",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="task_manager.task",
+                    ),
+                ),
+                (
+                    "task",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="task_manager.task",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddField(
+            model_name="task",
+            name="blocked_by",
+            field=models.ManyToManyField(
+                blank=True,
+                related_name="blocks",
+                through="task_manager.TaskDependency",
+                through_fields=("task", "blocker"),
+                to="task_manager.task",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["is_completed", "is_blocked", "deadline"],
+                name="task_actionable_idx",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="taskdependency",
+            constraint=models.UniqueConstraint(
+                fields=("task", "blocker"), name="unique_task_dependency"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="taskdependency",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("task", models.F("blocker")), _negated=True),
+                name="task_dependency_not_self",
+            ),
+        ),
+    ]
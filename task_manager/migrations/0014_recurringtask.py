@@ -0,0 +1,108 @@
+# Generated by Django 6.0.1 on 2026-10-19 13:22
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+from task_manager import partitioning
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0013_task_dependencies"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="task",
+            name="occurrence",
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.CreateModel(
+            name="RecurringTask",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=200, unique=True)),
+                ("description", models.TextField(blank=True, null=True)),
+                (
+                    "priority",
+                    models.CharField(
+                        choices=[
+                            ("UR", "Urgent"),
+                            ("HG", "High"),
+                            ("MD", "Medium"),
+                            ("LW", "Low"),
+                        ],
+                        default="LW",
+                        max_length=2,
+                    ),
+                ),
+                (
+                    "frequency",
+                    models.CharField(
+                        choices=[
+                            ("daily", "Daily"),
+                            ("weekly", "Weekly"),
+                            ("monthly", "Monthly"),
+                        ],
+                        default="weekly",
+                        max_length=10,
+                    ),
+                ),
+                ("interval", models.PositiveSmallIntegerField(default=1)),
+                (
+                    "starts_at",
+                    models.DateTimeField(help_text="Deadline of the first occurrence."),
+                ),
+                (
+                    "generated_until",
+                    models.DateTimeField(blank=True, editable=False, null=True),
+                ),
+                ("is_active", models.BooleanField(default=True)),
+                (
+                    "assignees",
+                    models.ManyToManyField(
+                        blank=True,
+                        related_name="recurring_tasks",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "task_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="recurring_tasks",
+                        to="task_manager.tasktype",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddField(
+            model_name="task",
+            name="recurrence",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="occurrences",
+                to="task_manager.recurringtask",
+            ),
+        ),
+        # Includes the partition key on a partitioned task table.
+        partitioning.AddTaskConstraint(
+            model_name="task",
+            constraint=models.UniqueConstraint(
+                fields=("recurrence", "occurrence"), name="unique_task_occurrence"
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 6.0.1 on 2026-10-19 13:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0014_recurringtask"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="worker",
+            name="assignment_version",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="worker",
+            name="assignments_changed_at",
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 6.0.1 on 2026-10-19 13:40
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("task_manager", "0015_worker_assignment_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="task",
+            name="search_name",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.functions.text.Lower("name"),
+                output_field=models.CharField(max_length=255),
+            ),
+        ),
+        migrations.AddField(
+            model_name="worker",
+            name="search_full_name",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.functions.text.Lower(
+                    django.db.models.functions.text.Concat(
+                        "first_name", models.Value(" "), "last_name"
+                    )
+                ),
+                output_field=models.CharField(max_length=301),
+            ),
+        ),
+        migrations.AddField(
+            model_name="worker",
+            name="search_username",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.functions.text.Lower("username"),
+                output_field=models.CharField(max_length=150),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["search_name"],
+                name="task_search_name_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="worker",
+            index=models.Index(
+                fields=["search_username"],
+                name="worker_search_username_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="worker",
+            index=models.Index(
+                fields=["search_full_name"],
+                name="worker_search_full_name_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ),
+    ]
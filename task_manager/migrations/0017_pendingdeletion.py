@@ -0,0 +1,42 @@
+# Generated by Django 6.0.1 on 2026-10-19 14:42
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0016_search_prefix_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PendingDeletion",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("model_name", models.CharField(max_length=100)),
+                ("object_id", models.BigIntegerField()),
+                (
+                    "requested_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("model_name", "object_id"),
+                        name="unique_pending_deletion",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,65 @@
+from django.db import migrations, models
+
+
+def copy_task_ids(apps, schema_editor):
+    ArchivedTask = apps.get_model("task_manager", "ArchivedTask")
+    ArchivedTask.objects.update(task_id=models.F("id"))
+
+
+def reset_id_sequence(apps, schema_editor):
+    # The new identity column starts at 1, below the copied task ids.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "SELECT setval(pg_get_serial_sequence("
+        "'task_manager_archivedtask', 'id'), "
+        "COALESCE((SELECT MAX(id) FROM task_manager_archivedtask), 0) + 1, "
+        "false)"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0017_pendingdeletion"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="archivedtask",
+            name="task_id",
+            field=models.BigIntegerField(null=True),
+        ),
+        migrations.RunPython(copy_task_ids, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="archivedtask",
+            name="task_id",
+            field=models.BigIntegerField(db_index=True),
+        ),
+        migrations.AlterField(
+            model_name="archivedtask",
+            name="id",
+            field=models.BigAutoField(
+                auto_created=True,
+                primary_key=True,
+                serialize=False,
+                verbose_name="ID",
+            ),
+        ),
+        migrations.RunPython(reset_id_sequence, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="taskchange",
+            name="action",
+            field=models.CharField(
+                choices=[
+                    ("created", "Created"),
+                    ("updated", "Updated"),
+                    ("deleted", "Deleted"),
+                    ("assigned", "Assigned"),
+                    ("unassigned", "Unassigned"),
+                    ("archived", "Archived"),
+                ],
+                max_length=10,
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0018_archivedtask_task_id"),
+    ]
+
+    operations = [
+        migrations.RenameField(
+            model_name="position",
+            old_name="task_count",
+            new_name="assignment_count",
+        ),
+        migrations.RenameField(
+            model_name="position",
+            old_name="open_task_count",
+            new_name="open_assignment_count",
+        ),
+    ]
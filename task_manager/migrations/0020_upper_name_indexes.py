@@ -0,0 +1,58 @@
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+def upper_prefix_index(field, name):
+    return models.Index(
+        django.contrib.postgres.indexes.OpClass(
+            django.db.models.functions.text.Upper(field),
+            name="text_pattern_ops",
+        ),
+        name=name,
+    )
+
+
+INDEXES = [
+    ("position", upper_prefix_index("name", "position_upper_name_idx")),
+    (
+        "recurringtask",
+        upper_prefix_index("name", "recurringtask_upper_name_idx"),
+    ),
+    ("tasktype", upper_prefix_index("name", "tasktype_upper_name_idx")),
+    ("worker", upper_prefix_index("username", "worker_upper_username_idx")),
+]
+
+
+def add_indexes(apps, schema_editor):
+    # Operator classes only exist on PostgreSQL.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for model_name, index in INDEXES:
+        schema_editor.add_index(apps.get_model("task_manager", model_name), index)
+
+
+def remove_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for model_name, index in INDEXES:
+        schema_editor.remove_index(apps.get_model("task_manager", model_name), index)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0019_position_assignment_counts"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(add_indexes, remove_indexes),
+            ],
+            state_operations=[
+                migrations.AddIndex(model_name=model_name, index=index)
+                for model_name, index in INDEXES
+            ],
+        ),
+    ]
@@ -0,0 +1,31 @@
+from django.db import migrations
+
+
+def add_index(apps, schema_editor):
+    # Serves UPPER(name) LIKE UPPER('%x%'), the task board's name filter.
+    # pg_trgm and GIN indexes only exist on PostgreSQL, and the index is
+    # kept out of Task.Meta so that django.contrib.postgres is not needed.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS task_name_trgm_idx "
+        "ON task_manager_task USING gin (UPPER(name) gin_trgm_ops)"
+    )
+
+
+def remove_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS task_name_trgm_idx")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0020_upper_name_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(add_index, remove_index),
+    ]
@@ -1,31 +1,100 @@
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import OpClass
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
+from django.db.models.functions import Concat, Lower, Upper
 from django.urls import reverse
+from django.utils import timezone
 
 
-class TaskType(models.Model):
+def upper_prefix_index(field, name):
+    """
+    Serve the admin's ``^field`` search, which filters
+    ``UPPER(field) LIKE UPPER('term%')``. PostgreSQL only: the
+    migration skips it elsewhere.
+    """
+    return models.Index(
+        OpClass(Upper(field), name="text_pattern_ops"), name=name
+    )
+
+
+class CounterFieldsMixin:
+    """Keep regular saves from overwriting counters maintained by F()."""
+
+    counter_fields = ()
+
+    def _do_update(
+        self, base_qs, using, pk_val, values, update_fields, *args, **kwargs
+    ):
+        # Only the UPDATE leaves the counters out: a save that finds its row
+        # deleted still inserts it again, counters included.
+        if update_fields is None:
+            values = [
+                value
+                for value in values
+                if value[0].name not in self.counter_fields
+            ]
+        return super()._do_update(
+            base_qs, using, pk_val, values, update_fields, *args, **kwargs
+        )
+
+
+class TaskType(CounterFieldsMixin, models.Model):
+    counter_fields = ("task_count", "open_task_count")
+
     name = models.CharField(max_length=255, unique=True)
+    task_count = models.IntegerField(default=0, editable=False)
+    open_task_count = models.IntegerField(default=0, editable=False)
+
+    class Meta:
+        indexes = [upper_prefix_index("name", "tasktype_upper_name_idx")]
 
     def __str__(self):
         return self.name
 
 
-class Task(models.Model):
+class Task(CounterFieldsMixin, models.Model):
     class LevelPriority(models.TextChoices):
         URGENT = "UR", "Urgent"
         HIGH = "HG", "High"
         MEDIUM = "MD", "Medium"
         LOW = "LW", "Low"
 
+    # Lower ranks are more urgent.
+    PRIORITY_RANKS = {
+        LevelPriority.URGENT: 1,
+        LevelPriority.HIGH: 2,
+        LevelPriority.MEDIUM: 3,
+        LevelPriority.LOW: 4,
+    }
+
+    # Maintained with bulk updates, see task_manager.counters and
+    # task_manager.dependencies.
+    counter_fields = ("assignee_count", "is_blocked")
+
     name = models.CharField(max_length=255, unique=True)
     description = models.TextField(null=True, blank=True)
     deadline = models.DateTimeField(null=True, blank=True)
     is_completed = models.BooleanField(default=False)
+    completed_at = models.DateTimeField(
+        null=True, blank=True, editable=False, db_index=True
+    )
     priority = models.CharField(
         max_length=2,
         choices=LevelPriority.choices,
         default=LevelPriority.LOW
     )
+    priority_rank = models.GeneratedField(
+        expression=models.Case(
+            *(
+                models.When(priority=code, then=models.Value(rank))
+                for code, rank in PRIORITY_RANKS.items()
+            ),
+            default=models.Value(len(PRIORITY_RANKS)),
+        ),
+        output_field=models.PositiveSmallIntegerField(),
+        db_persist=True,
+    )
     task_type = models.ForeignKey(
         "TaskType",
         on_delete=models.CASCADE,
@@ -36,23 +105,243 @@ class Task(models.Model):
         related_name="assigned_tasks",
         blank=True
     )
+    blocked_by = models.ManyToManyField(
+        "self",
+        through="TaskDependency",
+        through_fields=("task", "blocker"),
+        symmetrical=False,
+        related_name="blocks",
+        blank=True,
+    )
+    is_blocked = models.BooleanField(default=False, editable=False)
+    recurrence = models.ForeignKey(
+        "RecurringTask",
+        on_delete=models.SET_NULL,
+        related_name="occurrences",
+        null=True,
+        blank=True,
+        editable=False,
+    )
+    occurrence = models.DateTimeField(null=True, blank=True, editable=False)
+    assignee_count = models.IntegerField(default=0, editable=False)
+    created_at = models.DateTimeField(
+        default=timezone.now, editable=False, db_index=True
+    )
+    # Case-insensitive prefix search, see task_manager.typeahead.
+    search_name = models.GeneratedField(
+        expression=Lower("name"),
+        output_field=models.CharField(max_length=255),
+        db_persist=True,
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["recurrence", "occurrence"],
+                name="unique_task_occurrence",
+            ),
+        ]
+        # Back the orderings and filters of the task board, see task_filters.
+        indexes = [
+            models.Index(fields=["deadline"], name="task_deadline_idx"),
+            models.Index(
+                fields=["is_completed", "deadline"],
+                name="task_status_deadline_idx",
+            ),
+            models.Index(
+                fields=["is_completed", "is_blocked", "deadline"],
+                name="task_actionable_idx",
+            ),
+            models.Index(
+                fields=["priority", "deadline"],
+                name="task_priority_deadline_idx",
+            ),
+            models.Index(
+                fields=["priority_rank", "deadline"],
+                name="task_rank_deadline_idx",
+            ),
+            models.Index(
+                fields=["task_type", "deadline"],
+                name="task_type_deadline_idx",
+            ),
+            # The pattern operator class lets PostgreSQL answer LIKE 'x%'
+            # from the index; other databases ignore it.
+            models.Index(
+                fields=["search_name"],
+                name="task_search_name_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ]
+        # The board's substring filter is served on PostgreSQL by the
+        # trigram index task_name_trgm_idx, created by migration 0021
+        # without django.contrib.postgres.
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
 
     def __str__(self):
+        deadline = (
+            self.deadline.strftime("%d.%m.%Y %H:%M") if self.deadline else None
+        )
         return (
-            f"'{self.name}' - deadline: "
-            f"{self.deadline.strftime("%d.%m.%Y %H:%M")}, "
+            f"'{self.name}' - deadline: {deadline}, "
             f"is completed: {self.is_completed}, "
             f"priority: {self.priority}."
         )
 
+    def save(self, *args, **kwargs):
+        if not self.is_completed:
+            self.completed_at = None
+        elif self.completed_at is None:
+            self.completed_at = timezone.now()
+        super().save(*args, **kwargs)
+
     def get_status_display(self):
         return "Completed" if self.is_completed else "Not completed"
 
 
-class Worker(AbstractUser):
+class TaskDependency(models.Model):
+    """``task`` cannot be worked on before ``blocker`` is completed."""
+
+    # No database constraints: the task table may be partitioned, see
+    # task_manager.partitioning.
+    task = models.ForeignKey(
+        Task,
+        on_delete=models.CASCADE,
+        related_name="+",
+        db_constraint=False,
+    )
+    blocker = models.ForeignKey(
+        Task,
+        on_delete=models.CASCADE,
+        related_name="+",
+        db_constraint=False,
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["task", "blocker"], name="unique_task_dependency"
+            ),
+            models.CheckConstraint(
+                condition=~models.Q(task=models.F("blocker")),
+                name="task_dependency_not_self",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.task_id} blocked by {self.blocker_id}"
+
+
+class RecurringTask(models.Model):
+    """Template that task_manager.recurrence turns into dated tasks."""
+
+    class Frequency(models.TextChoices):
+        DAILY = "daily", "Daily"
+        WEEKLY = "weekly", "Weekly"
+        MONTHLY = "monthly", "Monthly"
+
+    name = models.CharField(max_length=200, unique=True)
+    description = models.TextField(null=True, blank=True)
+    task_type = models.ForeignKey(
+        "TaskType",
+        on_delete=models.CASCADE,
+        related_name="recurring_tasks"
+    )
+    priority = models.CharField(
+        max_length=2,
+        choices=Task.LevelPriority.choices,
+        default=Task.LevelPriority.LOW
+    )
+    assignees = models.ManyToManyField(
+        "Worker",
+        related_name="recurring_tasks",
+        blank=True
+    )
+    frequency = models.CharField(
+        max_length=10,
+        choices=Frequency.choices,
+        default=Frequency.WEEKLY
+    )
+    interval = models.PositiveSmallIntegerField(default=1)
+    starts_at = models.DateTimeField(
+        help_text="Deadline of the first occurrence."
+    )
+    generated_until = models.DateTimeField(
+        null=True, blank=True, editable=False
+    )
+    is_active = models.BooleanField(default=True)
+
+    class Meta:
+        indexes = [
+            upper_prefix_index("name", "recurringtask_upper_name_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.get_frequency_display().lower()})"
+
+
+class ArchivedTask(models.Model):
+    # The id of the archived task. Not the primary key: SQLite reuses the
+    # ids of deleted rows with the highest id.
+    task_id = models.BigIntegerField(db_index=True)
+    name = models.CharField(max_length=255, db_index=True)
+    description = models.TextField(null=True, blank=True)
+    deadline = models.DateTimeField(null=True, blank=True)
+    priority = models.CharField(
+        max_length=2,
+        choices=Task.LevelPriority.choices,
+        default=Task.LevelPriority.LOW
+    )
+    completed_at = models.DateTimeField(null=True, blank=True, db_index=True)
+    archived_at = models.DateTimeField(auto_now_add=True)
+    task_type = models.ForeignKey(
+        "TaskType",
+        on_delete=models.SET_NULL,
+        related_name="archived_tasks",
+        null=True,
+        blank=True,
+    )
+    assignees = models.ManyToManyField(
+        "Worker",
+        related_name="archived_tasks",
+        blank=True
+    )
+
+    def __str__(self):
+        return f"'{self.name}' - archived"
+
+    def get_status_display(self):
+        return "Archived"
+
+
+class Worker(CounterFieldsMixin, AbstractUser):
     class Meta:
         verbose_name = "worker"
         verbose_name_plural = "workers"
+        indexes = [
+            models.Index(
+                fields=["search_username"],
+                name="worker_search_username_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+            models.Index(
+                fields=["search_full_name"],
+                name="worker_search_full_name_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+            upper_prefix_index("username", "worker_upper_username_idx"),
+        ]
+
+    counter_fields = (
+        "assigned_task_count",
+        "open_task_count",
+        "assignment_version",
+        "assignments_changed_at",
+    )
 
     position = models.ForeignKey(
         "Position",
@@ -61,6 +350,39 @@ class Worker(AbstractUser):
         null=True,
         blank=True,
     )
+    assigned_task_count = models.IntegerField(
+        default=0, editable=False
+    )
+    open_task_count = models.IntegerField(
+        default=0, editable=False, db_index=True
+    )
+    # Bumped whenever the worker's open tasks change, see
+    # task_manager.ical.
+    assignment_version = models.PositiveIntegerField(
+        default=0, editable=False
+    )
+    assignments_changed_at = models.DateTimeField(
+        null=True, blank=True, editable=False
+    )
+    # Case-insensitive prefix search, see task_manager.typeahead.
+    search_username = models.GeneratedField(
+        expression=Lower("username"),
+        output_field=models.CharField(max_length=150),
+        db_persist=True,
+    )
+    search_full_name = models.GeneratedField(
+        expression=Lower(
+            Concat("first_name", models.Value(" "), "last_name")
+        ),
+        output_field=models.CharField(max_length=301),
+        db_persist=True,
+    )
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
 
     def __str__(self):
         return f"{self.username} ({self.first_name} {self.last_name})"
@@ -69,8 +391,144 @@ class Worker(AbstractUser):
         return reverse("task-manager:worker-detail", kwargs={"pk": self.pk})
 
 
-class Position(models.Model):
+class Position(CounterFieldsMixin, models.Model):
+    counter_fields = ("assignment_count", "open_assignment_count")
+
     name = models.CharField(max_length=255, unique=True)
+    # Assignee rows of the position's workers: a task assigned to two of
+    # them counts twice.
+    assignment_count = models.IntegerField(default=0, editable=False)
+    open_assignment_count = models.IntegerField(default=0, editable=False)
+
+    class Meta:
+        indexes = [upper_prefix_index("name", "position_upper_name_idx")]
 
     def __str__(self):
         return self.name
+
+
+class WorkloadRollup(models.Model):
+    class Dimension(models.TextChoices):
+        POSITION = "position", "Position"
+        TASK_TYPE = "task_type", "Task type"
+        PRIORITY = "priority", "Priority"
+        WORKER = "worker", "Worker"
+
+    dimension = models.CharField(max_length=16, choices=Dimension.choices)
+    key = models.CharField(max_length=32)
+    label = models.CharField(max_length=255)
+    open_count = models.PositiveIntegerField(default=0)
+    overdue_count = models.PositiveIntegerField(default=0)
+    completed_count = models.PositiveIntegerField(default=0)
+    refreshed_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["dimension", "key"], name="unique_workload_rollup"
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["dimension", "-open_count"],
+                name="workload_rollup_open_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.get_dimension_display()}: {self.label}"
+
+    @property
+    def total_count(self):
+        return self.open_count + self.completed_count
+
+    @property
+    def completion_rate(self):
+        if not self.total_count:
+            return 0
+        return round(100 * self.completed_count / self.total_count)
+
+
+class TaskDailyStat(models.Model):
+    day = models.DateField()
+    task_type = models.ForeignKey(
+        "TaskType",
+        on_delete=models.CASCADE,
+        related_name="daily_stats"
+    )
+    priority = models.CharField(
+        max_length=2,
+        choices=Task.LevelPriority.choices,
+    )
+    created_count = models.IntegerField(default=0)
+    completed_count = models.IntegerField(default=0)
+    open_count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["day", "task_type", "priority"],
+                name="unique_task_daily_stat",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.day} {self.task_type_id} {self.priority}"
+
+
+class TaskChange(models.Model):
+    """Append-only history entry, kept after the task is deleted."""
+
+    class Action(models.TextChoices):
+        CREATED = "created", "Created"
+        UPDATED = "updated", "Updated"
+        DELETED = "deleted", "Deleted"
+        ASSIGNED = "assigned", "Assigned"
+        UNASSIGNED = "unassigned", "Unassigned"
+        ARCHIVED = "archived", "Archived"
+
+    task_id = models.BigIntegerField()
+    actor = models.ForeignKey(
+        "Worker",
+        on_delete=models.SET_NULL,
+        related_name="task_changes",
+        null=True,
+        blank=True,
+    )
+    action = models.CharField(max_length=10, choices=Action.choices)
+    changes = models.JSONField(default=dict, encoder=DjangoJSONEncoder)
+    timestamp = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["task_id", "-timestamp"],
+                name="task_change_history_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.task_id} {self.action} at {self.timestamp}"
+
+
+class PendingDeletion(models.Model):
+    """
+    An object being deleted in batches, see task_manager.deletion. Removed
+    together with the object; a left-over row marks an interrupted deletion
+    that ``manage.py batch_delete`` resumes.
+    """
+
+    model_name = models.CharField(max_length=100)
+    object_id = models.BigIntegerField()
+    requested_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["model_name", "object_id"],
+                name="unique_pending_deletion",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.model_name} {self.object_id}"
@@ -0,0 +1,45 @@
+from collections import defaultdict
+
+from django.conf import settings
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+
+from task_manager.models import Task
+
+TaskAssignee = Task.assignees.through
+
+URGENCY = ("task__priority_rank", "task__deadline", "task_id")
+
+
+def next_tasks(workers=None, limit=None):
+    """
+    The ``limit`` most urgent open tasks of each worker, in one query.
+
+    Returns ``{worker_id: [task, ...]}`` with the tasks as dictionaries
+    ordered by priority rank, then deadline.
+    """
+    limit = limit or settings.NEXT_TASKS_LIMIT
+    rows = TaskAssignee.objects.filter(task__is_completed=False)
+    if workers is not None:
+        rows = rows.filter(worker__in=workers)
+    rows = rows.annotate(
+        position=Window(
+            RowNumber(),
+            partition_by=F("worker_id"),
+            # Tasks without a deadline go last on every database.
+            order_by=[F(field).asc(nulls_last=True) for field in URGENCY],
+        )
+    ).filter(position__lte=limit).order_by("worker_id", "position")
+
+    queues = defaultdict(list)
+    for row in rows.values(
+        "worker_id",
+        "task_id",
+        name=F("task__name"),
+        priority=F("task__priority"),
+        priority_rank=F("task__priority_rank"),
+        deadline=F("task__deadline"),
+    ):
+        row["id"] = row.pop("task_id")
+        queues[row.pop("worker_id")].append(row)
+    return dict(queues)
@@ -0,0 +1,36 @@
+"""
+Paginator for tables too large to ``COUNT(*)`` on every page view.
+
+Rows are counted exactly up to ``COUNT_ESTIMATE_THRESHOLD``; beyond that
+PostgreSQL's planner estimate for the same query is used instead.
+"""
+import json
+
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+def estimated_count(queryset):
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return queryset.count()
+    sql, params = queryset.order_by().values("pk").query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class EstimatedCountPaginator(Paginator):
+    @cached_property
+    def count(self):
+        limit = settings.COUNT_ESTIMATE_THRESHOLD
+        # COUNT(*) over a LIMIT subquery stops after limit + 1 rows.
+        exact = self.object_list.order_by()[:limit + 1].count()
+        if exact <= limit:
+            return exact
+        return max(estimated_count(self.object_list), exact)
@@ -0,0 +1,418 @@
+"""
+Optional native Postgres partitioning of the task table.
+
+Two schemes are supported, selected with ``settings.TASK_PARTITIONING``:
+
+* ``"state"`` - LIST partitions on ``is_completed`` (open / done);
+* ``"deadline_month"`` - RANGE partitions on ``deadline``, one per month,
+  plus a default partition for tasks without a deadline.
+
+Postgres requires every unique constraint of a partitioned table to contain
+the partition key. The conversion keeps the table's CHECK constraints and
+recreates its indexes, unique constraints and outgoing foreign keys under
+their original names, so later migrations still find them. What the database
+stops enforcing:
+
+* the primary key becomes ``(id, is_completed)``, and with
+  ``"deadline_month"`` there is none at all, only ``UNIQUE (id, deadline)``,
+  which lets rows without a deadline share an id;
+* unique constraints gain the partition key and ``Task.name`` uniqueness only
+  holds within a partition, so across partitions it is only checked by
+  Django's model validation;
+* foreign keys pointing at the task table, from the assignee and dependency
+  rows, are dropped. Django still deletes those rows with their task.
+
+``integrity_problems()`` (``partition_tasks check``) reports rows that break
+any of these. Past months are backfilled for ``TASK_PARTITION_MONTHS_BACK``
+months; older deadlines stay in the default partition. ``partition_tasks
+extend`` has to run regularly (build.sh and a monthly cron job) to create
+the months ahead, moving rows that landed in the default partition.
+"""
+import datetime
+import re
+
+from django.conf import settings
+from django.db import (
+    connection as default_connection,
+    migrations,
+    models,
+    transaction,
+)
+from django.db.models import Count, Exists, OuterRef
+from django.utils import timezone
+
+TABLE = "task_manager_task"
+UNPARTITIONED_TABLE = f"{TABLE}_unpartitioned"
+
+SCHEMES = ("state", "deadline_month")
+
+PARTITION_KEYS = {
+    "state": ("is_completed",),
+    "deadline_month": ("deadline",),
+}
+
+SCANNED_PARTITION_RE = re.compile(rf" on ({TABLE}_\w+)")
+
+
+def is_supported(connection=default_connection):
+    return connection.vendor == "postgresql"
+
+
+def is_partitioned(connection=default_connection):
+    return bool(partition_key(connection))
+
+
+def partition_key(connection=default_connection):
+    """Columns the task table is partitioned by, empty if it is not."""
+    if not is_supported(connection):
+        return []
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT attribute.attname FROM pg_partitioned_table partitioned "
+            "JOIN pg_attribute attribute "
+            "ON attribute.attrelid = partitioned.partrelid "
+            "AND attribute.attnum = ANY(partitioned.partattrs::int2[]) "
+            "WHERE partitioned.partrelid = %s::regclass",
+            [TABLE],
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+class AddTaskConstraint(migrations.AddConstraint):
+    """
+    ``AddConstraint`` for the task table that adds the partition key to a
+    unique constraint when the table is partitioned, as Postgres requires.
+    The migration state keeps the constraint as declared on the model.
+    """
+
+    def database_forwards(
+        self, app_label, schema_editor, from_state, to_state
+    ):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+        constraint = self.constraint
+        key = partition_key(schema_editor.connection)
+        if key and isinstance(constraint, models.UniqueConstraint):
+            fields = list(constraint.fields)
+            fields += [column for column in key if column not in fields]
+            constraint = models.UniqueConstraint(
+                fields=fields, name=constraint.name
+            )
+        schema_editor.add_constraint(model, constraint)
+
+
+def month_start(value):
+    return datetime.date(value.year, value.month, 1)
+
+
+def next_month(value):
+    if value.month == 12:
+        return datetime.date(value.year + 1, 1, 1)
+    return datetime.date(value.year, value.month + 1, 1)
+
+
+def previous_month(value):
+    if value.month == 1:
+        return datetime.date(value.year - 1, 12, 1)
+    return datetime.date(value.year, value.month - 1, 1)
+
+
+def month_partition_name(month):
+    return f"{TABLE}_{month:y%Ym%m}"
+
+
+def month_partition_sql(month):
+    return (
+        f"CREATE TABLE IF NOT EXISTS {month_partition_name(month)} "
+        f"PARTITION OF {TABLE} "
+        f"FOR VALUES FROM ('{month.isoformat()}') "
+        f"TO ('{next_month(month).isoformat()}')"
+    )
+
+
+def split_default_sql(month, columns):
+    """
+    Create the partition of ``month`` once the default partition may hold
+    its rows: Postgres refuses to create it while the default partition is
+    attached and has rows in its range.
+    """
+    copied = ", ".join(columns)
+    return [
+        f"ALTER TABLE {TABLE} DETACH PARTITION {TABLE}_default",
+        month_partition_sql(month),
+        f"WITH moved AS (DELETE FROM {TABLE}_default "
+        f"WHERE deadline >= '{month.isoformat()}' "
+        f"AND deadline < '{next_month(month).isoformat()}' "
+        f"RETURNING {copied}) "
+        f"INSERT INTO {TABLE} ({copied}) OVERRIDING SYSTEM VALUE "
+        f"SELECT {copied} FROM moved",
+        f"ALTER TABLE {TABLE} ATTACH PARTITION {TABLE}_default DEFAULT",
+    ]
+
+
+def months_between(first, last):
+    month = month_start(first)
+    while month <= last:
+        yield month
+        month = next_month(month)
+
+
+def partitions_sql(scheme, first_month=None, months_ahead=None):
+    if scheme == "state":
+        return [
+            f"CREATE TABLE {TABLE}_open PARTITION OF {TABLE} "
+            f"FOR VALUES IN (false)",
+            f"CREATE TABLE {TABLE}_done PARTITION OF {TABLE} "
+            f"FOR VALUES IN (true)",
+        ]
+
+    if months_ahead is None:
+        months_ahead = settings.TASK_PARTITION_MONTHS_AHEAD
+    today = timezone.now().date()
+    last = month_start(today)
+    for _ in range(months_ahead):
+        last = next_month(last)
+
+    return [
+        f"CREATE TABLE {TABLE}_default PARTITION OF {TABLE} DEFAULT",
+        *(
+            month_partition_sql(month)
+            for month in months_between(first_month or today, last)
+        ),
+    ]
+
+
+def with_partition_key(unique_sql, key):
+    """Add the ``key`` columns to the column list of a UNIQUE definition."""
+
+    def add_key(match):
+        columns = [column.strip() for column in match[1].split(",")]
+        columns += [column for column in key if column not in columns]
+        return f"({', '.join(columns)})"
+
+    return re.sub(r"\(([^)]*)\)", add_key, unique_sql, count=1)
+
+
+def table_schema(connection=default_connection):
+    """
+    The task table's non-generated columns, its indexes that do not back a
+    constraint and its unique and foreign key constraints, each as a name
+    and its SQL definition.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT column_name FROM information_schema.columns "
+            "WHERE table_name = %s AND is_generated = 'NEVER' "
+            "ORDER BY ordinal_position",
+            [TABLE],
+        )
+        columns = [row[0] for row in cursor.fetchall()]
+        cursor.execute(
+            "SELECT class.relname, pg_get_indexdef(class.oid) "
+            "FROM pg_index JOIN pg_class class "
+            "ON class.oid = pg_index.indexrelid "
+            "WHERE pg_index.indrelid = %s::regclass AND NOT EXISTS ("
+            "SELECT 1 FROM pg_constraint "
+            "WHERE pg_constraint.conindid = pg_index.indexrelid) "
+            "ORDER BY class.relname",
+            [TABLE],
+        )
+        indexes = cursor.fetchall()
+        cursor.execute(
+            "SELECT conname, contype, pg_get_constraintdef(oid) "
+            "FROM pg_constraint "
+            "WHERE conrelid = %s::regclass AND contype IN ('u', 'f') "
+            "ORDER BY contype DESC, conname",
+            [TABLE],
+        )
+        constraints = cursor.fetchall()
+    return {
+        "columns": columns,
+        "indexes": indexes,
+        "constraints": constraints,
+    }
+
+
+def conversion_sql(scheme, first_month=None, months_ahead=None, schema=None):
+    """
+    ``schema`` is the table's ``table_schema()``. Without it, e.g. for a
+    preview away from Postgres, every column is copied and no index or
+    constraint besides the partition key is created.
+    """
+    if scheme not in SCHEMES:
+        raise ValueError(f"Unknown partitioning scheme {scheme!r}")
+    schema = schema or {"columns": [], "indexes": [], "constraints": []}
+    key_columns = PARTITION_KEYS[scheme]
+
+    if scheme == "state":
+        partition_by = "LIST (is_completed)"
+        key = "PRIMARY KEY (id, is_completed)"
+    else:
+        partition_by = "RANGE (deadline)"
+        # deadline is nullable, so it cannot be part of a primary key.
+        key = "UNIQUE (id, deadline)"
+
+    # Generated columns are recomputed and cannot be copied.
+    columns = schema["columns"]
+    copied = ", ".join(columns) if columns else "*"
+    target = f"{TABLE} ({copied})" if columns else TABLE
+
+    # Indexes are relations whose names must be freed on the old table.
+    # Unique constraints are backed by an index of the same name.
+    unique = [
+        (name, definition)
+        for name, kind, definition in schema["constraints"]
+        if kind == "u"
+    ]
+    foreign_keys = [
+        (name, definition)
+        for name, kind, definition in schema["constraints"]
+        if kind == "f"
+    ]
+
+    return [
+        f"ALTER TABLE {TABLE} RENAME TO {UNPARTITIONED_TABLE}",
+        *(
+            f"ALTER TABLE {UNPARTITIONED_TABLE} DROP CONSTRAINT {name}"
+            for name, _ in unique
+        ),
+        *(f"DROP INDEX {name}" for name, _ in schema["indexes"]),
+        f"CREATE TABLE {TABLE} (LIKE {UNPARTITIONED_TABLE} "
+        f"INCLUDING DEFAULTS INCLUDING IDENTITY INCLUDING GENERATED "
+        f"INCLUDING CONSTRAINTS) "
+        f"PARTITION BY {partition_by}",
+        f"ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_partition_key {key}",
+        *partitions_sql(scheme, first_month, months_ahead),
+        f"INSERT INTO {target} OVERRIDING SYSTEM VALUE "
+        f"SELECT {copied} FROM {UNPARTITIONED_TABLE}",
+        f"SELECT setval(pg_get_serial_sequence('{TABLE}', 'id'), "
+        f"COALESCE((SELECT MAX(id) FROM {TABLE}), 0) + 1, false)",
+        # Captured before the rename, the definitions name the new table.
+        *(definition for _, definition in schema["indexes"]),
+        *(
+            f"ALTER TABLE {TABLE} ADD CONSTRAINT {name} "
+            f"{with_partition_key(definition, key_columns)}"
+            for name, definition in unique
+        ),
+        *(
+            f"ALTER TABLE {TABLE} ADD CONSTRAINT {name} {definition}"
+            for name, definition in foreign_keys
+        ),
+        f"DROP TABLE {UNPARTITIONED_TABLE} CASCADE",
+    ]
+
+
+def backfill_start(first_deadline, months_back=None):
+    """
+    First month to create a partition for, at most ``months_back`` months
+    before the current one; older deadlines stay in the default partition.
+    """
+    if first_deadline is None:
+        return None
+    if months_back is None:
+        months_back = settings.TASK_PARTITION_MONTHS_BACK
+    earliest = month_start(timezone.now().date())
+    for _ in range(months_back):
+        earliest = previous_month(earliest)
+    return max(month_start(first_deadline), earliest)
+
+
+def convert(scheme, connection=default_connection):
+    first_month = None
+    schema = table_schema(connection)
+    with connection.cursor() as cursor:
+        if scheme == "deadline_month":
+            cursor.execute(f"SELECT MIN(deadline) FROM {TABLE}")
+            first_deadline = cursor.fetchone()[0]
+            if first_deadline is not None:
+                first_month = backfill_start(first_deadline.date())
+        for statement in conversion_sql(scheme, first_month, schema=schema):
+            cursor.execute(statement)
+
+
+def existing_partitions(connection=default_connection):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = %s::regclass",
+            [TABLE],
+        )
+        return {row[0] for row in cursor.fetchall()}
+
+
+def create_future_partitions(months_ahead=None, connection=default_connection):
+    """
+    Create the partitions of the current month and ``months_ahead`` months,
+    each in a transaction that moves its rows out of the default partition.
+    Returns the statements that were run.
+    """
+    if settings.TASK_PARTITIONING != "deadline_month":
+        return []
+    if partition_key(connection) != ["deadline"]:
+        return []
+    if months_ahead is None:
+        months_ahead = settings.TASK_PARTITION_MONTHS_AHEAD
+
+    first = month_start(timezone.now().date())
+    last = first
+    for _ in range(months_ahead):
+        last = next_month(last)
+    existing = existing_partitions(connection)
+    columns = table_schema(connection)["columns"]
+
+    executed = []
+    for month in months_between(first, last):
+        if month_partition_name(month) in existing:
+            continue
+        statements = split_default_sql(month, columns)
+        with transaction.atomic(using=connection.alias):
+            with connection.cursor() as cursor:
+                for statement in statements:
+                    cursor.execute(statement)
+        executed += statements
+    return executed
+
+
+def integrity_problems():
+    """
+    Rows breaking what the database no longer enforces on a partitioned
+    task table, as one message per kind of problem.
+    """
+    from task_manager.models import Task, TaskDependency
+
+    TaskAssignee = Task.assignees.through
+    problems = []
+
+    for field in ("id", "name"):
+        duplicates = (
+            Task.objects.values(field)
+            .annotate(rows=Count("*"))
+            .filter(rows__gt=1)
+            .count()
+        )
+        if duplicates:
+            problems.append(f"{duplicates} task {field}(s) used twice")
+
+    def missing(column):
+        return ~Exists(Task.objects.filter(pk=OuterRef(column)))
+
+    for label, queryset in (
+        ("assignee", TaskAssignee.objects.filter(missing("task_id"))),
+        (
+            "dependency",
+            TaskDependency.objects.filter(
+                missing("task_id") | missing("blocker_id")
+            ),
+        ),
+    ):
+        orphans = queryset.count()
+        if orphans:
+            problems.append(f"{orphans} {label} row(s) of missing tasks")
+    return problems
+
+
+def scanned_partitions(queryset):
+    """Names of the task partitions the planner keeps for ``queryset``."""
+    return sorted(set(SCANNED_PARTITION_RE.findall(queryset.explain())))
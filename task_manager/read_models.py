@@ -0,0 +1,138 @@
+"""
+Lightweight rows for the task and worker lists.
+
+``as_rows`` turns a queryset into a ``values_list`` of only the listed
+columns whose results are ``__slots__`` rows with their display strings
+computed once, instead of full model instances carrying e.g.
+``Task.description`` or the worker's password hash. Slicing, counting and
+pagination work as on any queryset.
+"""
+from django.db.models.query import BaseIterable, ValuesListIterable
+from django.utils import timezone
+
+from task_manager.models import Task
+
+PRIORITY_LABELS = dict(Task.LevelPriority.choices)
+
+# Ranks shown in red, see Task.PRIORITY_RANKS.
+URGENT_RANK = Task.PRIORITY_RANKS[Task.LevelPriority.HIGH]
+
+
+class RowIterable(BaseIterable):
+    row_class = None
+
+    def __iter__(self):
+        make_row = self.row_class
+        for values in ValuesListIterable(
+            self.queryset, self.chunked_fetch, self.chunk_size
+        ):
+            yield make_row(*values)
+
+
+class ListRow:
+    __slots__ = ()
+    columns = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.iterable = type(
+            f"{cls.__name__}Iterable", (RowIterable,), {"row_class": cls}
+        )
+
+
+def as_rows(queryset, row_class):
+    queryset = queryset.values_list(*row_class.columns)
+    queryset._iterable_class = row_class.iterable
+    return queryset
+
+
+def format_date(value):
+    if value is None:
+        return ""
+    return timezone.localtime(value).strftime("%d.%m.%Y")
+
+
+class TaskRow(ListRow):
+    __slots__ = (
+        "id",
+        "name",
+        "deadline",
+        "is_completed",
+        "is_blocked",
+        "priority",
+        "priority_rank",
+        "deadline_display",
+        "priority_display",
+        "status_display",
+        "is_urgent",
+    )
+    columns = (
+        "pk",
+        "name",
+        "deadline",
+        "is_completed",
+        "is_blocked",
+        "priority",
+        "priority_rank",
+    )
+
+    def __init__(
+        self,
+        pk,
+        name,
+        deadline,
+        is_completed,
+        is_blocked,
+        priority,
+        priority_rank,
+    ):
+        self.id = pk
+        self.name = name
+        self.deadline = deadline
+        self.is_completed = is_completed
+        self.is_blocked = is_blocked
+        self.priority = priority
+        self.priority_rank = priority_rank
+        self.deadline_display = format_date(deadline)
+        self.priority_display = PRIORITY_LABELS.get(priority, priority)
+        self.status_display = "Done" if is_completed else "In Work"
+        self.is_urgent = priority_rank <= URGENT_RANK
+
+
+class WorkerRow(ListRow):
+    __slots__ = (
+        "id",
+        "username",
+        "first_name",
+        "last_name",
+        "position_display",
+        "open_task_count",
+        "assigned_task_count",
+    )
+    columns = (
+        "pk",
+        "username",
+        "first_name",
+        "last_name",
+        "position__name",
+        "open_task_count",
+        "assigned_task_count",
+    )
+
+    def __init__(
+        self,
+        pk,
+        username,
+        first_name,
+        last_name,
+        position_name,
+        open_task_count,
+        assigned_task_count,
+    ):
+        self.id = pk
+        self.username = username
+        self.first_name = first_name
+        self.last_name = last_name
+        self.position_display = position_name or ""
+        self.open_task_count = open_task_count
+        self.assigned_task_count = assigned_task_count
@@ -0,0 +1,193 @@
+import calendar
+import datetime
+import logging
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from task_manager import analytics, audit, counters, typeahead
+from task_manager.models import RecurringTask, Task
+
+logger = logging.getLogger(__name__)
+
+TaskAssignee = Task.assignees.through
+
+
+def add_months(value, months):
+    month = value.month - 1 + months
+    year = value.year + month // 12
+    month = month % 12 + 1
+    day = min(value.day, calendar.monthrange(year, month)[1])
+    return value.replace(year=year, month=month, day=day)
+
+
+def nth_occurrence(template, n):
+    """Computed from ``starts_at`` so monthly rules keep their day."""
+    step = n * (template.interval or 1)
+    if template.frequency == RecurringTask.Frequency.MONTHLY:
+        return add_months(template.starts_at, step)
+    days = 7 if template.frequency == RecurringTask.Frequency.WEEKLY else 1
+    return template.starts_at + datetime.timedelta(days=days * step)
+
+
+def first_index(template, after, strict):
+    """
+    Index of the first occurrence from ``after`` on (strictly after it if
+    ``strict``). Estimated from the elapsed time, then corrected by the odd
+    step that month lengths shift, so the template's history is not walked.
+    """
+    start = template.starts_at
+    if template.frequency == RecurringTask.Frequency.MONTHLY:
+        after_start = after.astimezone(start.tzinfo)
+        elapsed = (after_start.year - start.year) * 12 + (
+            after_start.month - start.month
+        )
+    else:
+        days = 7 if template.frequency == RecurringTask.Frequency.WEEKLY else 1
+        elapsed = (after - start) // datetime.timedelta(days=days)
+    n = max(elapsed // (template.interval or 1), 0)
+
+    def passed(value):
+        return value <= after if strict else value < after
+
+    while n > 0 and not passed(nth_occurrence(template, n - 1)):
+        n -= 1
+    while passed(nth_occurrence(template, n)):
+        n += 1
+    return n
+
+
+def occurrences(template, until, now=None):
+    """
+    Occurrences after ``generated_until`` up to ``until``. A template that
+    was never generated starts with its first occurrence from ``now`` on.
+    """
+    if template.generated_until is not None:
+        n = first_index(template, template.generated_until, strict=True)
+    else:
+        n = first_index(template, now or timezone.now(), strict=False)
+    while (value := nth_occurrence(template, n)) <= until:
+        yield value
+        n += 1
+
+
+def occurrence_name(template, occurrence):
+    day = timezone.localtime(occurrence).date()
+    return f"{template.name} - {day.isoformat()}"
+
+
+def materialize_batch(templates, until, now=None):
+    """Create the upcoming tasks of ``templates`` with bulk inserts."""
+    now = now or timezone.now()
+    planned = [
+        (template, occurrence)
+        for template in templates
+        for occurrence in occurrences(template, until, now)
+    ]
+
+    existing = taken = set()
+    with transaction.atomic():
+        # Concurrent runs wait for each other before the checks below. On a
+        # partitioned task table unique_task_occurrence only holds within a
+        # partition (see partitioning.AddTaskConstraint).
+        list(
+            RecurringTask.objects.select_for_update()
+            .filter(pk__in=[template.pk for template in templates])
+            .order_by("pk")
+            .values_list("pk", flat=True)
+        )
+        if planned:
+            # Skip what a previous, interrupted run already created.
+            existing = set(
+                Task.objects.filter(
+                    recurrence__in=templates,
+                    occurrence__gte=min(occ for _, occ in planned),
+                ).values_list("recurrence_id", "occurrence")
+            )
+            taken = set(
+                Task.objects.filter(
+                    name__in=[
+                        occurrence_name(template, occurrence)
+                        for template, occurrence in planned
+                    ]
+                ).values_list("name", flat=True)
+            )
+        tasks = []
+        for template, occurrence in planned:
+            name = occurrence_name(template, occurrence)
+            if (template.pk, occurrence) in existing:
+                continue
+            if name in taken:
+                logger.warning("Skipping %s: the name is taken", name)
+                continue
+            tasks.append(
+                Task(
+                    name=name,
+                    description=template.description,
+                    deadline=occurrence,
+                    priority=template.priority,
+                    task_type_id=template.task_type_id,
+                    recurrence=template,
+                    occurrence=occurrence,
+                    created_at=now,
+                )
+            )
+        tasks = Task.objects.bulk_create(tasks)
+
+        pairs = [
+            (task.pk, worker.pk)
+            for task in tasks
+            for worker in task.recurrence.assignees.all()
+        ]
+        TaskAssignee.objects.bulk_create(
+            [
+                TaskAssignee(task_id=task_id, worker_id=worker_id)
+                for task_id, worker_id in pairs
+            ]
+        )
+
+        # bulk_create sends no signals.
+        counters.tasks_created(tasks)
+        counters.assignments_changed(pairs, 1)
+        analytics.tasks_created(tasks)
+        for task in tasks:
+            audit.task_saved(task, True, {})
+        audit.assignees_changed(pairs, assigned=True)
+        if tasks:
+            typeahead.clear("tasks")
+
+        RecurringTask.objects.filter(
+            pk__in=[template.pk for template in templates]
+        ).update(generated_until=until)
+    return len(tasks)
+
+
+def materialize(days=None, batch_size=None, progress=None, now=None):
+    """Create the occurrences of every active template for ``days`` ahead."""
+    if days is None:
+        days = settings.RECURRING_TASK_HORIZON_DAYS
+    batch_size = batch_size or settings.RECURRING_TASK_BATCH_SIZE
+    now = now or timezone.now()
+    until = now + datetime.timedelta(days=days)
+    templates = (
+        RecurringTask.objects.filter(is_active=True, starts_at__lte=until)
+        .exclude(generated_until__gte=until)
+        .prefetch_related("assignees")
+        .order_by("pk")
+    )
+    total = 0
+
+    with audit.buffered():
+        last_pk = 0
+        while True:
+            batch = list(templates.filter(pk__gt=last_pk)[:batch_size])
+            if not batch:
+                break
+            last_pk = batch[-1].pk
+            count = materialize_batch(batch, until, now)
+            total += count
+            logger.info("Created %s recurring tasks (%s so far)", count, total)
+            if progress is not None:
+                progress(count, total)
+    return total
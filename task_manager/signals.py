@@ -0,0 +1,204 @@
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+)
+from django.dispatch import receiver
+
+from task_manager import (
+    analytics,
+    archive,
+    audit,
+    auth,
+    counters,
+    dependencies,
+    events,
+    ical,
+    typeahead,
+)
+from task_manager.models import (
+    Position,
+    Task,
+    TaskDependency,
+    TaskType,
+    Worker,
+)
+
+TaskAssignee = Task.assignees.through
+
+
+TYPEAHEAD_FIELDS = {
+    Task: ("name",),
+    Worker: ("username", "first_name", "last_name", "is_active"),
+}
+
+
+def _remember_loaded_values(instance, *fields):
+    loaded = getattr(instance, "_loaded_values", {})
+    for field in fields:
+        loaded[field] = getattr(instance, field)
+    instance._loaded_values = loaded
+
+
+# Runs before the receivers below update _loaded_values.
+@receiver(post_save, sender=Task)
+@receiver(post_save, sender=Worker)
+def searchable_saved(sender, instance, created, **kwargs):
+    loaded = getattr(instance, "_loaded_values", {})
+    if created or any(
+        loaded.get(field) != getattr(instance, field)
+        for field in TYPEAHEAD_FIELDS[sender]
+    ):
+        typeahead.clear("tasks" if sender is Task else "workers")
+
+
+@receiver(post_delete, sender=Task)
+@receiver(post_delete, sender=Worker)
+def searchable_deleted(sender, instance, **kwargs):
+    typeahead.clear("tasks" if sender is Task else "workers")
+
+
+@receiver(post_save, sender=Task)
+def task_saved(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    loaded = getattr(instance, "_loaded_values", {})
+    audit.task_saved(instance, created, loaded)
+    events.task_saved(instance, created)
+    if created:
+        counters.task_created(instance)
+        analytics.task_created(instance)
+    else:
+        was_completed = loaded.get("is_completed", instance.is_completed)
+        old_task_type_id = loaded.get("task_type_id", instance.task_type_id)
+        old_priority = loaded.get("priority", instance.priority)
+        if (
+            was_completed != instance.is_completed
+            or old_task_type_id != instance.task_type_id
+        ):
+            counters.task_changed(instance, was_completed, old_task_type_id)
+        if was_completed != instance.is_completed:
+            dependencies.completion_changed([instance.pk])
+        if any(
+            field in loaded and loaded[field] != getattr(instance, field)
+            for field in ical.FEED_FIELDS
+        ):
+            counters.tasks_touched([instance.pk])
+        if (
+            was_completed != instance.is_completed
+            or old_task_type_id != instance.task_type_id
+            or old_priority != instance.priority
+        ):
+            analytics.task_changed(
+                instance,
+                was_completed,
+                old_task_type_id,
+                old_priority,
+                loaded.get("completed_at"),
+            )
+    _remember_loaded_values(instance, "completed_at", *audit.TRACKED_FIELDS)
+
+
+@receiver(pre_delete, sender=Task)
+def task_deleting(sender, instance, origin=None, **kwargs):
+    if archive.is_archiving():
+        return
+    counters.task_deleted(instance)
+    audit.record(
+        instance.pk, audit.Action.DELETED, {"name": [instance.name, None]}
+    )
+    events.task_deleted(instance)
+    # Daily stats of a deleted task type are removed with it.
+    if not isinstance(origin, TaskType):
+        analytics.task_deleted(instance)
+    # The dependency rows are gone by post_delete.
+    instance._dependent_ids = dependencies.dependent_ids([instance.pk])
+
+
+@receiver(post_delete, sender=Task)
+def task_deleted(sender, instance, **kwargs):
+    dependencies.refresh_blocked(getattr(instance, "_dependent_ids", ()))
+
+
+@receiver(post_save, sender=Worker)
+def worker_saved(sender, instance, created, raw=False, **kwargs):
+    auth.invalidate(instance.pk)
+    if raw:
+        return
+    if not created:
+        loaded = getattr(instance, "_loaded_values", {})
+        old_position_id = loaded.get("position_id", instance.position_id)
+        if old_position_id != instance.position_id:
+            counters.worker_moved(instance, old_position_id)
+    _remember_loaded_values(instance, "position_id")
+
+
+@receiver(pre_delete, sender=Worker)
+def worker_deleting(sender, instance, **kwargs):
+    counters.assignments_changed(
+        TaskAssignee.objects.filter(worker_id=instance.pk).values_list(
+            "task_id", "worker_id"
+        ),
+        -1,
+    )
+
+
+@receiver(post_delete, sender=Worker)
+def worker_deleted(sender, instance, **kwargs):
+    auth.invalidate(instance.pk)
+
+
+@receiver(post_save, sender=Position)
+@receiver(post_delete, sender=Position)
+def position_changed(sender, instance, **kwargs):
+    auth.invalidate_position(instance.pk)
+
+
+@receiver(m2m_changed, sender=TaskAssignee)
+def assignees_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == "post_add":
+        if reverse:
+            pairs = [(task_id, instance.pk) for task_id in pk_set]
+        else:
+            pairs = [(instance.pk, worker_id) for worker_id in pk_set]
+        counters.assignments_changed(pairs, 1)
+        audit.assignees_changed(pairs, assigned=True)
+        events.assignees_changed(pairs, assigned=True)
+
+    elif action in ("pre_remove", "pre_clear"):
+        if reverse:
+            rows = TaskAssignee.objects.filter(worker_id=instance.pk)
+            if pk_set is not None:
+                rows = rows.filter(task_id__in=pk_set)
+        else:
+            rows = TaskAssignee.objects.filter(task_id=instance.pk)
+            if pk_set is not None:
+                rows = rows.filter(worker_id__in=pk_set)
+        pairs = list(rows.values_list("task_id", "worker_id"))
+        counters.assignments_changed(pairs, -1)
+        audit.assignees_changed(pairs, assigned=False)
+        events.assignees_changed(pairs, assigned=False)
+
+
+@receiver(m2m_changed, sender=TaskDependency)
+def dependencies_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == "pre_add":
+        if reverse:
+            pairs = [(task_id, instance.pk) for task_id in pk_set]
+        else:
+            pairs = [(instance.pk, blocker_id) for blocker_id in pk_set]
+        # Sent inside the transaction that inserts the rows.
+        dependencies.lock_graph(pairs)
+        dependencies.check_cycles(pairs)
+
+    elif action == "pre_clear" and reverse:
+        instance._dependent_ids = dependencies.dependent_ids([instance.pk])
+
+    elif action in ("post_add", "post_remove", "post_clear"):
+        if not reverse:
+            dependencies.refresh_blocked([instance.pk])
+        elif pk_set is not None:
+            dependencies.refresh_blocked(pk_set)
+        else:
+            dependencies.refresh_blocked(instance._dependent_ids)
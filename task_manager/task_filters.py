@@ -0,0 +1,110 @@
+"""
+Filtering and sorting of the task board.
+
+Only the orderings listed in ``ORDERINGS`` are accepted and every one of them
+is backed by an index on the task table, alone or together with any single
+filter of ``TaskFilterForm`` (see ``unindexed_combinations``).
+
+The name filter is a substring match, ``UPPER(name) LIKE UPPER('%x%')``. On
+PostgreSQL the trigram index ``task_name_trgm_idx`` serves it; elsewhere the
+rows are filtered while walking the index of the ordering.
+"""
+import datetime
+import re
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from task_manager.models import Task
+
+ORDERINGS = {
+    "deadline": ("deadline", "pk"),
+    "-deadline": ("-deadline", "-pk"),
+    "priority": ("priority_rank", "deadline", "pk"),
+    "name": ("name",),
+    "-name": ("-name",),
+}
+
+DEFAULT_ORDERING = "deadline"
+
+FULL_SCAN_RE = {
+    "sqlite": re.compile(r"\bSCAN task_manager_task\b(?! USING)"),
+    "postgresql": re.compile(r"Seq Scan on task_manager_task(?!_assignees)"),
+}
+
+
+def day_start(day):
+    return timezone.make_aware(datetime.datetime.combine(day, datetime.time()))
+
+
+def filter_tasks(queryset, data):
+    """Apply the cleaned data of a ``TaskFilterForm`` to ``queryset``."""
+    if data.get("name"):
+        queryset = queryset.filter(name__icontains=data["name"])
+    if data.get("status") == "open":
+        queryset = queryset.filter(is_completed=False)
+    elif data.get("status") == "actionable":
+        queryset = queryset.filter(is_completed=False, is_blocked=False)
+    elif data.get("status") == "done":
+        queryset = queryset.filter(is_completed=True)
+    if data.get("priority"):
+        queryset = queryset.filter(priority=data["priority"])
+    if data.get("task_type") is not None:
+        queryset = queryset.filter(task_type=data["task_type"])
+    if data.get("assignee") is not None:
+        queryset = queryset.filter(assignees=data["assignee"])
+    # Compare against datetimes rather than ``__date`` so that the deadline
+    # index stays usable.
+    if data.get("deadline_after") is not None:
+        queryset = queryset.filter(
+            deadline__gte=day_start(data["deadline_after"])
+        )
+    if data.get("deadline_before") is not None:
+        queryset = queryset.filter(
+            deadline__lt=day_start(
+                data["deadline_before"] + datetime.timedelta(days=1)
+            )
+        )
+    return queryset.order_by(
+        *ORDERINGS[data.get("sort") or DEFAULT_ORDERING]
+    )
+
+
+def sample_filters():
+    """One example value for every filter; only the query plans matter."""
+    today = timezone.localdate()
+    return {
+        "name": {"name": "fix"},
+        "status": {"status": "open"},
+        "actionable": {"status": "actionable"},
+        "priority": {"priority": Task.LevelPriority.URGENT},
+        "task_type": {"task_type": 1},
+        "assignee": {"assignee": 1},
+        "deadline": {"deadline_after": today, "deadline_before": today},
+    }
+
+
+def uses_index(queryset):
+    """Whether the plan of ``queryset`` avoids a full scan of the tasks."""
+    full_scan = FULL_SCAN_RE.get(connection.vendor)
+    if full_scan is None:
+        return True
+    with transaction.atomic():
+        if connection.vendor == "postgresql":
+            # Small tables are cheaper to scan; ask whether an index exists.
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+        return not full_scan.search(queryset.explain())
+
+
+def unindexed_combinations():
+    """``(filter, sort)`` pairs whose query has to scan the whole table."""
+    filters = {"none": {}, **sample_filters()}
+    return [
+        (name, sort)
+        for name, data in filters.items()
+        for sort in ORDERINGS
+        if not uses_index(
+            filter_tasks(Task.objects.all(), {**data, "sort": sort})
+        )
+    ]
@@ -0,0 +1,115 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager.models import Position, Task, TaskChange, TaskType
+from task_manager.pagination import EstimatedCountPaginator
+
+
+class AdminTest(TestCase):
+
+    def setUp(self):
+        self.admin = get_user_model().objects.create_superuser(
+            username="admin_test", password="test123"
+        )
+        self.client.force_login(self.admin)
+        self.task_type = TaskType.objects.create(name="Bug")
+        position = Position.objects.create(name="Dev")
+        for i in range(5):
+            get_user_model().objects.create_user(
+                username=f"worker_{i}", password="test123", position=position
+            )
+            Task.objects.create(name=f"Task {i}", task_type=self.task_type)
+
+    def changelist_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_changelists_do_not_query_per_row(self):
+        # Loads and caches the logged in worker.
+        self.client.get(reverse("admin:index"))
+        tasks = self.changelist_queries(
+            reverse("admin:task_manager_task_changelist")
+        )
+        workers = self.changelist_queries(
+            reverse("admin:task_manager_worker_changelist")
+        )
+
+        for i in range(5, 10):
+            Task.objects.create(name=f"Task {i}", task_type=self.task_type)
+            get_user_model().objects.create_user(username=f"worker_{i}")
+
+        self.assertEqual(
+            self.changelist_queries(
+                reverse("admin:task_manager_task_changelist")
+            ),
+            tasks,
+        )
+        self.assertEqual(
+            self.changelist_queries(
+                reverse("admin:task_manager_worker_changelist")
+            ),
+            workers,
+        )
+
+    def test_task_form_does_not_list_every_worker(self):
+        response = self.client.get(reverse("admin:task_manager_task_add"))
+
+        self.assertNotContains(response, "worker_4")
+        self.assertContains(response, "admin-autocomplete")
+
+    def test_prefix_search(self):
+        Task.objects.create(name="Fix login", task_type=self.task_type)
+        url = reverse("admin:task_manager_task_changelist")
+
+        self.assertContains(self.client.get(url, {"q": "fix"}), "Fix login")
+        self.assertNotContains(
+            self.client.get(url, {"q": "login"}), "Fix login"
+        )
+
+    def test_task_search_uses_lowercased_column(self):
+        Task.objects.create(name="Fix Login page", task_type=self.task_type)
+        url = reverse("admin:task_manager_task_changelist")
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {"q": "  FIX  login"})
+
+        self.assertContains(response, "Fix Login page")
+        sql = " ".join(query["sql"] for query in queries)
+        self.assertIn('"search_name" LIKE', sql)
+        self.assertNotIn('UPPER("task_manager_task"."name"', sql)
+
+    @override_settings(COUNT_ESTIMATE_THRESHOLD=3)
+    def test_estimated_count_paginator(self):
+        paginator = EstimatedCountPaginator(Task.objects.all(), 2)
+        self.assertEqual(paginator.count, 5)
+        self.assertEqual(paginator.num_pages, 3)
+
+        paginator = EstimatedCountPaginator(
+            Task.objects.filter(name="Task 1"), 2
+        )
+        with self.assertNumQueries(1):
+            self.assertEqual(paginator.count, 1)
+
+    def test_mark_completed_action(self):
+        pks = list(Task.objects.values_list("pk", flat=True)[:3])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                reverse("admin:task_manager_task_changelist"),
+                {"action": "mark_completed", "_selected_action": pks},
+            )
+
+        self.assertEqual(Task.objects.filter(is_completed=True).count(), 3)
+        self.task_type.refresh_from_db()
+        self.assertEqual(self.task_type.open_task_count, 2)
+        self.assertEqual(
+            TaskChange.objects.filter(
+                task_id__in=pks, action=TaskChange.Action.UPDATED
+            ).count(),
+            3,
+        )
@@ -0,0 +1,176 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from task_manager.analytics import (
+    burndown_series,
+    refresh_rollups,
+)
+from task_manager.completion import set_completed
+from task_manager.models import (
+    Position,
+    Task,
+    TaskDailyStat,
+    TaskType,
+    WorkloadRollup,
+)
+
+
+class WorkloadRollupTest(TestCase):
+
+    def setUp(self):
+        position = Position.objects.create(name="Dev")
+        self.worker = get_user_model().objects.create_user(
+            username="john_test", password="test123", position=position
+        )
+        self.task_type = TaskType.objects.create(name="Bug")
+        yesterday = timezone.now() - timedelta(days=1)
+
+        overdue = Task.objects.create(
+            name="Overdue",
+            task_type=self.task_type,
+            deadline=yesterday,
+            priority=Task.LevelPriority.URGENT,
+        )
+        done = Task.objects.create(
+            name="Done",
+            task_type=self.task_type,
+            deadline=yesterday,
+            is_completed=True,
+        )
+        Task.objects.create(name="Open", task_type=self.task_type)
+        self.worker.assigned_tasks.add(overdue, done)
+
+    def rollup(self, dimension, key):
+        return WorkloadRollup.objects.get(dimension=dimension, key=key)
+
+    def test_refresh_rollups(self):
+        refresh_rollups()
+
+        task_type = self.rollup("task_type", self.task_type.pk)
+        self.assertEqual(
+            (
+                task_type.open_count,
+                task_type.overdue_count,
+                task_type.completed_count,
+            ),
+            (2, 1, 1),
+        )
+
+        worker = self.rollup("worker", self.worker.pk)
+        self.assertEqual(worker.label, "john_test")
+        self.assertEqual(worker.completion_rate, 50)
+
+        self.assertEqual(self.rollup("priority", "UR").label, "Urgent")
+        position = self.rollup("position", self.worker.position_id)
+        self.assertEqual(position.overdue_count, 1)
+
+    def test_refresh_replaces_rows(self):
+        refresh_rollups()
+        Task.objects.filter(name="Overdue").delete()
+
+        call_command("refresh_workload_rollups", stdout=StringIO())
+
+        self.assertFalse(
+            WorkloadRollup.objects.filter(dimension="priority", key="UR")
+        )
+
+    def test_report_view_reads_rollups_only(self):
+        refresh_rollups()
+        self.client.force_login(self.worker)
+
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse("task-manager:workload-report"))
+
+        self.assertContains(response, "john_test")
+        self.assertContains(response, "50%")
+
+
+class DailyStatTest(TestCase):
+
+    def setUp(self):
+        self.task_type = TaskType.objects.create(name="Bug")
+        self.task = Task.objects.create(name="Open", task_type=self.task_type)
+        Task.objects.create(
+            name="Done", task_type=self.task_type, is_completed=True
+        )
+
+    def stat(self, priority=Task.LevelPriority.LOW):
+        return TaskDailyStat.objects.get(
+            day=timezone.localdate(),
+            task_type=self.task_type,
+            priority=priority,
+        )
+
+    def counts(self, stat):
+        return stat.created_count, stat.completed_count, stat.open_count
+
+    def test_created_tasks_are_counted(self):
+        self.assertEqual(self.counts(self.stat()), (2, 1, 1))
+
+    def test_completion_and_priority_changes(self):
+        self.task.priority = Task.LevelPriority.URGENT
+        self.task.save()
+        self.assertEqual(self.stat().open_count, 0)
+        self.assertEqual(self.stat("UR").open_count, 1)
+
+        self.task.is_completed = True
+        self.task.save()
+        self.assertEqual(self.counts(self.stat("UR")), (0, 1, 0))
+
+        self.task.is_completed = False
+        self.task.save()
+        self.assertEqual(self.counts(self.stat("UR")), (0, 0, 1))
+
+    def test_bulk_completion(self):
+        completed = Task.objects.filter(task_type=self.task_type)
+
+        self.assertEqual(set_completed(completed), 1)
+
+        self.task.refresh_from_db()
+        self.assertIsNotNone(self.task.completed_at)
+        self.assertEqual(self.counts(self.stat()), (2, 2, 0))
+        self.task_type.refresh_from_db()
+        self.assertEqual(self.task_type.open_task_count, 0)
+
+    def test_rebuild_recounts_from_tasks(self):
+        self.task.delete()
+        self.assertEqual(self.counts(self.stat()), (2, 1, 0))
+
+        call_command("rebuild_daily_stats", stdout=StringIO())
+
+        self.assertEqual(self.counts(self.stat()), (1, 1, 0))
+
+    def test_burndown_carries_open_count_forward(self):
+        today = timezone.localdate()
+        TaskDailyStat.objects.create(
+            day=today - timedelta(days=10),
+            task_type=self.task_type,
+            priority=Task.LevelPriority.HIGH,
+            open_count=4,
+        )
+
+        series = burndown_series(days=3, today=today)
+
+        self.assertEqual([day["open"] for day in series], [4, 4, 5])
+        self.assertEqual(series[-1]["completed"], 1)
+
+    def test_burndown_view(self):
+        user = get_user_model().objects.create_user(
+            username="john_test", password="test123"
+        )
+        self.client.force_login(user)
+
+        response = self.client.get(
+            reverse("task-manager:burndown"),
+            {"days": 7, "task_type": self.task_type.pk, "priority": "LW"},
+        )
+
+        days = response.json()["days"]
+        self.assertEqual(len(days), 7)
+        self.assertEqual(days[-1]["created"], 2)
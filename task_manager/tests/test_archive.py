@@ -0,0 +1,97 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from task_manager.archive import archive_completed_tasks
+from task_manager.models import ArchivedTask, Task, TaskChange, TaskType
+
+
+class ArchiveTest(TestCase):
+
+    def setUp(self):
+        self.worker = get_user_model().objects.create_user(
+            username="john_test",
+            password="test123",
+        )
+        self.task_type = TaskType.objects.create(name="Bug")
+        old = timezone.now() - timedelta(days=100)
+
+        for i in range(5):
+            task = Task.objects.create(
+                name=f"Old - {i}",
+                task_type=self.task_type,
+                deadline=old,
+                is_completed=True,
+                completed_at=old,
+            )
+            task.assignees.add(self.worker)
+        Task.objects.create(
+            name="Recent",
+            task_type=self.task_type,
+            is_completed=True,
+        )
+        Task.objects.create(name="Open", task_type=self.task_type)
+
+    def test_archive_moves_old_completed_tasks(self):
+        archived = archive_completed_tasks(days=30, batch_size=2)
+
+        self.assertEqual(archived, 5)
+        self.assertEqual(
+            sorted(Task.objects.values_list("name", flat=True)),
+            ["Open", "Recent"],
+        )
+        self.assertEqual(ArchivedTask.objects.count(), 5)
+        self.assertEqual(self.worker.archived_tasks.count(), 5)
+        self.assertFalse(self.worker.assigned_tasks.exists())
+
+    def test_archive_is_not_recorded_as_deletion(self):
+        pks = set(
+            Task.objects.filter(name__startswith="Old").values_list(
+                "pk", flat=True
+            )
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            archive_completed_tasks(days=30)
+
+        self.assertEqual(
+            set(ArchivedTask.objects.values_list("task_id", flat=True)), pks
+        )
+        self.assertEqual(
+            sorted(TaskChange.objects.values_list("task_id", "action")),
+            [(pk, TaskChange.Action.ARCHIVED) for pk in sorted(pks)],
+        )
+        self.task_type.refresh_from_db()
+        self.assertEqual(self.task_type.task_count, 2)
+
+    def test_archive_is_idempotent(self):
+        archive_completed_tasks(days=30)
+
+        self.assertEqual(archive_completed_tasks(days=30), 0)
+        self.assertEqual(ArchivedTask.objects.count(), 5)
+
+    def test_archive_command(self):
+        call_command("archive_tasks", "--days", "30", stdout=StringIO())
+
+        self.assertEqual(ArchivedTask.objects.count(), 5)
+
+    def test_archived_task_views(self):
+        archive_completed_tasks(days=30)
+        self.client.force_login(self.worker)
+
+        response = self.client.get(
+            reverse("task-manager:archived-task-list") + "?name=Old - 1"
+        )
+        self.assertEqual(len(response.context["archivedtask_list"]), 1)
+
+        task = ArchivedTask.objects.get(name="Old - 1")
+        response = self.client.get(
+            reverse("task-manager:archived-task-detail", args=[task.id])
+        )
+        self.assertContains(response, "Old - 1")
+        self.assertContains(response, "@john_test")
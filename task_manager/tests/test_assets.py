@@ -0,0 +1,38 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import SimpleTestCase
+
+from task_manager.assets import build_bundle, rebase_css_urls
+
+
+class AssetBundleTest(SimpleTestCase):
+
+    def test_css_urls_are_rebased(self):
+        css = (
+            "a{background:url(../img/a.png)}"
+            "b{background:url('data:image/svg+xml,x')}"
+        )
+
+        rebased = rebase_css_urls(css, "assets/css/kit.css", "dist/app.css")
+
+        self.assertIn("url(../assets/img/a.png)", rebased)
+        self.assertIn("url('data:image/svg+xml,x')", rebased)
+
+    def test_source_maps_are_dropped(self):
+        bundle = build_bundle("dist/app.js", ["assets/js/core/popper.min.js"])
+
+        self.assertNotIn("sourceMappingURL", bundle)
+
+    def test_committed_bundles_are_up_to_date(self):
+        call_command("build_assets", "--check", stdout=StringIO())
+
+    def test_pages_only_load_local_assets(self):
+        out = StringIO()
+
+        call_command("asset_report", stdout=out)
+
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), 3)
+        for line in lines:
+            self.assertIn("(0 third-party)", line)
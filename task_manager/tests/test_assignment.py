@@ -0,0 +1,128 @@
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from task_manager.assignment import auto_assign, load_heap, plan
+from task_manager.models import Position, Task, TaskType
+
+
+class AutoAssignTest(TestCase):
+
+    def setUp(self):
+        self.developer = Position.objects.create(name="Developer")
+        self.tester = Position.objects.create(name="QA")
+        self.busy, self.free = (
+            get_user_model().objects.create_user(
+                username=username, password="test123", position=self.developer
+            )
+            for username in ("busy", "free")
+        )
+        self.qa = get_user_model().objects.create_user(
+            username="qa", password="test123", position=self.tester
+        )
+        self.task_type = TaskType.objects.create(name="Bug")
+        self.existing = Task.objects.create(
+            name="Existing", task_type=self.task_type
+        )
+        self.existing.assignees.add(self.busy)
+
+    def create_tasks(self, count):
+        return [
+            Task.objects.create(name=f"Task {i}", task_type=self.task_type)
+            for i in range(count)
+        ]
+
+    def test_plan_balances_load(self):
+        heap = [(0, 2), (3, 1), (1, 3)]
+
+        pairs = plan([10, 11, 12, 13], heap, assigned={(11, 2)})
+
+        self.assertEqual(pairs, [(10, 2), (11, 3), (12, 2), (13, 2)])
+
+    def test_least_loaded_workers_of_the_position(self):
+        self.assertEqual(
+            sorted(load_heap(self.developer)),
+            [(0, self.free.pk), (1, self.busy.pk)],
+        )
+
+        # The number of queries does not grow with the number of tasks.
+        tasks = self.create_tasks(3)
+        with self.assertNumQueries(12):
+            auto_assign(tasks, self.developer)
+
+        self.busy.refresh_from_db()
+        self.free.refresh_from_db()
+        self.assertEqual(self.busy.open_task_count, 2)
+        self.assertEqual(self.free.open_task_count, 2)
+        self.assertFalse(self.qa.assigned_tasks.exists())
+
+    def test_task_create_auto_assigns(self):
+        self.client.force_login(self.busy)
+
+        response = self.client.post(
+            reverse("task-manager:task-create"),
+            {
+                "name": "Fix",
+                "task_type": self.task_type.pk,
+                "priority": "LW",
+                "deadline": "2030-01-01T10:00",
+                "auto_assign": self.developer.pk,
+            },
+        )
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(
+            list(Task.objects.get(name="Fix").assignees.all()), [self.free]
+        )
+
+    def test_task_is_not_created_without_eligible_workers(self):
+        self.client.force_login(self.busy)
+
+        # The position empties after the form was validated.
+        with mock.patch("task_manager.assignment.load_heap", return_value=[]):
+            response = self.client.post(
+                reverse("task-manager:task-create"),
+                {
+                    "name": "Fix",
+                    "task_type": self.task_type.pk,
+                    "priority": "LW",
+                    "deadline": "2030-01-01T10:00",
+                    "auto_assign": self.tester.pk,
+                },
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("auto_assign", response.context["form"].errors)
+        self.assertFalse(Task.objects.filter(name="Fix").exists())
+        self.assertContains(response, "Create New Task")
+
+    def test_assignees_or_position_required(self):
+        self.client.force_login(self.busy)
+
+        response = self.client.post(
+            reverse("task-manager:task-create"),
+            {
+                "name": "Fix",
+                "task_type": self.task_type.pk,
+                "priority": "LW",
+                "deadline": "2030-01-01T10:00",
+            },
+        )
+
+        self.assertIn("assignees", response.context["form"].errors)
+
+    def test_command_assigns_unassigned_open_tasks(self):
+        self.create_tasks(2)
+        out = StringIO()
+
+        call_command(
+            "auto_assign_tasks", position=self.tester.pk, stdout=out
+        )
+
+        self.assertIn("Created 2 assignments", out.getvalue())
+        self.assertEqual(self.qa.assigned_tasks.count(), 2)
+        self.assertEqual(self.existing.assignees.count(), 1)
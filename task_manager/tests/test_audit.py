@@ -0,0 +1,120 @@
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager import audit
+from task_manager.assignment import auto_assign
+from task_manager.models import Task, TaskChange, TaskType
+
+
+class AuditBufferTest(TestCase):
+
+    def setUp(self):
+        self.task_type = TaskType.objects.create(name="Bug")
+
+    def test_entries_are_written_in_bulk(self):
+        with audit.buffered():
+            with self.captureOnCommitCallbacks(execute=True):
+                task = Task.objects.create(
+                    name="Fix", task_type=self.task_type
+                )
+                task.priority = Task.LevelPriority.URGENT
+                task.save()
+            self.assertFalse(TaskChange.objects.exists())
+
+            with self.assertNumQueries(1):
+                self.assertEqual(audit.flush(), 2)
+
+        created, updated = TaskChange.objects.order_by("pk")
+        self.assertEqual(created.action, "created")
+        self.assertEqual(updated.changes, {"priority": ["LW", "UR"]})
+
+    @override_settings(AUDIT_BUFFER_SIZE=2)
+    def test_full_buffer_is_flushed(self):
+        with audit.buffered():
+            with self.captureOnCommitCallbacks(execute=True):
+                for i in range(3):
+                    audit.record(i, audit.Action.DELETED)
+            self.assertEqual(TaskChange.objects.count(), 2)
+        self.assertEqual(TaskChange.objects.count(), 3)
+
+    def test_nested_block_shares_the_outer_buffer(self):
+        with audit.buffered():
+            with audit.buffered():
+                with self.captureOnCommitCallbacks(execute=True):
+                    audit.record(1, audit.Action.DELETED)
+            self.assertFalse(TaskChange.objects.exists())
+        self.assertEqual(TaskChange.objects.count(), 1)
+
+    def test_rolled_back_changes_are_not_recorded(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    Task.objects.create(name="Fix", task_type=self.task_type)
+                    raise ValueError
+            except ValueError:
+                pass
+
+        self.assertFalse(TaskChange.objects.exists())
+
+
+class AuditRequestTest(TransactionTestCase):
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="john_test", password="test123"
+        )
+        self.task = Task.objects.create(
+            name="Fix", task_type=TaskType.objects.create(name="Bug")
+        )
+        self.client.force_login(self.user)
+
+    def test_assignment_is_recorded_with_actor(self):
+        self.client.get(
+            reverse("task-manager:toggle-task-assign", args=[self.task.pk])
+        )
+
+        change = TaskChange.objects.get(action="assigned")
+        self.assertEqual(change.actor, self.user)
+        self.assertEqual(change.changes, {"workers": [self.user.pk]})
+
+    def test_history_view_is_paginated(self):
+        TaskChange.objects.bulk_create(
+            TaskChange(task_id=self.task.pk, action="updated")
+            for _ in range(25)
+        )
+
+        response = self.client.get(
+            reverse("task-manager:task-history", args=[self.task.pk])
+        )
+
+        self.assertEqual(len(response.context["changes"]), 20)
+        self.assertTrue(response.context["is_paginated"])
+
+
+class AuditServiceTest(TransactionTestCase):
+
+    def test_auto_assignment_is_written_in_bulk(self):
+        task_type = TaskType.objects.create(name="Bug")
+        for i in range(3):
+            get_user_model().objects.create_user(username=f"user{i}")
+        tasks = [
+            Task.objects.create(name=f"Fix {i}", task_type=task_type)
+            for i in range(5)
+        ]
+        TaskChange.objects.all().delete()
+
+        with CaptureQueriesContext(connection) as queries:
+            auto_assign(tasks)
+
+        inserts = [
+            query
+            for query in queries
+            if query["sql"].startswith('INSERT INTO "task_manager_taskchange"')
+        ]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(
+            TaskChange.objects.filter(action="assigned").count(), 5
+        )
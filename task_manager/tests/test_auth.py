@@ -0,0 +1,75 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.contrib.sessions.backends.db import SessionStore
+from django.contrib.sessions.models import Session
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from task_manager.auth import CachedModelBackend
+from task_manager.models import Position
+
+
+class CachedUserTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.position = Position.objects.create(name="Dev")
+        self.worker = get_user_model().objects.create_user(
+            username="john_test", password="test123", position=self.position
+        )
+        self.client.login(username="john_test", password="test123")
+
+    def test_session_and_worker_are_cached(self):
+        url = reverse("task-manager:task-type-list")
+        self.client.get(url)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        for query in queries:
+            self.assertNotIn("django_session", query["sql"])
+            self.assertNotIn('FROM "task_manager_worker"', query["sql"])
+
+    def test_position_change_is_visible(self):
+        CachedModelBackend().get_user(self.worker.pk)
+        self.position.name = "Lead"
+        self.position.save()
+
+        user = CachedModelBackend().get_user(self.worker.pk)
+
+        self.assertEqual(user.position.name, "Lead")
+
+    def test_password_change_logs_out_other_sessions(self):
+        url = reverse("task-manager:task-list")
+        self.client.get(url)
+
+        self.worker.set_password("changed123")
+        self.worker.save()
+
+        self.assertEqual(self.client.get(url).status_code, 302)
+
+
+class ClearExpiredSessionsTest(TestCase):
+
+    def test_expired_sessions_are_deleted_in_batches(self):
+        for _ in range(5):
+            store = SessionStore()
+            store.set_expiry(-60)
+            store.create()
+        SessionStore().create()
+
+        call_command(
+            "clear_expired_sessions", "--batch-size", "2", stdout=StringIO()
+        )
+
+        self.assertEqual(Session.objects.count(), 1)
+        self.assertTrue(
+            Session.objects.filter(expire_date__gt=timezone.now()).exists()
+        )
@@ -0,0 +1,78 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from task_manager.board import board_columns
+from task_manager.models import Task, TaskType
+
+BOARD_URL = reverse("task-manager:task-board")
+COLUMN_URL = reverse("task-manager:task-board-column")
+
+
+@override_settings(BOARD_COLUMN_LIMIT=2)
+class TaskBoardTest(TestCase):
+
+    def setUp(self):
+        self.worker = get_user_model().objects.create_user(
+            username="john_test",
+            password="test123",
+        )
+        self.client.force_login(self.worker)
+        self.bug = TaskType.objects.create(name="Bug")
+        self.feature = TaskType.objects.create(name="Feature")
+
+        for i in range(5):
+            Task.objects.create(
+                name=f"Urgent - {i}",
+                task_type=self.bug,
+                priority=Task.LevelPriority.URGENT,
+            )
+        Task.objects.create(
+            name="Low", task_type=self.feature
+        ).assignees.add(self.worker)
+        Task.objects.create(
+            name="Done", task_type=self.feature, is_completed=True
+        )
+
+    def test_columns_are_capped_in_one_query(self):
+        with self.assertNumQueries(1):
+            columns = {
+                column["key"]: column for column in board_columns("status")
+            }
+
+        self.assertEqual(list(columns), ["UR", "HG", "MD", "LW", "done"])
+        self.assertEqual(len(columns["UR"]["tasks"]), 2)
+        self.assertEqual(columns["UR"]["total"], 5)
+        self.assertEqual(columns["HG"]["total"], 0)
+        self.assertEqual(
+            [task.name for task in columns["done"]["tasks"]], ["Done"]
+        )
+
+    def test_group_by_type_and_my_tasks(self):
+        response = self.client.get(BOARD_URL, {"group": "type"})
+        totals = [
+            (column["label"], column["total"])
+            for column in response.context["columns"]
+        ]
+        self.assertEqual(totals, [("Bug", 5), ("Feature", 2)])
+
+        response = self.client.get(BOARD_URL, {"scope": "mine"})
+        self.assertEqual(
+            [
+                task.name
+                for column in response.context["columns"]
+                for task in column["tasks"]
+            ],
+            ["Low"],
+        )
+
+    def test_load_more(self):
+        response = self.client.get(
+            COLUMN_URL, {"group": "status", "key": "UR", "offset": 4}
+        )
+
+        self.assertEqual(response["X-Board-Count"], "1")
+        self.assertContains(response, "Urgent - 4")
+
+        response = self.client.get(COLUMN_URL, {"key": "XX"})
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,151 @@
+import gzip
+from datetime import timedelta
+from unittest import skipIf
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from task_manager import compression, ical
+from task_manager.models import Task, TaskType
+
+BODY = b"<tr><td>Fix the login form</td></tr>\n" * 100
+
+
+class CompressionTest(TestCase):
+
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def compress(self, response, accept="gzip"):
+        request = self.factory.get("/", headers={"Accept-Encoding": accept})
+        return compression.compress_response(request, response)
+
+    def test_gzip(self):
+        response = self.compress(HttpResponse(BODY), accept="gzip, deflate")
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(response["Vary"], "Accept-Encoding")
+        self.assertEqual(gzip.decompress(response.content), BODY)
+        self.assertEqual(
+            int(response["Content-Length"]), len(response.content)
+        )
+
+    @skipIf(compression.brotli is None, "brotli is not installed")
+    def test_brotli_is_preferred(self):
+        response = self.compress(HttpResponse(BODY), accept="gzip, br")
+
+        self.assertEqual(response["Content-Encoding"], "br")
+        self.assertEqual(compression.brotli.decompress(response.content), BODY)
+
+        response = self.compress(HttpResponse(BODY), accept="gzip, br;q=0")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+
+    def test_skipped_responses(self):
+        small = self.compress(HttpResponse(b"<p>Done</p>"))
+        image = self.compress(HttpResponse(BODY, content_type="image/png"))
+        identity = self.compress(HttpResponse(BODY), accept="identity")
+
+        for response in (small, image, identity):
+            self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(identity["Vary"], "Accept-Encoding")
+
+    def test_streaming_is_compressed(self):
+        response = self.compress(
+            StreamingHttpResponse(iter([BODY, b"", BODY]))
+        )
+
+        chunks = list(response.streaming_content)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertFalse(response.has_header("Content-Length"))
+        self.assertEqual(gzip.decompress(b"".join(chunks)), BODY * 2)
+
+    @skipIf(compression.brotli is None, "brotli is not installed")
+    def test_brotli_streaming_is_compressed_chunk_by_chunk(self):
+        response = self.compress(
+            StreamingHttpResponse(iter([BODY, b"", BODY])), accept="br"
+        )
+
+        chunks = list(response.streaming_content)
+        self.assertEqual(response["Content-Encoding"], "br")
+        # The header and padding, one chunk per body chunk, the trailer.
+        self.assertEqual(len(chunks), 4)
+        self.assertEqual(
+            compression.brotli.decompress(b"".join(chunks)), BODY * 2
+        )
+
+    def test_length_is_randomized(self):
+        for accept in compression.ENCODERS:
+            with self.subTest(accept=accept):
+                lengths = {
+                    len(self.compress(HttpResponse(BODY), accept).content)
+                    for _ in range(20)
+                }
+                self.assertGreater(len(lengths), 1)
+
+    @override_settings(COMPRESSION_MAX_RANDOM_BYTES=0)
+    def test_padding_can_be_disabled(self):
+        for accept in compression.ENCODERS:
+            with self.subTest(accept=accept):
+                lengths = {
+                    len(self.compress(HttpResponse(BODY), accept).content)
+                    for _ in range(5)
+                }
+                self.assertEqual(len(lengths), 1)
+
+    @skipIf(compression.brotli is None, "brotli is not installed")
+    def test_brotli_padding_is_skipped_by_decoders(self):
+        for length in (1, 2, 255, 256, 257, 70000):
+            with self.subTest(length=length), patch.object(
+                compression.secrets, "randbelow", return_value=length
+            ):
+                data = compression.BrotliEncoder.compress(BODY)
+            self.assertEqual(compression.brotli.decompress(data), BODY)
+
+    def test_etag_is_weakened(self):
+        response = HttpResponse(BODY)
+        response["ETag"] = '"1-2"'
+
+        self.assertEqual(self.compress(response)["ETag"], 'W/"1-2"')
+
+
+class CompressedFeedTest(TestCase):
+
+    def test_compressed_feed_is_revalidated(self):
+        worker = get_user_model().objects.create_user(username="john_test")
+        task_type = TaskType.objects.create(name="Bug")
+        for i in range(20):
+            Task.objects.create(
+                name=f"Task {i}",
+                task_type=task_type,
+                deadline=timezone.now() + timedelta(days=i),
+            ).assignees.add(worker)
+        url = ical.feed_url(worker)
+
+        response = self.client.get(url, headers={"Accept-Encoding": "gzip"})
+        body = gzip.decompress(b"".join(response.streaming_content))
+        self.assertEqual(body.count(b"BEGIN:VEVENT"), 20)
+
+        cached = self.client.get(
+            url,
+            headers={
+                "Accept-Encoding": "gzip",
+                "If-None-Match": response["ETag"],
+            },
+        )
+        self.assertEqual(cached.status_code, 304)
+
+    def test_task_list_is_compressed(self):
+        worker = get_user_model().objects.create_user(username="john_test")
+        self.client.force_login(worker)
+
+        response = self.client.get(
+            reverse("task-manager:task-list"),
+            headers={"Accept-Encoding": "gzip"},
+        )
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn(b"</html>", gzip.decompress(response.content))
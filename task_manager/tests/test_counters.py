@@ -0,0 +1,220 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TestCase, TransactionTestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from task_manager.archive import archive_completed_tasks
+from task_manager.counters import reconcile
+from task_manager.deletion import BatchDeleter
+from task_manager.models import Position, Task, TaskType, Worker
+
+
+class CountersTest(TestCase):
+
+    def setUp(self):
+        self.dev = Position.objects.create(name="Dev")
+        self.qa = Position.objects.create(name="QA")
+        self.bug = TaskType.objects.create(name="Bug")
+        self.feature = TaskType.objects.create(name="Feature")
+        self.alice = get_user_model().objects.create_user(
+            username="alice", password="test123", position=self.dev
+        )
+        self.bob = get_user_model().objects.create_user(
+            username="bob", password="test123", position=self.qa
+        )
+        self.task = Task.objects.create(name="Fix", task_type=self.bug)
+        self.other = Task.objects.create(name="Build", task_type=self.bug)
+
+    def assertConsistent(self):
+        self.assertEqual(set(reconcile().values()), {0})
+
+    def counts(self, obj, *fields):
+        return type(obj).objects.values_list(*fields).get(pk=obj.pk)
+
+    def test_task_create_and_complete(self):
+        self.assertEqual(
+            self.counts(self.bug, "task_count", "open_task_count"), (2, 2)
+        )
+
+        self.task.assignees.add(self.alice, self.bob)
+        self.task.is_completed = True
+        self.task.save()
+
+        self.assertEqual(
+            self.counts(self.bug, "task_count", "open_task_count"), (2, 1)
+        )
+        self.assertEqual(
+            self.counts(self.alice, "assigned_task_count", "open_task_count"),
+            (1, 0),
+        )
+        self.assertEqual(
+            self.counts(
+                self.dev, "assignment_count", "open_assignment_count"
+            ),
+            (1, 0),
+        )
+        self.assertEqual(self.counts(self.task, "assignee_count"), (2,))
+        self.assertConsistent()
+
+    def test_assignment_from_both_sides(self):
+        self.task.assignees.add(self.alice)
+        self.alice.assigned_tasks.add(self.task, self.other)
+        self.bob.assigned_tasks.add(self.other)
+        self.assertConsistent()
+
+        self.task.assignees.remove(self.alice, self.bob)
+        self.other.assignees.set([self.bob])
+        self.assertConsistent()
+
+        self.bob.assigned_tasks.clear()
+        self.assertConsistent()
+        self.assertEqual(
+            self.counts(self.bob, "assigned_task_count", "open_task_count"),
+            (0, 0),
+        )
+
+    def test_task_type_change_and_worker_move(self):
+        self.task.assignees.add(self.alice)
+        self.task.task_type = self.feature
+        self.task.save()
+
+        self.alice.position = self.qa
+        self.alice.save()
+
+        self.assertEqual(
+            self.counts(self.feature, "task_count", "open_task_count"),
+            (1, 1),
+        )
+        self.assertEqual(self.counts(self.qa, "assignment_count"), (1,))
+        self.assertConsistent()
+
+    def test_deletes(self):
+        self.task.assignees.add(self.alice, self.bob)
+        self.other.assignees.add(self.alice)
+
+        self.task.delete()
+        self.assertConsistent()
+
+        self.bob.delete()
+        self.assertConsistent()
+
+        BatchDeleter(self.dev, batch_size=1).run()
+        self.assertConsistent()
+
+    def test_batch_delete_task_type(self):
+        self.task.assignees.add(self.alice)
+        self.other.assignees.add(self.alice, self.bob)
+
+        BatchDeleter(self.bug, batch_size=1).run()
+
+        self.assertEqual(
+            self.counts(self.alice, "assigned_task_count", "open_task_count"),
+            (0, 0),
+        )
+        self.assertConsistent()
+
+    def test_archive_keeps_counters(self):
+        self.task.assignees.add(self.alice)
+        Task.objects.filter(pk=self.task.pk).update(
+            is_completed=True,
+            completed_at=timezone.now() - timedelta(days=100),
+        )
+        reconcile()
+
+        archive_completed_tasks(days=30)
+
+        self.assertEqual(self.counts(self.alice, "assigned_task_count"), (0,))
+        self.assertConsistent()
+
+    def test_reconcile_repairs_drift(self):
+        self.task.assignees.add(self.alice)
+        Worker.objects.filter(pk=self.alice.pk).update(open_task_count=42)
+
+        out = StringIO()
+        call_command("reconcile_counters", stdout=out)
+
+        self.assertIn("worker: 1 rows repaired", out.getvalue())
+        self.assertEqual(self.counts(self.alice, "open_task_count"), (1,))
+
+    def test_worker_list_sorted_by_workload(self):
+        self.other.assignees.add(self.bob)
+        self.client.force_login(self.alice)
+
+        response = self.client.get(
+            reverse("task-manager:worker-list") + "?sort=workload"
+        )
+
+        self.assertEqual(
+            [worker.username for worker in response.context["worker_list"]],
+            ["bob", "alice"],
+        )
+
+        response = self.client.get(
+            reverse("task-manager:worker-list") + "?max_open_tasks=0"
+        )
+        self.assertEqual(
+            [worker.username for worker in response.context["worker_list"]],
+            ["alice"],
+        )
+
+    def test_save_keeps_counters_and_reinserts_deleted_rows(self):
+        self.task.assignees.add(self.alice)
+        stale = Position.objects.get(pk=self.dev.pk)
+        self.other.assignees.add(self.alice)
+
+        stale.name = "Developers"
+        stale.save()
+        self.assertEqual(self.counts(self.dev, "assignment_count"), (2,))
+
+        Position.objects.filter(pk=self.dev.pk).delete()
+        stale.save()
+        self.assertEqual(
+            self.counts(self.dev, "name", "assignment_count"),
+            ("Developers", 1),
+        )
+
+
+class CounterBackfillTest(TransactionTestCase):
+
+    def test_migration_fills_the_counters(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate([("task_manager", "0006_partition_task")])
+        apps = executor.loader.project_state(
+            [("task_manager", "0006_partition_task")]
+        ).apps
+        position = apps.get_model("task_manager", "Position").objects.create(
+            name="Dev"
+        )
+        worker = apps.get_model("task_manager", "Worker").objects.create(
+            username="alice", position=position
+        )
+        task_type = apps.get_model("task_manager", "TaskType").objects.create(
+            name="Bug"
+        )
+        task = apps.get_model("task_manager", "Task").objects.create(
+            name="Fix", task_type=task_type
+        )
+        task.assignees.add(worker)
+
+        executor.loader.build_graph()
+        executor.migrate(executor.loader.graph.leaf_nodes("task_manager"))
+
+        self.assertEqual(
+            Position.objects.values_list(
+                "assignment_count", "open_assignment_count"
+            ).get(),
+            (1, 1),
+        )
+        self.assertEqual(
+            TaskType.objects.values_list(
+                "task_count", "open_task_count"
+            ).get(),
+            (1, 1),
+        )
+        self.assertEqual(Task.objects.get().assignee_count, 1)
@@ -0,0 +1,93 @@
+import time
+
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+
+from task_manager import db_router
+from task_manager.models import Task, TaskType
+
+
+def routed_view(request):
+    return HttpResponse(db_router.ReplicaRouter().db_for_read(Task))
+
+
+@db_router.read_replica
+def replica_view(request):
+    return routed_view(request)
+
+
+@db_router.read_replica
+def writing_view(request):
+    TaskType.objects.create(name="Bug")
+    return routed_view(request)
+
+
+@override_settings(DATABASE_REPLICAS=["replica"])
+class ReplicaRouterTest(TestCase):
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.middleware = db_router.ReplicaRoutingMiddleware(self.get_response)
+        self.view = replica_view
+        db_router._lag_cache["replica"] = (time.monotonic(), 0.0)
+
+    def tearDown(self):
+        db_router._lag_cache.clear()
+
+    def get_response(self, request):
+        self.middleware.process_view(request, self.view, (), {})
+        return self.view(request)
+
+    def test_marked_view_reads_from_replica(self):
+        response = self.middleware(self.factory.get("/tasks/"))
+
+        self.assertEqual(response.content, b"replica")
+        self.assertNotIn("db_pin", response.cookies)
+
+    def test_reads_go_to_primary_outside_marked_views(self):
+        self.assertEqual(
+            db_router.ReplicaRouter().db_for_read(Task), "default"
+        )
+
+        self.view = routed_view
+        response = self.middleware(self.factory.get("/tasks/"))
+        self.assertEqual(response.content, b"default")
+
+    def test_unsafe_request_pins_to_primary(self):
+        response = self.middleware(self.factory.post("/tasks/"))
+
+        self.assertEqual(response.content, b"default")
+        self.assertIn("db_pin", response.cookies)
+
+        request = self.factory.get("/tasks/")
+        request.COOKIES["db_pin"] = "1"
+        self.assertEqual(self.middleware(request).content, b"default")
+
+    def test_write_on_get_pins_to_primary(self):
+        self.view = writing_view
+
+        response = self.middleware(self.factory.get("/tasks/"))
+
+        self.assertIn("db_pin", response.cookies)
+
+    def test_lagging_replica_falls_back_to_primary(self):
+        db_router._lag_cache["replica"] = (time.monotonic(), 60.0)
+
+        response = self.middleware(self.factory.get("/tasks/"))
+
+        self.assertEqual(response.content, b"default")
+
+    def test_unknown_replica_is_unhealthy(self):
+        db_router._lag_cache.clear()
+
+        self.assertEqual(db_router.healthy_replicas(), [])
+
+    def test_query_metrics_per_alias(self):
+        self.view = writing_view
+
+        response = self.middleware(self.factory.get("/tasks/"))
+
+        self.assertIn("db-default", response.headers["Server-Timing"])
+        self.assertGreaterEqual(
+            db_router.query_metrics()["default"]["queries"], 1
+        )
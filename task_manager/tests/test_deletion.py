@@ -0,0 +1,149 @@
+from datetime import datetime
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from task_manager.deletion import (
+    DEPENDENTS,
+    BatchDeleter,
+    TaskAssignee,
+    mark,
+    schedule_deletion,
+)
+from task_manager.models import (
+    PendingDeletion,
+    Position,
+    Task,
+    TaskChange,
+    TaskDailyStat,
+    TaskType,
+)
+
+
+class BatchDeleterTest(TestCase):
+
+    def setUp(self):
+        self.position = Position.objects.create(name="Dev")
+        self.task_type = TaskType.objects.create(name="Bug")
+        self.workers = [
+            get_user_model().objects.create_user(
+                username=f"user{i}",
+                password="test123",
+                position=self.position,
+            )
+            for i in range(3)
+        ]
+        for i in range(7):
+            task = Task.objects.create(
+                name=f"Fix - {i}",
+                task_type=self.task_type,
+                deadline=datetime.now(),
+            )
+            task.assignees.set(self.workers)
+
+    def test_task_type_deleted_in_chunks(self):
+        progress = []
+
+        deleted = BatchDeleter(
+            self.task_type,
+            batch_size=3,
+            progress=lambda label, count, total: progress.append(
+                (label, count)
+            ),
+        ).run()
+
+        self.assertFalse(TaskType.objects.exists())
+        self.assertFalse(Task.objects.exists())
+        self.assertFalse(TaskAssignee.objects.exists())
+        self.assertFalse(TaskDailyStat.objects.exists())
+        self.assertEqual(deleted, 7 * 3 + 7 + 1 + 1)
+        self.assertEqual(
+            [count for label, count in progress if label == "tasks"],
+            [3, 3, 1],
+        )
+        self.assertTrue(all(count <= 3 for label, count in progress))
+
+    def test_position_deletes_workers_and_assignments(self):
+        BatchDeleter(self.position, batch_size=2).run()
+
+        self.assertFalse(Position.objects.exists())
+        self.assertFalse(get_user_model().objects.exists())
+        self.assertFalse(TaskAssignee.objects.exists())
+        self.assertEqual(Task.objects.count(), 7)
+
+    def test_worker_deletes_only_own_assignments(self):
+        worker_id = self.workers[0].pk
+        with self.captureOnCommitCallbacks(execute=True):
+            BatchDeleter(self.workers[0], batch_size=2).run()
+
+        self.assertEqual(get_user_model().objects.count(), 2)
+        self.assertEqual(TaskAssignee.objects.count(), 7 * 2)
+        self.assertEqual(
+            list(
+                TaskChange.objects.filter(
+                    action=TaskChange.Action.UNASSIGNED
+                ).values_list("changes", flat=True)
+            ),
+            [{"workers": [worker_id]}] * 7,
+        )
+        self.position.refresh_from_db()
+        self.assertEqual(self.position.open_assignment_count, 7 * 2)
+
+    def test_interrupted_deletion_is_resumed(self):
+        mark(self.task_type)
+        # The web worker stopped after the first chunk of assignee rows.
+        label, get_queryset = DEPENDENTS[TaskType][0]
+        first_chunk = list(
+            get_queryset(self.task_type).values_list("pk", flat=True)[:5]
+        )
+        BatchDeleter(self.task_type).delete_chunked(
+            label, TaskAssignee.objects.filter(pk__in=first_chunk)
+        )
+
+        call_command("batch_delete", stdout=StringIO())
+
+        self.assertFalse(TaskType.objects.exists())
+        self.assertFalse(Task.objects.exists())
+        self.assertFalse(PendingDeletion.objects.exists())
+
+    @override_settings(BATCH_DELETE_IN_BACKGROUND=False)
+    def test_schedule_deletion_runs_inline(self):
+        schedule_deletion(self.task_type)
+
+        self.assertFalse(Task.objects.exists())
+
+    def test_batch_delete_command(self):
+        call_command(
+            "batch_delete", "tasktype", self.task_type.pk,
+            "--batch-size", "4", stdout=StringIO()
+        )
+
+        self.assertFalse(Task.objects.exists())
+
+    def test_task_type_delete_view(self):
+        self.client.force_login(self.workers[0])
+
+        response = self.client.post(
+            reverse("task-manager:task-type-delete", args=[self.task_type.id])
+        )
+
+        self.assertRedirects(response, reverse("task-manager:task-type-list"))
+        self.assertFalse(Task.objects.exists())
+        self.assertFalse(PendingDeletion.objects.exists())
+
+    def test_lists_hide_objects_being_deleted(self):
+        self.client.force_login(self.workers[0])
+        mark(self.position)
+        mark(self.workers[1])
+
+        positions = self.client.get(reverse("task-manager:position-list"))
+        workers = self.client.get(reverse("task-manager:worker-list"))
+
+        self.assertNotIn(self.position, positions.context["object_list"])
+        self.assertNotIn(
+            self.workers[1].pk,
+            [row.id for row in workers.context["object_list"]],
+        )
@@ -0,0 +1,119 @@
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.test import TestCase
+from django.urls import reverse
+
+from task_manager import dependencies
+from task_manager.dependencies import DependencyCycle
+from task_manager.completion import set_completed
+from task_manager.forms import TaskForm
+from task_manager.models import Task, TaskDependency, TaskType
+
+
+class DependencyTest(TestCase):
+
+    def setUp(self):
+        task_type = TaskType.objects.create(name="Bug")
+        self.design, self.build, self.test, self.ship, self.docs = (
+            Task.objects.create(name=name, task_type=task_type)
+            for name in ("Design", "Build", "Test", "Ship", "Docs")
+        )
+        # design -> build -> test -> ship, docs -> ship
+        self.build.blocked_by.add(self.design)
+        self.test.blocked_by.add(self.build)
+        self.ship.blocked_by.add(self.test, self.docs)
+
+    def blocked(self):
+        return set(
+            Task.objects.filter(is_blocked=True).values_list(
+                "name", flat=True
+            )
+        )
+
+    def test_transitive_blockers_and_critical_path(self):
+        with self.assertNumQueries(1):
+            blockers = dependencies.transitive_blocker_ids(self.ship.pk)
+        self.assertEqual(
+            blockers,
+            {self.design.pk, self.build.pk, self.test.pk, self.docs.pk},
+        )
+
+        self.assertEqual(
+            [task.name for task in dependencies.critical_path(self.ship)],
+            ["Design", "Build", "Test"],
+        )
+
+    def test_critical_path_survives_a_cycle(self):
+        # Bypasses the m2m_changed check, as a concurrent write could.
+        TaskDependency.objects.create(task=self.design, blocker=self.ship)
+
+        self.assertEqual(
+            [task.name for task in dependencies.critical_path(self.ship)],
+            ["Design", "Build", "Test"],
+        )
+
+    def test_cycles_are_rejected(self):
+        with self.assertRaises(DependencyCycle), transaction.atomic():
+            self.design.blocked_by.add(self.ship)
+        with self.assertRaises(DependencyCycle), transaction.atomic():
+            self.ship.blocks.add(self.design)
+
+        form = TaskForm(
+            instance=self.design,
+            data={
+                "name": "Design",
+                "task_type": self.design.task_type_id,
+                "priority": "LW",
+                "deadline": "2030-01-01T10:00",
+                "assignees": [
+                    get_user_model().objects.create_user("john_test").pk
+                ],
+                "blocked_by": [self.test.pk],
+            },
+        )
+        self.assertFalse(form.is_valid())
+        self.assertIn("blocked_by", form.errors)
+
+    def test_blocker_picker_renders_only_chosen_tasks(self):
+        html = str(TaskForm(instance=self.ship)["blocked_by"])
+
+        self.assertIn(f'<option value="{self.test.pk}" selected>Test', html)
+        self.assertIn(f'<option value="{self.docs.pk}" selected>Docs', html)
+        self.assertNotIn("Design", html)
+        self.assertIn(
+            f'data-autocomplete="{reverse("task-manager:typeahead-api")}"',
+            html,
+        )
+
+    def test_blocked_flag_follows_blockers(self):
+        self.assertEqual(self.blocked(), {"Build", "Test", "Ship"})
+
+        self.design.is_completed = True
+        self.design.save()
+        self.assertEqual(self.blocked(), {"Test", "Ship"})
+
+        set_completed(Task.objects.filter(pk=self.build.pk))
+        self.assertEqual(self.blocked(), {"Ship"})
+
+        self.ship.blocked_by.remove(self.test)
+        self.docs.delete()
+        self.assertEqual(self.blocked(), set())
+
+        self.test.blocks.clear()
+        self.design.is_completed = False
+        self.design.save()
+        self.assertEqual(self.blocked(), {"Build"})
+
+    def test_actionable_filter(self):
+        self.client.force_login(
+            get_user_model().objects.create_user("john_test")
+        )
+
+        response = self.client.get(
+            reverse("task-manager:task-list"), {"status": "actionable"}
+        )
+
+        self.assertEqual(
+            [task.name for task in response.context["paginator"].object_list],
+            ["Design", "Docs"],
+        )
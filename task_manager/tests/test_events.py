@@ -0,0 +1,113 @@
+import asyncio
+import json
+
+from django.contrib.auth import get_user_model
+from django.test import AsyncClient, TestCase
+from django.urls import reverse
+
+from task_manager import events
+from task_manager.completion import set_completed
+from task_manager.models import Task, TaskType
+
+
+class TaskEventsTest(TestCase):
+
+    def setUp(self):
+        self.task_type = TaskType.objects.create(name="Bug")
+
+    def test_events_are_published_on_commit(self):
+        published = []
+        events.broker.publish = published.append
+        self.addCleanup(delattr, events.broker, "publish")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            task = Task.objects.create(name="Fix", task_type=self.task_type)
+            self.assertEqual(published, [])
+        set_completed(Task.objects.filter(pk=task.pk))
+        with self.captureOnCommitCallbacks(execute=True):
+            set_completed(Task.objects.filter(pk=task.pk), False)
+
+        created, updated = map(json.loads, published)
+        self.assertEqual(created["action"], "created")
+        self.assertEqual(created["priority_display"], "Low")
+        self.assertEqual(
+            updated,
+            {"id": task.pk, "action": "updated", "is_completed": False},
+        )
+
+    def test_stream_relays_published_events(self):
+        async def read_stream():
+            stream = events.stream(heartbeat=0.01)
+            frames = [await anext(stream)]
+            events.broker.publish('{"id": 1}')
+            frames.append(await anext(stream))
+            frames.append(await anext(stream))
+            await stream.aclose()
+            return frames
+
+        frames = asyncio.run(read_stream())
+
+        self.assertEqual(
+            frames,
+            [
+                "retry: 5000\n\n",
+                'event: task\ndata: {"id": 1}\n\n',
+                ": ping\n\n",
+            ],
+        )
+        self.assertFalse(events.broker._subscribers)
+
+    def test_stream_requires_login(self):
+        response = self.client.get(reverse("task-manager:task-events"))
+
+        self.assertEqual(response.status_code, 302)
+
+    def test_stream_is_not_served_by_wsgi(self):
+        self.client.force_login(
+            get_user_model().objects.create_user(
+                username="john_test", password="test123"
+            )
+        )
+        Task.objects.create(name="Fix", task_type=self.task_type)
+
+        page = self.client.get(reverse("task-manager:task-list"))
+        stream = self.client.get(reverse("task-manager:task-events"))
+
+        self.assertNotContains(page, reverse("task-manager:task-events"))
+        self.assertEqual(stream.status_code, 204)
+
+
+class TaskEventsAsgiTest(TestCase):
+
+    def setUp(self):
+        self.client = AsyncClient()
+        self.client.force_login(
+            get_user_model().objects.create_user(
+                username="john_test", password="test123"
+            )
+        )
+        self.task = Task.objects.create(
+            name="Fix", task_type=TaskType.objects.create(name="Bug")
+        )
+
+    async def test_board_subscribes_to_events(self):
+        response = await self.client.get(reverse("task-manager:task-list"))
+
+        self.assertContains(response, reverse("task-manager:task-events"))
+        self.assertContains(response, "js/task_events.js")
+
+    async def test_logged_in_stream_relays_events(self):
+        async with asyncio.timeout(5):
+            response = await self.client.get(
+                reverse("task-manager:task-events")
+            )
+            frames = aiter(response.streaming_content)
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response["Content-Type"], "text/event-stream")
+            self.assertEqual(await anext(frames), b"retry: 5000\n\n")
+            events.broker.publish('{"id": 1}')
+            self.assertEqual(
+                await anext(frames), b'event: task\ndata: {"id": 1}\n\n'
+            )
+            await frames.aclose()
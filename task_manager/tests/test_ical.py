@@ -0,0 +1,113 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from task_manager import ical
+from task_manager.completion import set_completed
+from task_manager.models import Task, TaskType
+
+
+class CalendarFeedTest(TestCase):
+
+    def setUp(self):
+        self.worker = get_user_model().objects.create_user(
+            username="john_test",
+            password="test123",
+        )
+        self.task_type = TaskType.objects.create(name="Bug")
+        self.task = Task.objects.create(
+            name="Fix login, again; soon",
+            description="Line one\nLine two",
+            task_type=self.task_type,
+            priority=Task.LevelPriority.URGENT,
+            deadline=timezone.now() + timedelta(days=1),
+        )
+        self.task.assignees.add(self.worker)
+        Task.objects.create(
+            name="Done",
+            task_type=self.task_type,
+            deadline=timezone.now(),
+            is_completed=True,
+        ).assignees.add(self.worker)
+        self.url = ical.feed_url(self.worker)
+
+    def version(self):
+        self.worker.refresh_from_db()
+        return self.worker.assignment_version
+
+    def test_feed_lists_open_assigned_tasks(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response["Content-Type"], "text/calendar; charset=utf-8"
+        )
+        body = b"".join(response.streaming_content).decode()
+        self.assertTrue(body.startswith("BEGIN:VCALENDAR\r\n"))
+        self.assertIn("SUMMARY:Fix login\\, again\\; soon\r\n", body)
+        self.assertIn("DESCRIPTION:Line one\\nLine two\r\n", body)
+        self.assertIn("PRIORITY:1\r\n", body)
+        self.assertNotIn("SUMMARY:Done", body)
+        self.assertEqual(body.count("BEGIN:VEVENT"), 1)
+
+    def test_unchanged_feed_is_not_modified(self):
+        response = self.client.get(self.url)
+
+        with self.assertNumQueries(1):
+            cached = self.client.get(
+                self.url, HTTP_IF_NONE_MATCH=response["ETag"]
+            )
+        self.assertEqual(cached.status_code, 304)
+
+        cached = self.client.get(
+            self.url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+        )
+        self.assertEqual(cached.status_code, 304)
+
+    def test_changes_to_open_tasks_bump_the_version(self):
+        version = self.version()
+
+        self.task.deadline += timedelta(days=1)
+        self.task.save()
+        self.assertEqual(self.version(), version + 1)
+
+        self.task.is_blocked = True
+        self.task.task_type = TaskType.objects.create(name="Feature")
+        self.task.save()
+        self.assertEqual(self.version(), version + 1)
+
+        set_completed(Task.objects.filter(pk=self.task.pk))
+        self.assertEqual(self.version(), version + 2)
+
+        self.task.assignees.remove(self.worker)
+        self.assertEqual(self.version(), version + 3)
+
+    def test_changed_feed_gets_a_new_etag(self):
+        etag = self.client.get(self.url)["ETag"]
+        self.task.assignees.remove(self.worker)
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_invalid_token(self):
+        response = self.client.get(
+            reverse(
+                "task-manager:task-calendar",
+                kwargs={"token": f"{self.worker.pk}:forged"},
+            )
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_long_lines_are_folded(self):
+        lines = ical.fold("SUMMARY:" + "é" * 80).split("\r\n")
+
+        self.assertTrue(all(len(line.encode()) <= 75 for line in lines))
+        self.assertEqual(
+            "".join(line.removeprefix(" ") for line in lines),
+            "SUMMARY:" + "é" * 80,
+        )
@@ -0,0 +1,88 @@
+import re
+from datetime import datetime, timezone as dt_timezone
+from importlib.util import find_spec
+from unittest import skipUnless
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from task_manager.models import Position, Task, TaskType
+
+
+def normalize(content):
+    html = content.decode()
+    html = re.sub(r'name="csrfmiddlewaretoken" value="\w+"', "", html)
+    return re.sub(r"\s+", " ", re.sub(r">\s+", ">", html)).strip()
+
+
+@skipUnless(find_spec("jinja2"), "Jinja2 is not installed")
+class Jinja2PagesTest(TestCase):
+
+    def setUp(self):
+        self.worker = get_user_model().objects.create_user(
+            username="john_test",
+            password="test123",
+            first_name="John",
+            last_name="Smith",
+            position=Position.objects.create(name="Dev"),
+        )
+        self.client.force_login(self.worker)
+        task_type = TaskType.objects.create(name="Bug")
+        self.blocker = Task.objects.create(
+            name="Design login", task_type=task_type
+        )
+        self.task = Task.objects.create(
+            name="Fix login <form>",
+            description="Long description",
+            task_type=task_type,
+            priority=Task.LevelPriority.HIGH,
+            deadline=datetime(2026, 3, 1, 12, tzinfo=dt_timezone.utc),
+        )
+        self.task.blocked_by.add(self.blocker)
+        self.task.assignees.add(self.worker)
+        Task.objects.create(name="Write docs", task_type=task_type)
+
+    def render(self, engine, url, **extra):
+        with override_settings(PAGE_TEMPLATE_ENGINE=engine):
+            response = self.client.get(url, **extra)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def assertSamePage(self, url, **extra):
+        self.assertEqual(
+            normalize(self.render("jinja2", url, **extra).content),
+            normalize(self.render("django", url, **extra).content),
+        )
+
+    def test_pages_match_django_templates(self):
+        for url in (
+            reverse("task-manager:task-list"),
+            reverse("task-manager:task-list") + "?sort=name&page=2",
+            reverse("task-manager:worker-list") + "?sort=workload",
+            reverse("task-manager:task-detail", args=[self.task.pk]),
+            reverse("task-manager:worker-detail", args=[self.worker.pk]),
+        ):
+            with self.subTest(url=url):
+                self.assertSamePage(url)
+
+    def test_partial_list(self):
+        url = reverse("task-manager:task-list") + "?name=fix"
+
+        response = self.render("jinja2", url, HTTP_X_PARTIAL="1")
+
+        self.assertEqual(
+            response.templates[0].origin.name,
+            str(
+                settings.BASE_DIR
+                / "jinja2/task_manager/includes/task_table.html"
+            ),
+        )
+        self.assertNotContains(response, "<html")
+        self.assertContains(response, "Fix login &lt;form&gt;")
+        self.assertContains(
+            response,
+            reverse("task-manager:task-detail", args=[self.task.pk]),
+        )
+        self.assertSamePage(url, HTTP_X_PARTIAL="1")
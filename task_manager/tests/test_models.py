@@ -43,6 +43,17 @@ class ModelTest(TestCase):
 
         self.assertEqual(self.task.get_status_display(), "Completed")
 
+    def test_task_completed_at(self):
+        self.assertIsNone(self.task.completed_at)
+
+        self.task.is_completed = True
+        self.task.save()
+        self.assertIsNotNone(self.task.completed_at)
+
+        self.task.is_completed = False
+        self.task.save()
+        self.assertIsNone(self.task.completed_at)
+
     def test_worker_str(self):
         self.assertEqual(
             str(self.worker),
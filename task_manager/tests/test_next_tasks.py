@@ -0,0 +1,110 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from task_manager.models import Task, TaskType
+from task_manager.next_tasks import next_tasks
+
+
+class NextTasksTest(TestCase):
+
+    def setUp(self):
+        self.worker = get_user_model().objects.create_user(
+            username="john_test",
+            password="test123",
+        )
+        self.other = get_user_model().objects.create_user(
+            username="jane_test",
+            password="test123",
+        )
+        task_type = TaskType.objects.create(name="Bug")
+        now = timezone.now()
+
+        def task(name, priority, days, **kwargs):
+            task = Task.objects.create(
+                name=name,
+                task_type=task_type,
+                priority=priority,
+                deadline=now + timedelta(days=days),
+                **kwargs,
+            )
+            task.assignees.add(self.worker)
+            return task
+
+        task("Low", Task.LevelPriority.LOW, 1)
+        task("Urgent later", Task.LevelPriority.URGENT, 5)
+        task("Urgent soon", Task.LevelPriority.URGENT, 2)
+        task("High", Task.LevelPriority.HIGH, 1)
+        task("Done", Task.LevelPriority.URGENT, 0, is_completed=True)
+        task("Shared", Task.LevelPriority.MEDIUM, 3).assignees.add(self.other)
+        self.someday = task("Someday", Task.LevelPriority.URGENT, 0)
+        Task.objects.filter(pk=self.someday.pk).update(deadline=None)
+
+    def test_priority_rank_is_stored(self):
+        ranks = dict(Task.objects.values_list("name", "priority_rank"))
+
+        self.assertEqual(ranks["Urgent soon"], 1)
+        self.assertEqual(ranks["Low"], 4)
+
+        task = Task.objects.get(name="Low")
+        task.priority = Task.LevelPriority.HIGH
+        task.save()
+        self.assertEqual(task.priority_rank, 2)
+
+    def test_top_tasks_of_every_worker_in_one_query(self):
+        with self.assertNumQueries(1):
+            queues = next_tasks(limit=3)
+
+        self.assertEqual(
+            [task["name"] for task in queues[self.worker.pk]],
+            ["Urgent soon", "Urgent later", "Someday"],
+        )
+        self.assertEqual(
+            [task["name"] for task in queues[self.other.pk]], ["Shared"]
+        )
+
+    def test_next_tasks_view(self):
+        self.client.force_login(self.worker)
+
+        response = self.client.get(reverse("task-manager:next-tasks"))
+
+        self.assertEqual(
+            [task["name"] for task in response.context["tasks"]],
+            ["Urgent soon", "Urgent later", "Someday", "High", "Shared"],
+        )
+        self.assertContains(response, "Urgent")
+
+    def test_next_tasks_api(self):
+        self.client.force_login(self.worker)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                reverse("task-manager:next-tasks-api"),
+                {"worker": self.other.pk, "limit": 1},
+            )
+
+        workers = response.json()["workers"]
+        self.assertEqual([worker["id"] for worker in workers], [self.other.pk])
+        self.assertEqual(len(workers[0]["tasks"]), 1)
+        self.assertEqual(workers[0]["tasks"][0]["name"], "Shared")
+        self.assertEqual(workers[0]["tasks"][0]["priority_rank"], 3)
+        task_queries = [
+            query for query in queries if "task_manager_task" in query["sql"]
+        ]
+        self.assertEqual(len(task_queries), 1)
+
+    def test_next_tasks_api_defaults_to_own_queue(self):
+        self.client.force_login(self.other)
+
+        response = self.client.get(reverse("task-manager:next-tasks-api"))
+
+        workers = response.json()["workers"]
+        self.assertEqual([worker["id"] for worker in workers], [self.other.pk])
+        self.assertEqual(
+            [task["name"] for task in workers[0]["tasks"]], ["Shared"]
+        )
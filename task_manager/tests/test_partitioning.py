@@ -0,0 +1,284 @@
+import datetime
+from io import StringIO
+from unittest import skipUnless
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from task_manager import partitioning
+from task_manager.models import Task, TaskDependency, TaskType
+
+SCHEMA = {
+    "columns": [],
+    "indexes": [
+        (
+            "task_deadline_idx",
+            "CREATE INDEX task_deadline_idx "
+            "ON public.task_manager_task USING btree (deadline)",
+        ),
+        (
+            "task_manager_task_name_like",
+            "CREATE INDEX task_manager_task_name_like "
+            "ON public.task_manager_task "
+            "USING btree (name varchar_pattern_ops)",
+        ),
+    ],
+    "constraints": [
+        (
+            "unique_task_occurrence",
+            "u",
+            "UNIQUE (recurrence_id, occurrence)",
+        ),
+        (
+            "task_manager_task_task_type_id_fk",
+            "f",
+            "FOREIGN KEY (task_type_id) REFERENCES task_manager_tasktype(id) "
+            "DEFERRABLE INITIALLY DEFERRED",
+        ),
+    ],
+}
+
+
+class PartitioningSQLTest(TestCase):
+
+    def test_state_scheme(self):
+        statements = partitioning.conversion_sql("state")
+
+        self.assertIn("PARTITION BY LIST (is_completed)", statements[1])
+        self.assertIn("PRIMARY KEY (id, is_completed)", statements[2])
+        self.assertIn(
+            "CREATE TABLE task_manager_task_open PARTITION OF "
+            "task_manager_task FOR VALUES IN (false)",
+            statements,
+        )
+        self.assertTrue(statements[-1].startswith("DROP TABLE"))
+
+    def test_deadline_month_scheme(self):
+        statements = partitioning.conversion_sql(
+            "deadline_month",
+            first_month=datetime.date(2025, 11, 20),
+            months_ahead=0,
+        )
+
+        self.assertIn("PARTITION BY RANGE (deadline)", statements[1])
+        self.assertIn(
+            "CREATE TABLE task_manager_task_default PARTITION OF "
+            "task_manager_task DEFAULT",
+            statements,
+        )
+        self.assertIn(
+            "CREATE TABLE IF NOT EXISTS task_manager_task_y2025m12 "
+            "PARTITION OF task_manager_task "
+            "FOR VALUES FROM ('2025-12-01') TO ('2026-01-01')",
+            statements,
+        )
+
+    def test_generated_columns_are_not_copied(self):
+        statements = partitioning.conversion_sql(
+            "state", schema={**SCHEMA, "columns": ["id", "name"]}
+        )
+
+        self.assertIn(
+            "INSERT INTO task_manager_task (id, name) OVERRIDING SYSTEM VALUE "
+            "SELECT id, name FROM task_manager_task_unpartitioned",
+            statements,
+        )
+
+    def test_schema_is_recreated_under_its_names(self):
+        statements = partitioning.conversion_sql("state", schema=SCHEMA)
+
+        self.assertIn("INCLUDING CONSTRAINTS", statements[4])
+        self.assertEqual(
+            statements[1:4],
+            [
+                "ALTER TABLE task_manager_task_unpartitioned "
+                "DROP CONSTRAINT unique_task_occurrence",
+                "DROP INDEX task_deadline_idx",
+                "DROP INDEX task_manager_task_name_like",
+            ],
+        )
+        self.assertEqual(
+            statements[-5:-1],
+            [
+                "CREATE INDEX task_deadline_idx "
+                "ON public.task_manager_task USING btree (deadline)",
+                "CREATE INDEX task_manager_task_name_like "
+                "ON public.task_manager_task "
+                "USING btree (name varchar_pattern_ops)",
+                "ALTER TABLE task_manager_task "
+                "ADD CONSTRAINT unique_task_occurrence "
+                "UNIQUE (recurrence_id, occurrence, is_completed)",
+                "ALTER TABLE task_manager_task "
+                "ADD CONSTRAINT task_manager_task_task_type_id_fk "
+                "FOREIGN KEY (task_type_id) "
+                "REFERENCES task_manager_tasktype(id) "
+                "DEFERRABLE INITIALLY DEFERRED",
+            ],
+        )
+
+    def test_month_is_split_from_the_default_partition(self):
+        statements = partitioning.split_default_sql(
+            datetime.date(2026, 2, 1), ["id", "name", "deadline"]
+        )
+
+        self.assertEqual(
+            statements[0],
+            "ALTER TABLE task_manager_task "
+            "DETACH PARTITION task_manager_task_default",
+        )
+        self.assertIn("task_manager_task_y2026m02", statements[1])
+        self.assertEqual(
+            statements[2],
+            "WITH moved AS (DELETE FROM task_manager_task_default "
+            "WHERE deadline >= '2026-02-01' AND deadline < '2026-03-01' "
+            "RETURNING id, name, deadline) "
+            "INSERT INTO task_manager_task (id, name, deadline) "
+            "OVERRIDING SYSTEM VALUE SELECT id, name, deadline FROM moved",
+        )
+        self.assertEqual(
+            statements[3],
+            "ALTER TABLE task_manager_task "
+            "ATTACH PARTITION task_manager_task_default DEFAULT",
+        )
+
+    @override_settings(TASK_PARTITION_MONTHS_BACK=2)
+    def test_backfill_is_bounded(self):
+        this_month = partitioning.month_start(timezone.now().date())
+        two_months_ago = partitioning.previous_month(
+            partitioning.previous_month(this_month)
+        )
+
+        self.assertEqual(
+            partitioning.backfill_start(datetime.date(2001, 5, 17)),
+            two_months_ago,
+        )
+        self.assertEqual(
+            partitioning.backfill_start(this_month), this_month
+        )
+        self.assertIsNone(partitioning.backfill_start(None))
+
+    def test_partition_key_is_added_once(self):
+        self.assertEqual(
+            partitioning.with_partition_key(
+                "UNIQUE (deadline, name)", ("deadline",)
+            ),
+            "UNIQUE (deadline, name)",
+        )
+
+    def test_unknown_scheme(self):
+        with self.assertRaises(ValueError):
+            partitioning.conversion_sql("priority")
+
+    def test_not_partitioned_on_sqlite(self):
+        self.assertFalse(partitioning.is_partitioned())
+
+
+@skipUnless(partitioning.is_supported(), "Partitioning requires PostgreSQL")
+class ConversionTest(TestCase):
+
+    def test_indexes_and_constraints_keep_their_names(self):
+        before = partitioning.table_schema()
+
+        partitioning.convert("state")
+        after = partitioning.table_schema()
+
+        self.assertEqual(partitioning.partition_key(), ["is_completed"])
+        # Definitions on the partitioned table read "ON ONLY".
+        self.assertEqual(
+            [name for name, _ in after["indexes"]],
+            [name for name, _ in before["indexes"]],
+        )
+        self.assertEqual(
+            [constraint[:2] for constraint in after["constraints"]],
+            [constraint[:2] for constraint in before["constraints"]],
+        )
+
+
+class IntegrityProblemsTest(TestCase):
+
+    def test_orphaned_rows_are_reported(self):
+        task = Task.objects.create(
+            name="Fix login", task_type=TaskType.objects.create(name="Bug")
+        )
+        self.assertEqual(partitioning.integrity_problems(), [])
+
+        # Dependency rows have no database foreign keys.
+        TaskDependency.objects.create(task=task, blocker_id=task.pk + 1)
+
+        self.assertEqual(
+            partitioning.integrity_problems(),
+            ["1 dependency row(s) of missing tasks"],
+        )
+
+
+@skipUnless(partitioning.is_supported(), "Partitioning requires PostgreSQL")
+class ExtendTest(TestCase):
+
+    @override_settings(TASK_PARTITIONING="deadline_month")
+    def test_rows_move_out_of_the_default_partition(self):
+        partitioning.convert("deadline_month")
+        far = timezone.now() + datetime.timedelta(days=200)
+        task = Task.objects.create(
+            name="Plan next year",
+            task_type=TaskType.objects.create(name="Planning"),
+            deadline=far,
+        )
+
+        partitioning.create_future_partitions(months_ahead=8)
+
+        partition = partitioning.month_partition_name(
+            partitioning.month_start(far.date())
+        )
+        self.assertIn(partition, partitioning.existing_partitions())
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT id FROM {partition}")
+            self.assertEqual(cursor.fetchall(), [(task.pk,)])
+        self.assertEqual(partitioning.integrity_problems(), [])
+
+
+@skipUnless(partitioning.is_supported(), "Partitioning requires PostgreSQL")
+class PartitionedMigrationTest(TestCase):
+    """Runs in the test's transaction, which also undoes the migrations."""
+
+    def test_occurrence_constraint_on_converted_table(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate([("task_manager", "0013_task_dependencies")])
+        partitioning.convert("state")
+
+        executor.loader.build_graph()
+        executor.migrate([("task_manager", "0014_recurringtask")])
+
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(
+                cursor, partitioning.TABLE
+            )
+        self.assertEqual(
+            constraints["unique_task_occurrence"]["columns"],
+            ["recurrence_id", "occurrence", "is_completed"],
+        )
+
+
+class PartitionTasksCommandTest(TestCase):
+
+    def test_dry_run_prints_sql(self):
+        out = StringIO()
+        call_command(
+            "partition_tasks", "convert", "--scheme", "state", "--dry-run",
+            stdout=out,
+        )
+
+        self.assertIn("PARTITION BY LIST (is_completed);", out.getvalue())
+
+    def test_extend_is_a_noop_when_not_partitioned(self):
+        out = StringIO()
+        call_command("partition_tasks", "extend", stdout=out)
+
+        self.assertEqual(out.getvalue(), "")
+
+    def test_requires_postgres(self):
+        with self.assertRaises(CommandError):
+            call_command("partition_tasks", "convert", "--scheme", "state")
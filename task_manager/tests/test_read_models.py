@@ -0,0 +1,60 @@
+from datetime import datetime, timezone as dt_timezone
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager.models import Position, Task, TaskType
+from task_manager.read_models import TaskRow, WorkerRow, as_rows
+
+
+class ReadModelTest(TestCase):
+
+    def setUp(self):
+        self.worker = get_user_model().objects.create_user(
+            username="john_test",
+            password="test123",
+            position=Position.objects.create(name="Dev"),
+        )
+        self.task = Task.objects.create(
+            name="Fix login",
+            description="Long description",
+            task_type=TaskType.objects.create(name="Bug"),
+            priority=Task.LevelPriority.HIGH,
+            deadline=datetime(2026, 3, 1, 12, tzinfo=dt_timezone.utc),
+        )
+
+    def test_task_rows(self):
+        row = as_rows(Task.objects.all(), TaskRow).get()
+
+        self.assertIsInstance(row, TaskRow)
+        self.assertFalse(hasattr(row, "__dict__"))
+        self.assertEqual(row.id, self.task.pk)
+        self.assertEqual(row.deadline_display, "01.03.2026")
+        self.assertEqual(row.priority_display, "High")
+        self.assertEqual(row.status_display, "In Work")
+        self.assertTrue(row.is_urgent)
+
+    def test_worker_rows(self):
+        row = as_rows(get_user_model().objects.all(), WorkerRow).get()
+
+        self.assertEqual(row.username, "john_test")
+        self.assertEqual(row.position_display, "Dev")
+
+    def test_lists_select_only_listed_columns(self):
+        self.client.force_login(self.worker)
+        # The session's worker is loaded once and cached afterwards.
+        self.client.get(reverse("task-manager:index"))
+
+        with CaptureQueriesContext(connection) as queries:
+            tasks = self.client.get(reverse("task-manager:task-list"))
+            workers = self.client.get(reverse("task-manager:worker-list"))
+        sql = " ".join(query["sql"] for query in queries)
+
+        self.assertNotIn('"description"', sql)
+        self.assertNotIn('"password"', sql)
+        self.assertIsInstance(tasks.context["task_list"][0], TaskRow)
+        self.assertIsInstance(workers.context["worker_list"][0], WorkerRow)
+        self.assertContains(tasks, "01.03.2026")
@@ -0,0 +1,129 @@
+import datetime
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from task_manager import recurrence
+from task_manager.models import RecurringTask, Task, TaskChange, TaskType
+from task_manager.recurrence import add_months, materialize
+
+
+class RecurrenceTest(TestCase):
+
+    def setUp(self):
+        self.worker = get_user_model().objects.create_user(
+            username="john_test",
+            password="test123",
+        )
+        self.task_type = TaskType.objects.create(name="Ops")
+        self.now = timezone.now()
+        self.weekly = RecurringTask.objects.create(
+            name="On-call",
+            task_type=self.task_type,
+            priority=Task.LevelPriority.HIGH,
+            starts_at=self.now - datetime.timedelta(days=20),
+        )
+        self.weekly.assignees.add(self.worker)
+        RecurringTask.objects.create(
+            name="Paused",
+            task_type=self.task_type,
+            frequency=RecurringTask.Frequency.DAILY,
+            starts_at=self.now,
+            is_active=False,
+        )
+
+    def test_materialize_creates_upcoming_occurrences(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(materialize(days=14, now=self.now), 2)
+
+        tasks = Task.objects.order_by("deadline")
+        self.assertEqual(
+            [task.deadline for task in tasks],
+            [
+                self.weekly.starts_at + datetime.timedelta(days=21),
+                self.weekly.starts_at + datetime.timedelta(days=28),
+            ],
+        )
+        self.assertEqual(tasks[0].priority, Task.LevelPriority.HIGH)
+        self.assertEqual(list(tasks[0].assignees.all()), [self.worker])
+
+        self.worker.refresh_from_db()
+        self.task_type.refresh_from_db()
+        self.assertEqual(self.worker.open_task_count, 2)
+        self.assertEqual(self.task_type.open_task_count, 2)
+        self.assertEqual(
+            TaskChange.objects.filter(action="created").count(), 2
+        )
+
+    def test_reruns_are_idempotent(self):
+        materialize(days=14, now=self.now)
+        self.assertEqual(materialize(days=14, now=self.now), 0)
+
+        # A longer horizon only adds the new occurrences.
+        out = StringIO()
+        call_command("generate_recurring_tasks", days=21, stdout=out)
+        self.assertIn("Created 1 tasks", out.getvalue())
+        self.assertEqual(Task.objects.count(), 3)
+
+    def test_interrupted_run_is_not_duplicated(self):
+        materialize(days=14, now=self.now)
+        RecurringTask.objects.update(generated_until=None)
+
+        self.assertEqual(materialize(days=14, now=self.now), 0)
+
+    def test_monthly_rule_keeps_its_day(self):
+        value = datetime.datetime(2026, 1, 31, 9, tzinfo=datetime.UTC)
+
+        self.assertEqual(add_months(value, 1).day, 28)
+        self.assertEqual(add_months(value, 2).day, 31)
+        self.assertEqual(add_months(value, 11).year, 2026)
+        self.assertEqual(add_months(value, 12).year, 2027)
+
+    def test_occurrences_skip_the_template_history(self):
+        template = RecurringTask(
+            frequency=RecurringTask.Frequency.MONTHLY,
+            interval=1,
+            starts_at=datetime.datetime(2000, 1, 31, 9, tzinfo=datetime.UTC),
+            generated_until=datetime.datetime(
+                2026, 2, 28, 9, tzinfo=datetime.UTC
+            ),
+        )
+        until = datetime.datetime(2026, 5, 1, tzinfo=datetime.UTC)
+
+        with mock.patch.object(
+            recurrence, "nth_occurrence", wraps=recurrence.nth_occurrence
+        ) as nth_occurrence:
+            values = list(recurrence.occurrences(template, until))
+
+        self.assertEqual(
+            [value.date() for value in values],
+            [
+                datetime.date(2026, 3, 31),
+                datetime.date(2026, 4, 30),
+            ],
+        )
+        self.assertLess(nth_occurrence.call_count, 10)
+
+        # Same results as stepping through every occurrence from the start.
+        template.starts_at = template.starts_at.replace(year=2025)
+        now = datetime.datetime(2026, 4, 29, 12, tzinfo=datetime.UTC)
+        for frequency in RecurringTask.Frequency.values:
+            for interval in (1, 3):
+                template.frequency = frequency
+                template.interval = interval
+                template.generated_until = None
+                history = [
+                    recurrence.nth_occurrence(template, n)
+                    for n in range(1000)
+                ]
+                expected = [
+                    value for value in history if now <= value <= until
+                ]
+                self.assertEqual(
+                    list(recurrence.occurrences(template, until, now)),
+                    expected,
+                )
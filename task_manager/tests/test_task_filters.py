@@ -0,0 +1,103 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from task_manager.forms import TaskFilterForm
+from task_manager.models import Task, TaskType
+from task_manager.task_filters import (
+    ORDERINGS,
+    sample_filters,
+    unindexed_combinations,
+)
+
+TASK_URL = reverse("task-manager:task-list")
+
+
+class TaskFilterTest(TestCase):
+
+    def setUp(self):
+        self.worker = get_user_model().objects.create_user(
+            username="john_test",
+            password="test123",
+        )
+        self.client.force_login(self.worker)
+        bug = TaskType.objects.create(name="Bug")
+        feature = TaskType.objects.create(name="Feature")
+        now = timezone.now()
+
+        self.late = Task.objects.create(
+            name="Late",
+            task_type=bug,
+            deadline=now + timedelta(days=10),
+            priority=Task.LevelPriority.URGENT,
+        )
+        self.soon = Task.objects.create(
+            name="Soon",
+            task_type=feature,
+            deadline=now + timedelta(days=1),
+        )
+        self.done = Task.objects.create(
+            name="Done",
+            task_type=bug,
+            deadline=now - timedelta(days=5),
+            is_completed=True,
+        )
+        self.soon.assignees.add(self.worker)
+
+    def names(self, query=""):
+        response = self.client.get(TASK_URL + query + "&page=1")
+        tasks = response.context["paginator"].object_list
+        return [task.name for task in tasks]
+
+    def test_default_ordering_is_by_deadline(self):
+        self.assertEqual(self.names("?"), ["Done", "Soon", "Late"])
+        self.assertEqual(self.names("?sort=-name"), ["Soon", "Late", "Done"])
+
+    def test_filters(self):
+        self.assertEqual(self.names("?name=OO"), ["Soon"])
+        self.assertEqual(self.names("?status=open"), ["Soon", "Late"])
+        self.assertEqual(self.names("?status=done"), ["Done"])
+        self.assertEqual(self.names("?priority=UR"), ["Late"])
+        self.assertEqual(
+            self.names(f"?task_type={self.late.task_type_id}"),
+            ["Done", "Late"],
+        )
+        self.assertEqual(self.names(f"?assignee={self.worker.pk}"), ["Soon"])
+
+        tomorrow = (timezone.now() + timedelta(days=1)).date()
+        self.assertEqual(
+            self.names(
+                f"?deadline_after={tomorrow}&deadline_before={tomorrow}"
+            ),
+            ["Soon"],
+        )
+
+    def test_invalid_params_are_ignored(self):
+        self.assertEqual(
+            self.names("?status=open&sort=pk;drop&priority=XX"),
+            ["Soon", "Late"],
+        )
+
+    def test_pagination_keeps_filters(self):
+        response = self.client.get(TASK_URL + "?task_type=&sort=name")
+
+        self.assertContains(response, "?task_type=&amp;sort=name&amp;page=2")
+
+    def test_sort_choices_match_orderings(self):
+        self.assertEqual(
+            [value for value, _ in TaskFilterForm.SORT_CHOICES],
+            list(ORDERINGS),
+        )
+
+    def test_every_combination_uses_an_index(self):
+        self.assertIn("name", sample_filters())
+        self.assertEqual(unindexed_combinations(), [])
+
+        out = StringIO()
+        call_command("check_task_indexes", stdout=out)
+        self.assertIn("use an index", out.getvalue())
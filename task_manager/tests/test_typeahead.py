@@ -0,0 +1,83 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from task_manager import typeahead
+from task_manager.models import Task, TaskType
+
+
+class TypeaheadTest(TestCase):
+
+    def setUp(self):
+        typeahead.clear()
+        self.worker = get_user_model().objects.create_user(
+            username="john_test",
+            password="test123",
+            first_name="John",
+            last_name="Smith",
+        )
+        get_user_model().objects.create_user(
+            username="jane_test", first_name="Jane", last_name="Doe"
+        )
+        task_type = TaskType.objects.create(name="Bug")
+        for name in ("Fix login", "Fix logout", "Refactor login", "fix_me"):
+            Task.objects.create(name=name, task_type=task_type)
+
+    def names(self, prefix):
+        return [task["name"] for task in typeahead.search("tasks", prefix)]
+
+    def test_case_insensitive_prefix(self):
+        self.assertEqual(self.names("FIX LOG"), ["Fix login", "Fix logout"])
+        self.assertEqual(self.names("login"), [])
+        self.assertEqual(self.names("fix_"), ["fix_me"])
+        self.assertEqual(self.names("  "), [])
+
+    def test_workers_by_username_or_full_name(self):
+        by_username = typeahead.search("workers", "jo")
+        by_full_name = typeahead.search("workers", "john sm")
+
+        self.assertEqual(by_username, by_full_name)
+        self.assertEqual(by_username[0]["full_name"], "John Smith")
+        self.assertEqual(
+            by_username[0]["url"],
+            reverse("task-manager:worker-detail", args=[self.worker.pk]),
+        )
+
+    def test_hot_prefixes_are_cached_until_a_rename(self):
+        self.names("fix")
+        with self.assertNumQueries(0):
+            self.assertEqual(len(self.names("fix")), 3)
+
+        task = Task.objects.get(name="Fix logout")
+        task.description = "Unrelated"
+        task.save()
+        with self.assertNumQueries(0):
+            self.names("fix")
+
+        task.name = "Drop logout"
+        task.save()
+        self.assertEqual(self.names("fix"), ["Fix login", "fix_me"])
+
+    def test_api(self):
+        self.client.force_login(self.worker)
+        task = Task.objects.get(name="Refactor login")
+
+        response = self.client.get(
+            reverse("task-manager:typeahead-api"),
+            {"q": "ref", "kind": "tasks"},
+        )
+
+        self.assertEqual(
+            response.json(),
+            {
+                "tasks": [
+                    {
+                        "id": task.pk,
+                        "name": "Refactor login",
+                        "url": reverse(
+                            "task-manager:task-detail", args=[task.pk]
+                        ),
+                    }
+                ]
+            },
+        )
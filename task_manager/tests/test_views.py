@@ -305,6 +305,20 @@ class LoginTaskListTest(LoginMixin, TestCase):
         self.assertEqual(len(qs), 1)
         self.assertIn("Feature", name)
 
+    def test_partial_task_list(self):
+        response = self.client.get(
+            TASK_URL + "?name=Fix&page=2", headers={"X-Partial": "list"}
+        )
+
+        self.assertTemplateUsed(
+            response, "task_manager/includes/task_table.html"
+        )
+        self.assertTemplateNotUsed(response, "base.html")
+        self.assertNotIn("search_form", response.context)
+        self.assertContains(response, "Fix - 2")
+        self.assertContains(response, "page=3")
+        self.assertIn("X-Partial", response["Vary"])
+
     def test_toggle_assign_to_task(self):
 
         worker = Worker.objects.get(pk=self.worker.id)
@@ -457,6 +471,17 @@ class LoginWorkerListTest(LoginMixin, TestCase):
         self.assertEqual(len(qs), 1)
         self.assertIn("user1", usernames)
 
+    def test_partial_worker_list(self):
+        full = self.client.get(WORKER_URL)
+        response = self.client.get(WORKER_URL, headers={"X-Partial": "list"})
+
+        self.assertTemplateUsed(
+            response, "task_manager/includes/worker_table.html"
+        )
+        self.assertTemplateNotUsed(response, "base.html")
+        self.assertContains(response, "user0")
+        self.assertLess(len(response.content), len(full.content) / 2)
+
 
 class LogoutWorkerCDUTest(TestCase):
     def test_login_required(self):
@@ -0,0 +1,31 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.template import engines
+from django.test import SimpleTestCase
+
+from task_manager.warmup import template_names, warm_up
+
+
+class WarmUpTest(SimpleTestCase):
+
+    def test_templates_are_compiled(self):
+        names = set(template_names(engines["django"]))
+
+        self.assertIn("task_manager/task_list.html", names)
+        self.assertEqual(
+            warm_up(),
+            sum(
+                len(set(template_names(engine))) for engine in engines.all()
+            ),
+        )
+
+    def test_startup_benchmark(self):
+        out = StringIO()
+
+        call_command(
+            "startup_benchmark", "--profile", "dev", "--runs", "1", stdout=out
+        )
+
+        self.assertIn("dev:", out.getvalue())
+        self.assertIn("first request", out.getvalue())
@@ -0,0 +1,116 @@
+"""
+Search-as-you-type over task names and worker names.
+
+Prefixes are matched against lower-cased generated columns whose indexes use
+the ``varchar_pattern_ops`` operator class, so PostgreSQL answers
+``LIKE 'prefix%'`` with an index range scan. Results of hot prefixes are kept
+in a per-process LRU. Saves and deletes clear it in the process that made
+them; other processes pick changes up within ``TYPEAHEAD_CACHE_TTL``.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.db.models import Q
+from django.urls import reverse
+
+from task_manager.models import Task, Worker
+
+KINDS = ("tasks", "workers")
+
+
+class LRUCache:
+    def __init__(self, size, ttl):
+        self.size = size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def clear(self, kind=None):
+        with self._lock:
+            if kind is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == kind]:
+                del self._entries[key]
+
+
+_cache = LRUCache(settings.TYPEAHEAD_CACHE_SIZE, settings.TYPEAHEAD_CACHE_TTL)
+
+
+def normalize(prefix):
+    return " ".join(prefix.split()).lower()[:255]
+
+
+def detail_url_prefix(name):
+    """Reversed once per search; every result appends its pk."""
+    return reverse(name, kwargs={"pk": 0}).removesuffix("0/")
+
+
+def search_tasks(prefix, limit):
+    detail_url = detail_url_prefix("task-manager:task-detail")
+    return [
+        {"id": pk, "name": name, "url": f"{detail_url}{pk}/"}
+        for pk, name in Task.objects.filter(search_name__startswith=prefix)
+        .order_by("search_name")
+        .values_list("pk", "name")[:limit]
+    ]
+
+
+def search_workers(prefix, limit):
+    detail_url = detail_url_prefix("task-manager:worker-detail")
+    return [
+        {
+            "id": pk,
+            "username": username,
+            "full_name": f"{first_name} {last_name}".strip(),
+            "url": f"{detail_url}{pk}/",
+        }
+        for pk, username, first_name, last_name in Worker.objects.filter(
+            Q(search_username__startswith=prefix)
+            | Q(search_full_name__startswith=prefix),
+            is_active=True,
+        )
+        .order_by("search_username")
+        .values_list("pk", "username", "first_name", "last_name")[:limit]
+    ]
+
+
+SEARCHES = {"tasks": search_tasks, "workers": search_workers}
+
+
+def search(kind, prefix, limit=None):
+    limit = limit or settings.TYPEAHEAD_LIMIT
+    prefix = normalize(prefix)
+    if not prefix:
+        return []
+    key = (kind, prefix, limit)
+    results = _cache.get(key)
+    if results is None:
+        results = SEARCHES[kind](prefix, limit)
+        _cache.set(key, results)
+    return results
+
+
+def clear(kind=None):
+    _cache.clear(kind)
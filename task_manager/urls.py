@@ -16,10 +16,22 @@ from .views import (
     WorkerDeleteView,
     TaskUpdateView,
     TaskDeleteView,
+    TaskHistoryView,
+    NextTasksView,
+    TaskBoardView,
+    ArchivedTaskListView,
+    ArchivedTaskDetailView,
     TaskTypeUpdateView,
     TaskTypeDeleteView,
     PositionUpdateView,
     PositionDeleteView,
+    WorkloadReportView,
+    burndown,
+    next_tasks_api,
+    task_board_column,
+    task_calendar,
+    task_events,
+    typeahead_api,
     toggle_assign_to_task
 )
 
@@ -55,6 +67,30 @@ urlpatterns = [
         TaskDeleteView.as_view(),
         name="task-delete"
     ),
+    path(
+        "tasks/<int:pk>/history/",
+        TaskHistoryView.as_view(),
+        name="task-history"
+    ),
+    path("tasks/next/", NextTasksView.as_view(), name="next-tasks"),
+    path("tasks/board/", TaskBoardView.as_view(), name="task-board"),
+    path(
+        "tasks/board/column/",
+        task_board_column,
+        name="task-board-column"
+    ),
+    path("api/next-tasks/", next_tasks_api, name="next-tasks-api"),
+    path("api/typeahead/", typeahead_api, name="typeahead-api"),
+    path(
+        "tasks/archive/",
+        ArchivedTaskListView.as_view(),
+        name="archived-task-list"
+    ),
+    path(
+        "tasks/archive/<int:pk>/",
+        ArchivedTaskDetailView.as_view(),
+        name="archived-task-detail"
+    ),
     path(
         "task-types/",
         TaskTypeListView.as_view(),
@@ -95,6 +131,18 @@ urlpatterns = [
         PositionDeleteView.as_view(),
         name="position-delete"
     ),
+    path(
+        "analytics/workload/",
+        WorkloadReportView.as_view(),
+        name="workload-report"
+    ),
+    path("analytics/burndown/", burndown, name="burndown"),
+    path("events/tasks/", task_events, name="task-events"),
+    path(
+        "calendar/<str:token>.ics",
+        task_calendar,
+        name="task-calendar"
+    ),
     path(
         "positions/toggle_assing/<int:pk>",
         toggle_assign_to_task,
@@ -1,30 +1,107 @@
-import datetime
-
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import HttpResponseRedirect
+from django.db import transaction
+from django.http import (
+    Http404,
+    HttpResponse,
+    HttpResponseRedirect,
+    JsonResponse,
+    StreamingHttpResponse,
+)
 from django.shortcuts import render
 from django.urls import reverse_lazy
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
 from django.views import generic
+from django.views.decorators.http import require_safe
 
+from task_manager.analytics import burndown_series, workload_report
+
+from task_manager import (
+    assignment,
+    board,
+    dependencies,
+    events,
+    ical,
+    typeahead,
+)
+from task_manager.db_router import read_replica
+from task_manager.deletion import exclude_pending, schedule_deletion
+from task_manager.next_tasks import next_tasks
+from task_manager.read_models import TaskRow, WorkerRow, as_rows
+from task_manager.task_filters import filter_tasks
 from task_manager.forms import (
     WorkerCreationForm,
     TaskForm,
     WorkerPositionUpdateForm,
     WorkerSearchUsernameForm,
+    TaskFilterForm,
     TaskSearchNameForm,
 )
-from task_manager.models import Worker, Task, TaskType, Position
+from task_manager.models import (
+    ArchivedTask,
+    Position,
+    Task,
+    TaskChange,
+    TaskType,
+    Worker,
+    WorkloadRollup,
+)
+
+
+class BatchDeleteMixin:
+    def form_valid(self, form):
+        success_url = self.get_success_url()
+        schedule_deletion(self.object)
+        return HttpResponseRedirect(success_url)
+
+
+class PartialListMixin:
+    """
+    Render only ``partial_template_name``, the table and pagination, for
+    requests sent with an ``X-Partial`` header by static/js/partial_list.js.
+    """
+
+    partial_template_name = None
+
+    def is_partial(self):
+        return "X-Partial" in self.request.headers
+
+    def get_template_names(self):
+        if self.is_partial():
+            return [self.partial_template_name]
+        return super().get_template_names()
+
+    def render_to_response(self, context, **response_kwargs):
+        response = super().render_to_response(context, **response_kwargs)
+        patch_vary_headers(response, ("X-Partial",))
+        return response
+
+
+class PageEngineMixin:
+    """
+    Render with ``settings.PAGE_TEMPLATE_ENGINE``, the templates in
+    templates/ or their Jinja2 counterparts in jinja2/.
+    """
 
+    @property
+    def template_engine(self):
+        return settings.PAGE_TEMPLATE_ENGINE
 
+
+@read_replica
 @login_required
 def index(request):
 
     num_workers = Worker.objects.count()
     num_task = Task.objects.count()
     num_task_completed = Task.objects.filter(is_completed=True).count()
-    deadline_over = Task.objects.filter(deadline__lt=datetime.datetime.now())
+    deadline_over = Task.objects.filter(
+        is_completed=False, deadline__lt=timezone.now()
+    )
 
     context = {
         "num_workers": num_workers,
@@ -35,39 +112,75 @@ def index(request):
     return render(request, "task_manager/index.html", context=context)
 
 
-class WorkerListView(LoginRequiredMixin, generic.ListView):
+class WorkerListView(
+    LoginRequiredMixin, PageEngineMixin, PartialListMixin, generic.ListView
+):
+    use_read_replica = True
     paginate_by = 2
     model = Worker
+    partial_template_name = "task_manager/includes/worker_table.html"
 
     def get_context_data(
         self, *, object_list=None, **kwargs
     ):
         context = super(WorkerListView, self).get_context_data(**kwargs)
+        if self.is_partial():
+            return context
 
         username = self.request.GET.get("username", "")
 
         context["search_form"] = WorkerSearchUsernameForm(
-            initial={"username": username}
+            initial={
+                "username": username,
+                "sort": self.request.GET.get("sort", ""),
+                "max_open_tasks": self.request.GET.get("max_open_tasks", ""),
+            }
         )
         return context
 
+    orderings = {
+        "username": ("username",),
+        "workload": ("-open_task_count", "username"),
+        "idle": ("open_task_count", "username"),
+    }
+
     def get_queryset(self):
-        queryset = get_user_model().objects.all()
+        queryset = exclude_pending(get_user_model().objects.all())
         form = WorkerSearchUsernameForm(self.request.GET)
 
         if form.is_valid():
-            return queryset.filter(
+            queryset = queryset.filter(
                 username__icontains=form.cleaned_data["username"]
             )
-        return queryset
+            if form.cleaned_data["max_open_tasks"] is not None:
+                queryset = queryset.filter(
+                    open_task_count__lte=form.cleaned_data["max_open_tasks"]
+                )
+            queryset = queryset.order_by(
+                *self.orderings[form.cleaned_data["sort"] or "username"]
+            )
+        else:
+            queryset = queryset.order_by("username")
+        return as_rows(queryset, WorkerRow)
 
 
-class WorkerDetailView(LoginRequiredMixin, generic.DetailView):
+class WorkerDetailView(
+    LoginRequiredMixin, PageEngineMixin, generic.DetailView
+):
+    use_read_replica = True
     model = Worker
     queryset = Worker.objects.all().select_related(
         "position"
     ).prefetch_related("assigned_tasks")
 
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        if self.object.pk == self.request.user.pk:
+            context["calendar_url"] = self.request.build_absolute_uri(
+                ical.feed_url(self.object)
+            )
+        return context
+
 
 class WorkerCreateView(LoginRequiredMixin, generic.CreateView):
     model = Worker
@@ -79,43 +192,170 @@ class WorkerPositionUpdateView(LoginRequiredMixin, generic.UpdateView):
     form_class = WorkerPositionUpdateForm
 
 
-class WorkerDeleteView(LoginRequiredMixin, generic.DeleteView):
+class WorkerDeleteView(
+    LoginRequiredMixin, BatchDeleteMixin, generic.DeleteView
+):
     model = Worker
     success_url = reverse_lazy("task-manager:worker-list")
 
 
-class TaskListView(LoginRequiredMixin, generic.ListView):
+class TaskListView(
+    LoginRequiredMixin, PageEngineMixin, PartialListMixin, generic.ListView
+):
+    use_read_replica = True
     paginate_by = 2
     model = Task
     queryset = Task.objects.all()
+    partial_template_name = "task_manager/includes/task_table.html"
 
     def get_context_data(
         self, *, object_list=None, **kwargs
     ):
         context = super(TaskListView, self).get_context_data(**kwargs)
+        if self.is_partial():
+            return context
+
+        context["search_form"] = TaskFilterForm(
+            initial={
+                field: self.request.GET.get(field, "")
+                for field in TaskFilterForm.base_fields
+            }
+        )
+        context["task_events_url"] = events.stream_url(self.request)
+        return context
 
-        name = self.request.GET.get("name", "")
+    def get_queryset(self):
+        form = TaskFilterForm(self.request.GET)
 
-        context["search_form"] = TaskSearchNameForm(
-            initial={"name": name}
+        # Invalid parameters are dropped one by one instead of discarding
+        # the whole filter.
+        form.is_valid()
+        return as_rows(
+            filter_tasks(self.queryset, form.cleaned_data), TaskRow
         )
+
+
+def queue_limit(request):
+    try:
+        limit = int(request.GET.get("limit", settings.NEXT_TASKS_LIMIT))
+    except ValueError:
+        limit = settings.NEXT_TASKS_LIMIT
+    return min(max(limit, 1), settings.NEXT_TASKS_MAX_LIMIT)
+
+
+class NextTasksView(LoginRequiredMixin, generic.TemplateView):
+    use_read_replica = True
+    template_name = "task_manager/next_tasks.html"
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["tasks"] = next_tasks(
+            [self.request.user.pk], queue_limit(self.request)
+        ).get(self.request.user.pk, [])
+        for task in context["tasks"]:
+            task["priority_display"] = Task.LevelPriority(
+                task["priority"]
+            ).label
         return context
 
-    def get_queryset(self):
-        form = TaskSearchNameForm(self.request.GET)
 
-        if form.is_valid():
-            return self.queryset.filter(
-                name__icontains=form.cleaned_data["name"]
-            )
-        return self.queryset
+@read_replica
+@login_required
+def next_tasks_api(request):
+    # The queues of the requesting worker by default, never of everyone.
+    workers = [
+        int(worker)
+        for worker in request.GET.getlist("worker")
+        if worker.isdigit()
+    ][: settings.NEXT_TASKS_MAX_WORKERS] or [request.user.pk]
+    queues = next_tasks(workers, queue_limit(request))
+    return JsonResponse(
+        {
+            "workers": [
+                {"id": worker_id, "tasks": tasks}
+                for worker_id, tasks in queues.items()
+            ]
+        }
+    )
+
+
+@read_replica
+@login_required
+def typeahead_api(request):
+    kinds = [
+        kind for kind in request.GET.getlist("kind") if kind in typeahead.KINDS
+    ] or typeahead.KINDS
+    prefix = request.GET.get("q", "")
+    return JsonResponse(
+        {kind: typeahead.search(kind, prefix) for kind in kinds}
+    )
+
+
+def board_options(request):
+    group_by = request.GET.get("group")
+    if group_by not in board.GROUPINGS:
+        group_by = board.GROUPINGS[0]
+    scope = request.GET.get("scope")
+    if scope not in board.SCOPES:
+        scope = board.SCOPES[0]
+    worker = request.user if scope == "mine" else None
+    return group_by, scope, worker
+
+
+class TaskBoardView(LoginRequiredMixin, generic.TemplateView):
+    use_read_replica = True
+    template_name = "task_manager/task_board.html"
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        group_by, scope, worker = board_options(self.request)
+        context["group_by"] = group_by
+        context["scope"] = scope
+        context["columns"] = board.board_columns(group_by, worker)
+        return context
+
+
+@read_replica
+@login_required
+def task_board_column(request):
+    group_by, scope, worker = board_options(request)
+    key = request.GET.get("key", "")
+    if group_by == "status":
+        valid = key in Task.LevelPriority.values or key == board.DONE
+    else:
+        valid = key.isdigit()
+    if not valid:
+        raise Http404("Unknown board column")
+    try:
+        offset = max(int(request.GET.get("offset", 0)), 0)
+    except ValueError:
+        offset = 0
+
+    tasks = board.column_tasks(group_by, key, worker, offset)
+    response = render(
+        request,
+        "task_manager/includes/board_cards.html",
+        {"tasks": tasks},
+    )
+    response.headers["X-Board-Count"] = str(len(tasks))
+    return response
 
 
-class TaskDetailView(LoginRequiredMixin, generic.DetailView):
+class TaskDetailView(
+    LoginRequiredMixin, PageEngineMixin, generic.DetailView
+):
+    use_read_replica = True
     model = Task
     queryset = Task.objects.select_related(
         "task_type"
-    ).prefetch_related("assignees")
+    ).prefetch_related("assignees", "blocked_by")
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        if self.object.is_blocked:
+            context["critical_path"] = dependencies.critical_path(self.object)
+        context["task_events_url"] = events.stream_url(self.request)
+        return context
 
 
 class TaskCreateView(LoginRequiredMixin, generic.CreateView):
@@ -123,6 +363,22 @@ class TaskCreateView(LoginRequiredMixin, generic.CreateView):
     form_class = TaskForm
     success_url = reverse_lazy("task_manager:task-list")
 
+    def form_valid(self, form):
+        position = form.cleaned_data.get("auto_assign")
+        try:
+            # The position may empty between validation and assignment,
+            # the task is only kept together with its assignees.
+            with transaction.atomic():
+                response = super().form_valid(form)
+                if position is not None:
+                    assignment.auto_assign([self.object], position)
+        except assignment.NoEligibleWorkers:
+            self.object = None
+            form.instance.pk = None
+            form.add_error("auto_assign", "Nobody holds this position.")
+            return self.form_invalid(form)
+        return response
+
 
 class TaskUpdateView(LoginRequiredMixin, generic.UpdateView):
     model = Task
@@ -135,11 +391,70 @@ class TaskDeleteView(LoginRequiredMixin, generic.DeleteView):
     success_url = reverse_lazy("task_manager:task-list")
 
 
+class TaskHistoryView(LoginRequiredMixin, generic.ListView):
+    use_read_replica = True
+    paginate_by = 20
+    template_name = "task_manager/task_history.html"
+    context_object_name = "changes"
+
+    def get_queryset(self):
+        return TaskChange.objects.filter(
+            task_id=self.kwargs["pk"]
+        ).select_related("actor").order_by("-timestamp", "-pk")
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["task_id"] = self.kwargs["pk"]
+        context["task"] = Task.objects.filter(pk=self.kwargs["pk"]).first()
+        return context
+
+
+class ArchivedTaskListView(LoginRequiredMixin, generic.ListView):
+    use_read_replica = True
+    paginate_by = 10
+    model = ArchivedTask
+    queryset = ArchivedTask.objects.select_related("task_type").order_by(
+        "-completed_at", "-pk"
+    )
+
+    def get_context_data(
+        self, *, object_list=None, **kwargs
+    ):
+        context = super(ArchivedTaskListView, self).get_context_data(**kwargs)
+
+        name = self.request.GET.get("name", "")
+
+        context["search_form"] = TaskSearchNameForm(
+            initial={"name": name}
+        )
+        return context
+
+    def get_queryset(self):
+        form = TaskSearchNameForm(self.request.GET)
+
+        if form.is_valid():
+            return self.queryset.filter(
+                name__icontains=form.cleaned_data["name"]
+            )
+        return self.queryset
+
+
+class ArchivedTaskDetailView(LoginRequiredMixin, generic.DetailView):
+    use_read_replica = True
+    model = ArchivedTask
+    queryset = ArchivedTask.objects.select_related(
+        "task_type"
+    ).prefetch_related("assignees__position")
+
+
 class TaskTypeListView(LoginRequiredMixin, generic.ListView):
     model = TaskType
     template_name = "task_manager/task_type_list.html"
     context_object_name = "task_type_list"
 
+    def get_queryset(self):
+        return exclude_pending(super().get_queryset())
+
 
 class TaskTypeCreateView(LoginRequiredMixin, generic.CreateView):
     model = TaskType
@@ -155,7 +470,9 @@ class TaskTypeUpdateView(LoginRequiredMixin, generic.UpdateView):
     success_url = reverse_lazy("task-manager:task-type-list")
 
 
-class TaskTypeDeleteView(LoginRequiredMixin, generic.DeleteView):
+class TaskTypeDeleteView(
+    LoginRequiredMixin, BatchDeleteMixin, generic.DeleteView
+):
     model = TaskType
     template_name = "task_manager/task_type_confirm_delete.html"
     success_url = reverse_lazy("task-manager:task-type-list")
@@ -164,6 +481,9 @@ class TaskTypeDeleteView(LoginRequiredMixin, generic.DeleteView):
 class PositionListView(LoginRequiredMixin, generic.ListView):
     model = Position
 
+    def get_queryset(self):
+        return exclude_pending(super().get_queryset())
+
 
 class PositionCreateView(LoginRequiredMixin, generic.CreateView):
     model = Position
@@ -177,17 +497,97 @@ class PositionUpdateView(LoginRequiredMixin, generic.UpdateView):
     success_url = reverse_lazy("task-manager:position-list")
 
 
-class PositionDeleteView(LoginRequiredMixin, generic.DeleteView):
+class PositionDeleteView(
+    LoginRequiredMixin, BatchDeleteMixin, generic.DeleteView
+):
     model = Position
     success_url = reverse_lazy("task-manager:position-list")
 
 
+class WorkloadReportView(LoginRequiredMixin, generic.TemplateView):
+    use_read_replica = True
+    template_name = "task_manager/workload_report.html"
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["sections"] = workload_report()
+        context["refreshed_at"] = WorkloadRollup.objects.order_by(
+            "-refreshed_at"
+        ).values_list("refreshed_at", flat=True).first()
+        return context
+
+
+@read_replica
+@login_required
+def burndown(request):
+    try:
+        days = int(request.GET.get("days", 30))
+    except ValueError:
+        days = 30
+    days = min(max(days, 1), 366)
+    task_type = request.GET.get("task_type") or None
+    if task_type is not None and not task_type.isdigit():
+        task_type = None
+
+    return JsonResponse(
+        {
+            "days": burndown_series(
+                days,
+                task_type=task_type,
+                priority=request.GET.get("priority"),
+            )
+        }
+    )
+
+
+@read_replica
+@require_safe
+def task_calendar(request, token):
+    """Tokenized iCalendar feed; calendar apps cannot log in."""
+    worker_id = ical.worker_id(token)
+    state = ical.feed_state(worker_id) if worker_id is not None else None
+    if state is None:
+        raise Http404("No such calendar feed.")
+    version, last_modified = state
+    etag = ical.etag(worker_id, version)
+    timestamp = int(last_modified.timestamp())
+
+    response = get_conditional_response(
+        request, etag=etag, last_modified=timestamp
+    )
+    if response is None:
+        response = StreamingHttpResponse(
+            ical.stream(
+                worker_id,
+                last_modified,
+                request.build_absolute_uri("/").rstrip("/"),
+            ),
+            content_type="text/calendar; charset=utf-8",
+        )
+    response.headers.setdefault("ETag", etag)
+    response.headers.setdefault("Last-Modified", http_date(timestamp))
+    response.headers["Cache-Control"] = (
+        f"private, max-age={settings.CALENDAR_FEED_MAX_AGE}"
+    )
+    return response
+
+
+@login_required
+async def task_events(request):
+    if not events.is_streamable(request):
+        return HttpResponse(status=204)
+    events.ensure_listener()
+    return StreamingHttpResponse(
+        events.stream(),
+        content_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @login_required
 def toggle_assign_to_task(request, pk):
-    worker = Worker.objects.get(id=request.user.id)
-    if (
-        Task.objects.get(id=pk) in worker.assigned_tasks.all()
-    ):
+    worker = request.user
+    if worker.assigned_tasks.filter(pk=pk).exists():
         worker.assigned_tasks.remove(pk)
     else:
         worker.assigned_tasks.add(pk)
@@ -0,0 +1,47 @@
+"""
+Process warm-up for preloading servers.
+
+``warm_up()`` does the work every worker would otherwise repeat on its first
+requests: importing the URLconf and views, compiling every template and
+loading translations. Run it in the master process before forking (see
+``gunicorn.conf.py``) and freeze the resulting objects with ``gc.freeze()``
+so the workers share those pages copy-on-write. It never opens a database
+connection, which must not be shared with forked workers.
+"""
+import gc
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth.hashers import get_hashers
+from django.template import engines
+from django.urls import get_resolver
+from django.utils import translation
+
+
+def template_names(engine):
+    for directory in engine.template_dirs:
+        directory = Path(directory)
+        for path in directory.rglob("*.html"):
+            yield path.relative_to(directory).as_posix()
+
+
+def warm_up():
+    resolver = get_resolver()
+    resolver.url_patterns
+    resolver.reverse_dict
+
+    compiled = 0
+    for engine in engines.all():
+        for name in set(template_names(engine)):
+            engine.get_template(name)
+            compiled += 1
+
+    translation.activate(settings.LANGUAGE_CODE)
+    translation.deactivate()
+    get_hashers()
+    return compiled
+
+
+def freeze():
+    gc.collect()
+    gc.freeze()